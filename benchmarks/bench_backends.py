@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark de los backends de evaluación.
+
+Para cada expresión y cantidad de puntos mide cada backend disponible y
+muestra cuál elige el selector automático (ver domain.backends).
+
+Uso:
+    python benchmarks/bench_backends.py
+    python benchmarks/bench_backends.py --puntos 1 1000 100000 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from domain.backends import BackendNoAplica, backends_disponibles, compilar
+from domain.parser import parse_function
+
+
+EXPRESIONES = [
+    "x^3 - 2x + 1",
+    "1/(x - 1)",
+    "sin(x)*exp(-x^2/10) + log(x^2 + 1)*cos(3x) - sqrt(abs(x))",
+    "tanh(x/3) + atan(x)^2 - exp(sin(x))/(2 + cos(x))",
+]
+
+
+def medir(f, xs, repeticiones=3):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        f(xs)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de backends de evaluación")
+    parser.add_argument("--puntos", type=int, nargs="+", default=[1, 1_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    nombres = backends_disponibles()
+    print(f"Backends disponibles: {', '.join(nombres)}")
+    for expr_str in EXPRESIONES:
+        resultado = parse_function(expr_str, allowed_vars=['x'])
+        simbolos = resultado._symbols()
+        auto = resultado.to_backend("auto")
+        print(f"\nf(x) = {expr_str}")
+        print(f"{'puntos':>10} " + " ".join(f"{n:>10}" for n in nombres) + "   elegido")
+        for puntos in args.puntos:
+            xs = np.linspace(-5, 5, puntos) if puntos > 1 else np.float64(0.5)
+            tiempos = []
+            for nombre in nombres:
+                try:
+                    f = compilar(resultado.expr, simbolos, nombre)
+                    tiempos.append(f"{medir(f, xs) * 1e3:9.3f}ms")
+                except BackendNoAplica:
+                    tiempos.append(f"{'-':>11}")
+            auto(xs)
+            print(f"{puntos:>10} " + "".join(tiempos) + f"   {auto.ultimo_backend}")
+
+
+if __name__ == "__main__":
+    main()
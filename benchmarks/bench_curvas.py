@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark de curvas paramétricas e implícitas.
+
+Mide el muestreo adaptativo de curvas paramétricas y la extracción del
+contorno de curvas implícitas (evaluación por franjas + marching squares),
+con la función ya compilada, y compara cada tiempo con su meta. Sale con
+código 1 si alguna medición no cumple la meta.
+
+Uso:
+    python benchmarks/bench_curvas.py
+    python benchmarks/bench_curvas.py --resoluciones 400 1000 2000
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from graphics.curvas import (_funcion_de, contorno_implicito, muestrear_parametrica, parse_implicita,
+                             parse_parametrica)
+
+
+PARAMETRICAS = [
+    # (x(t), y(t), rango de t)
+    ("cos(t)", "sin(t)", (0, 2 * math.pi)),
+    ("cos(t)^3", "sin(t)^3", (0, 2 * math.pi)),
+    ("sin(3t)", "sin(4t)", (0, 2 * math.pi)),
+    ("t*cos(t)", "t*sin(t)", (0, 20 * math.pi)),
+    ("t", "tan(t)", (-5, 5)),
+]
+
+IMPLICITAS = [
+    "x^2 + y^2 = 25",
+    "x^2/16 - y^2/4 = 1",
+    "y^2 = x^3 - 4x + 1",
+    "sin(x) = cos(y)",
+    "y = 1/x",
+]
+
+# metas (segundos), con la función ya compilada
+META_PARAMETRICA = 0.01
+# por millón de celdas de la grilla
+META_IMPLICITA = 0.25
+
+
+def medir(funcion, repeticiones):
+    mejor = float("inf")
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def bench_parametricas(repeticiones):
+    print("Curvas paramétricas (refinamiento adaptativo)")
+    print(f"{'curva':32s} {'puntos':>8s} {'tramos':>7s} {'tiempo':>9s} {'meta':>8s}")
+    cumple = True
+    for texto_x, texto_y, rango_t in PARAMETRICAS:
+        parse_x, parse_y = parse_parametrica(texto_x, texto_y)
+        fx = _funcion_de(parse_x, ["t"])
+        fy = _funcion_de(parse_y, ["t"])
+        # la primera llamada compila y elige el backend; no entra en la medición
+        muestrear_parametrica(fx, fy, rango_t)
+        tiempo, curva = medir(lambda: muestrear_parametrica(fx, fy, rango_t), repeticiones)
+        ok = tiempo <= META_PARAMETRICA
+        cumple &= ok
+        nombre = f"({texto_x}, {texto_y})"
+        print(f"{nombre:32s} {len(curva):8d} {curva.cantidad_segmentos:7d} {tiempo * 1e3:7.1f}ms "
+              f"{META_PARAMETRICA * 1e3:6.0f}ms {'ok' if ok else 'LENTO'}")
+    return cumple
+
+
+def bench_implicitas(resoluciones, rango, repeticiones):
+    print(f"\nCurvas implícitas en [{rango[0]}, {rango[1]}]^2 (franjas + marching squares)")
+    print(f"{'ecuacion':24s} {'celdas':>10s} {'trozos':>8s} {'tiempo':>9s} {'meta':>8s}")
+    cumple = True
+    for texto in IMPLICITAS:
+        F = _funcion_de(parse_implicita(texto), ["x", "y"])
+        for resolucion in resoluciones:
+            contorno_implicito(F, rango, rango, resolucion)
+            tiempo, trozos = medir(lambda: contorno_implicito(F, rango, rango, resolucion), repeticiones)
+            meta = META_IMPLICITA * max(resolucion ** 2 / 1e6, 0.1)
+            ok = tiempo <= meta
+            cumple &= ok
+            print(f"{texto:24s} {resolucion ** 2:10d} {len(trozos):8d} {tiempo * 1e3:7.1f}ms "
+                  f"{meta * 1e3:6.0f}ms {'ok' if ok else 'LENTO'}")
+    return cumple
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de curvas paramétricas e implícitas")
+    parser.add_argument("--resoluciones", type=int, nargs="+", default=[400, 1000, 2000])
+    parser.add_argument("--rango", type=float, default=10.0)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    cumple = bench_parametricas(args.repeticiones)
+    cumple &= bench_implicitas(args.resoluciones, (-args.rango, args.rango), args.repeticiones)
+    sys.exit(0 if cumple else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmarks de muestreo.
+
+Compara el muestreo en un núcleo (muestrear) contra el muestreo en paralelo
+(muestrear_paralelo) para expresiones caras, y reporta tiempos y speedup.
+
+Uso:
+    python benchmarks/bench_muestreo.py
+    python benchmarks/bench_muestreo.py --procesos 8 --puntos 2000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from domain.parser import parse_function
+from graphics.muestreo import muestrear, muestrear_paralelo
+
+
+CASOS = [
+    # (expresion, rango, precision, factor de puntos)
+    ("exp(sin(x)) * log(2 + cos(3*x)) + atan(exp(-x**2))", (-20, 20), "float64", 1.0),
+    ("sin(exp(cos(x))) + sqrt(1 + log(1 + x**2))", (-50, 50), "float64", 1.0),
+    ("exp(x) - 1 - x", (-1e-3, 1e-3), "auto", 0.05),
+    ("sin(x) / x", (-10, 10), "mpmath", 0.002),
+]
+
+
+def medir(funcion, repeticiones):
+    mejor = float("inf")
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def bench_paralelo(puntos, procesos, repeticiones):
+    print(f"Muestreo serie vs paralelo ({procesos} procesos)")
+    print(f"{'expresion':55s} {'precision':9s} {'puntos':>9s} {'serie':>9s} {'paralelo':>9s} {'speedup':>8s}")
+    for expr, rango, precision, factor in CASOS:
+        parse_result = parse_function(expr, allowed_vars=['x'])
+        n = max(1000, int(puntos * factor))
+        funcion = parse_result.to_vectorized(precision)
+
+        t_serie, serie = medir(lambda: muestrear(funcion, rango, puntos=n), repeticiones)
+        t_par, paralelo = medir(
+            lambda: muestrear_paralelo(parse_result, rango, puntos=n, procesos=procesos, precision=precision),
+            repeticiones,
+        )
+        if not np.array_equal(serie.y, paralelo.y, equal_nan=True):
+            print(f"  ADVERTENCIA: resultados distintos para {expr}")
+        print(f"{expr:55s} {precision:9s} {n + 1:9d} {t_serie:8.3f}s {t_par:8.3f}s {t_serie / t_par:7.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de muestreo")
+    parser.add_argument("--puntos", type=int, default=1_000_000)
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    bench_paralelo(args.puntos, args.procesos, args.repeticiones)
+
+
+if __name__ == "__main__":
+    main()
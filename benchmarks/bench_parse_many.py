@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark de parse_many.
+
+Arma un lote de expresiones variadas (con repetidas y algunas patológicas) y
+compara parse_function en un bucle contra parse_many con un pool de procesos.
+
+Uso:
+    python benchmarks/bench_parse_many.py
+    python benchmarks/bench_parse_many.py --cantidad 5000 --procesos 8
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from domain.parser import parse_function, parse_many, limpiar_cache_parse
+
+
+PLANTILLAS = [
+    "{a}*x^2 + {b}*x - {c}",
+    "({a}x - {b})/(x^2 + {c})",
+    "sin({a}x) + cos(x/{b}) - {c}",
+    "exp(-x^2/{a}) * log(x + {b})",
+    "sqrt(x^2 + {a}) / ({b} + abs(x - {c}))",
+    "tan(x)^2 + {a}/(x - {b})",
+    "(x + {a})^3 - {b}x^2 + {c}",
+]
+
+PATOLOGICAS = [
+    "sin(x",                                   # paréntesis sin cerrar
+    "x + y",                                   # variable no permitida
+    "+".join(f"sin({k}x)^{k}" for k in range(1, 60)),  # simplificación cara
+]
+
+
+def generar_lote(cantidad, semilla=0):
+    azar = random.Random(semilla)
+    lote = []
+    for _ in range(cantidad):
+        plantilla = azar.choice(PLANTILLAS)
+        # valores chicos para que haya repetidas, como en entregas de alumnos
+        lote.append(plantilla.format(a=azar.randint(1, 9), b=azar.randint(1, 9), c=azar.randint(1, 9)))
+    for i, mala in enumerate(PATOLOGICAS):
+        lote.insert((i + 1) * len(lote) // (len(PATOLOGICAS) + 1), mala)
+    return lote
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de parse_many")
+    parser.add_argument("--cantidad", type=int, default=1000)
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--timeout", type=float, default=2.0)
+    parser.add_argument("--estrategia", default="auto")
+    args = parser.parse_args()
+
+    lote = generar_lote(args.cantidad)
+    print(f"{len(lote)} expresiones, estrategia={args.estrategia}, procesos={args.procesos}")
+
+    limpiar_cache_parse()
+    inicio = time.perf_counter()
+    for expr in lote[:200]:
+        if expr not in PATOLOGICAS:
+            parse_function(expr, allowed_vars=['x'], simplify_strategy=args.estrategia)
+    bucle = time.perf_counter() - inicio
+    print(f"bucle (200 sin patológicas): {200 / bucle:8.1f} expr/s")
+
+    limpiar_cache_parse()
+    resultado = parse_many(lote, allowed_vars=['x'], simplify_strategy=args.estrategia,
+                           procesos=args.procesos, timeout=args.timeout)
+    est = resultado.estadisticas
+    print(f"parse_many:                  {est['por_segundo']:8.1f} expr/s  ({est['segundos']:.2f} s)")
+    print(f"  únicas={est['unicas']} válidas={est['validas']} errores={est['errores']} "
+          f"tiempos agotados={est['tiempos_agotados']}")
+
+    resultado = parse_many(lote, allowed_vars=['x'], simplify_strategy=args.estrategia,
+                           procesos=args.procesos, timeout=args.timeout)
+    est = resultado.estadisticas
+    print(f"parse_many (caché caliente): {est['por_segundo']:8.1f} expr/s  desde caché={est['desde_cache']}")
+
+
+if __name__ == "__main__":
+    main()
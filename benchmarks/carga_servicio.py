@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga del servicio local (src/service/servidor.py).
+
+Lanza clientes concurrentes que envían pedidos JSON-RPC y reporta
+throughput, latencias (p50, p99, máx) y cuántos pedidos fueron rechazados
+por la cola llena (503) o por tiempo agotado.
+
+Uso:
+    python benchmarks/carga_servicio.py --clientes 16 --pedidos 50
+    python benchmarks/carga_servicio.py --url http://127.0.0.1:8765   (servidor ya corriendo)
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+PEDIDOS = [
+    ("parse", {"expr": "x**2 - 4*x + 3", "simplify": True}),
+    ("evaluate", {"expr": "sin(x) + x^2", "valores": {"x": 1.5}}),
+    ("evaluate_batch", {"expr": "exp(-x^2)", "xs": [i / 10 for i in range(-50, 51)]}),
+    ("analyze", {"expr": "(x^2 - 1)/(x - 2)"}),
+    ("render_png", {"expr": "1/(x-2)", "rango_x": [-5, 5], "ancho": 400, "alto": 300}),
+]
+
+
+def enviar(url, metodo, params, id_pedido):
+    cuerpo = json.dumps({"jsonrpc": "2.0", "id": id_pedido, "method": metodo, "params": params}).encode()
+    pedido = urllib.request.Request(url, data=cuerpo, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(pedido, timeout=60) as r:
+            respuesta = json.loads(r.read())
+    except urllib.error.HTTPError as e:
+        return e.code, None
+    error = respuesta.get("error")
+    return 200, error["code"] if error else None
+
+
+def percentil(valores, p):
+    if not valores:
+        return float("nan")
+    ordenados = sorted(valores)
+    k = min(len(ordenados) - 1, max(0, int(round(p / 100 * len(ordenados))) - 1))
+    return ordenados[k]
+
+
+def correr_carga(url, clientes, pedidos_por_cliente, metodos=None):
+    seleccion = [p for p in PEDIDOS if metodos is None or p[0] in metodos]
+    contador = itertools.count()
+    lock = threading.Lock()
+    latencias = []
+    rechazados = 0
+    errores = 0
+
+    def cliente(_):
+        nonlocal rechazados, errores
+        for _ in range(pedidos_por_cliente):
+            n = next(contador)
+            metodo, params = seleccion[n % len(seleccion)]
+            inicio = time.perf_counter()
+            estado, codigo_error = enviar(url, metodo, params, n)
+            duracion = time.perf_counter() - inicio
+            with lock:
+                if estado == 503:
+                    rechazados += 1
+                elif estado != 200 or codigo_error is not None:
+                    errores += 1
+                else:
+                    latencias.append(duracion)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clientes) as ejecutor:
+        list(ejecutor.map(cliente, range(clientes)))
+    total = time.perf_counter() - inicio
+
+    return {
+        "ok": len(latencias),
+        "rechazados": rechazados,
+        "errores": errores,
+        "segundos": total,
+        "throughput": len(latencias) / total if total else 0.0,
+        "p50_ms": percentil(latencias, 50) * 1000,
+        "p99_ms": percentil(latencias, 99) * 1000,
+        "max_ms": max(latencias) * 1000 if latencias else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga del servicio de análisis")
+    parser.add_argument("--url", default=None, help="servidor ya corriendo; si no se da, se levanta uno")
+    parser.add_argument("--clientes", type=int, default=8)
+    parser.add_argument("--pedidos", type=int, default=25, help="pedidos por cliente")
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument("--cola", type=int, default=32)
+    parser.add_argument("--metodos", nargs="*", default=None, help="limitar a estos métodos")
+    args = parser.parse_args()
+
+    servidor = None
+    url = args.url
+    if url is None:
+        from service.servidor import crear_servidor
+
+        servidor = crear_servidor(puerto=0, procesos=args.procesos, cola=args.cola)
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{servidor.server_address[1]}"
+        # calentar los workers (imports de sympy/matplotlib)
+        correr_carga(url, servidor.servicio.procesos, 1)
+
+    try:
+        r = correr_carga(url, args.clientes, args.pedidos, args.metodos)
+    finally:
+        if servidor is not None:
+            servidor.shutdown()
+            servidor.servicio.cerrar()
+
+    print(f"Pedidos OK:      {r['ok']}  (rechazados 503: {r['rechazados']}, errores: {r['errores']})")
+    print(f"Tiempo total:    {r['segundos']:.2f} s")
+    print(f"Throughput:      {r['throughput']:.1f} pedidos/s")
+    print(f"Latencia p50:    {r['p50_ms']:.1f} ms")
+    print(f"Latencia p99:    {r['p99_ms']:.1f} ms")
+    print(f"Latencia máx:    {r['max_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,71 @@
+import os
+import sys
+
+import numpy as np
 import sympy as sp
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.asintotas import asintotas
+from domain.coalescencia import vuelo
+from domain.derivadas import derivada, derivada_vectorizada
+from domain.dominio import dominio_funcion
+from domain.polinomios import detectar_racional
+from domain.tiempo import limite_de_tiempo, TiempoAgotado
+
 
 x = sp.Symbol('x')
 
+# segundos para cada solveset de los puntos críticos
+PRESUPUESTO = 2.0
+
+
+def _resolver_reales(expr, presupuesto=PRESUPUESTO):
+    """Soluciones reales de expr = 0 ordenadas, o None si no son finitas o se acabó el tiempo."""
+    try:
+        with limite_de_tiempo(presupuesto):
+            conjunto = sp.solveset(expr, x, sp.S.Reals)
+    except (TiempoAgotado, NotImplementedError, ValueError, TypeError):
+        return None
+    if conjunto.is_empty:
+        return []
+    if not isinstance(conjunto, sp.FiniteSet):
+        # ej: sin(1/x) tiene infinitos puntos críticos, o un ConditionSet que sympy no resolvió
+        return None
+    return sorted(conjunto, key=lambda c: float(c.evalf()))
+
+
+def _bordes(dom, presupuesto=PRESUPUESTO):
+    """Puntos donde empieza o termina el dominio, o None si no son finitos."""
+    if dom == sp.S.Reals:
+        return []
+    try:
+        with limite_de_tiempo(presupuesto):
+            borde = dom.boundary
+    except (TiempoAgotado, NotImplementedError, ValueError, TypeError):
+        return None
+    if borde.is_empty:
+        return []
+    if not isinstance(borde, sp.FiniteSet):
+        return None
+    return [b for b in borde if b.is_finite]
+
 class AnalisisFuncion:
     def __init__(self, funcion):
         self.f = funcion
+        # polinomios y racionales van por el camino rapido (domain/polinomios.py)
+        self.racional = detectar_racional(funcion)
+
 
 
+    def _dominio(self):
+        if self.racional is not None:
+            return self.racional.dominio()
+        # si otro hilo ya esta calculando el mismo dominio, se espera su resultado
+        return vuelo("dominio").ejecutar(self.f, lambda: dominio_funcion(self.f))
 
     def dominio(self):
         try:
-            dom = sp.calculus.util.continuous_domain(self.f, x, sp.S.Reals)
+            dom = self._dominio()
             explicacion = f"Para calcular el dominio veo los valores que no sirven (divisiones por 0, etc)."
             return f"{explicacion}\nDominio: {dom}"
         except Exception as e:
@@ -44,8 +98,11 @@ class AnalisisFuncion:
         salida = "Intersecciones:\n"
         
         try:
-            ceros = sp.solve(self.f, x)
-            reales = [c for c in ceros if c.is_real]
+            if self.racional is not None:
+                reales = self.racional.ceros()
+            else:
+                ceros = vuelo("intersecciones").ejecutar(self.f, lambda: sp.solve(self.f, x))
+                reales = [c for c in ceros if c.is_real]
             salida += f"Con eje X: resolviendo f(x)=0 salen {reales}\n"
         except Exception as e:
             salida += f"No pude calcular intersecciones con X. Error: {e}\n"
@@ -61,6 +118,133 @@ class AnalisisFuncion:
 
 
 
+    def derivadas(self):
+        try:
+            d1 = derivada(self.f, 1)
+            d2 = derivada(self.f, 2)
+            return f"Derivadas:\nf'(x) = {d1}\nf''(x) = {d2}"
+        except Exception as e:
+            return f"No pude derivar la función. Error: {e}"
+
+
+
+    def _ceros_derivada(self):
+        """Ceros reales de f' dentro del dominio, o None si no son finitos o no se pudieron calcular."""
+        ceros = _resolver_reales(derivada(self.f, 1))
+        if ceros is None:
+            return None
+        dom = self._dominio()
+        return [c for c in ceros if dom.contains(c) is sp.true]
+
+    def _puntos_criticos(self):
+        # donde f'(x) = 0, donde f' no existe (denominador 0) y los bordes del dominio;
+        # None si alguno de esos conjuntos no es finito
+        d1 = derivada(self.f, 1)
+        grupos = [_resolver_reales(d1), _resolver_reales(sp.denom(sp.together(d1))), _bordes(self._dominio())]
+        if any(g is None for g in grupos):
+            return None
+        puntos = {}
+        for c in grupos[0] + grupos[1] + grupos[2]:
+            if c.is_real:
+                puntos.setdefault(float(c.evalf()), c)
+        return [puntos[k] for k in sorted(puntos)]
+
+
+
+    def monotonia(self):
+        salida = "Monotonía (signo de f'(x) entre puntos críticos):\n"
+        try:
+            criticos = self._puntos_criticos()
+            if criticos is None:
+                return salida + "no determinado (los puntos críticos no son finitos o no se pudieron calcular)\n"
+            dom = self._dominio()
+            fp = derivada_vectorizada(self.f, 1)
+            # pruebo el signo de f' al medio de cada tramo entre puntos criticos;
+            # los bordes del dominio son puntos criticos, asi cada tramo esta entero dentro o fuera
+            bordes = [-sp.oo] + criticos + [sp.oo]
+            crece = []
+            decrece = []
+            for a, b in zip(bordes[:-1], bordes[1:]):
+                if a == -sp.oo and b == sp.oo:
+                    prueba = 0.0
+                elif a == -sp.oo:
+                    prueba = float(b) - 1
+                elif b == sp.oo:
+                    prueba = float(a) + 1
+                else:
+                    prueba = (float(a) + float(b)) / 2
+                if dom.contains(sp.Float(prueba)) is not sp.true:
+                    continue
+                signo = float(fp(prueba))
+                tramo = sp.Interval.open(a, b)
+                if signo > 0:
+                    crece.append(tramo)
+                elif signo < 0:
+                    decrece.append(tramo)
+            salida += f"Crece en: {sp.Union(*crece) if crece else 'ningún intervalo'}\n"
+            salida += f"Decrece en: {sp.Union(*decrece) if decrece else 'ningún intervalo'}\n"
+            return salida
+        except Exception as e:
+            return f"No pude calcular la monotonía. Error: {e}"
+
+
+
+    def extremos(self):
+        salida = "Extremos (criterio de la segunda derivada):\n"
+        try:
+            f = derivada_vectorizada(self.f, 0)
+            fpp = derivada_vectorizada(self.f, 2)
+            ceros_fp = self._ceros_derivada()
+            if ceros_fp is None:
+                return salida + "no determinado (los ceros de f'(x) no son finitos o no se pudieron calcular)\n"
+            if not ceros_fp:
+                return salida + "No hay puntos donde f'(x) = 0\n"
+            for c in ceros_fp:
+                xc = float(c.evalf())
+                yc = float(f(xc))
+                curvatura = float(fpp(xc))
+                if np.isnan(yc):
+                    continue
+                if curvatura > 0:
+                    salida += f"Mínimo local en ({c}, {yc:.6g})\n"
+                elif curvatura < 0:
+                    salida += f"Máximo local en ({c}, {yc:.6g})\n"
+                else:
+                    salida += f"En x = {c} f''(x) = 0, no se puede decidir\n"
+            return salida
+        except Exception as e:
+            return salida + f"No pude calcular extremos. Error: {e}\n"
+
+
+
+    def asintotas(self):
+        salida = "Asíntotas:\n"
+        try:
+            resultado = asintotas(self.f)
+        except Exception as e:
+            return salida + f"No pude calcular asíntotas. Error: {e}\n"
+
+        # verticales: donde algun limite lateral es infinito
+        if resultado.verticales is None:
+            salida += "Verticales: no pude calcular las singularidades\n"
+        elif resultado.verticales.is_empty:
+            salida += "Verticales: no tiene\n"
+        else:
+            salida += f"Verticales: x ∈ {resultado.verticales}\n"
+
+        # horizontales u oblicuas: limites en +oo y -oo
+        for nombre, asintota in (("+∞", resultado.mas_infinito), ("-∞", resultado.menos_infinito)):
+            if asintota is None:
+                salida += f"En {nombre}: no tiene (o no pude calcular el límite)\n"
+            elif asintota[0] == "horizontal":
+                salida += f"En {nombre}: horizontal y = {asintota[1]}\n"
+            else:
+                _, m, b = asintota
+                salida += f"En {nombre}: oblicua y = {sp.expand(m * x + b)}\n"
+        return salida
+
+
+
 
 
 #prueba 
@@ -74,3 +258,8 @@ if __name__ == "__main__":
     print(analisis.recorrido())
     print("----")
     print(analisis.intersecciones())
+    print("----")
+    print(analisis.derivadas())
+    print(analisis.monotonia())
+    print(analisis.extremos())
+    print(analisis.asintotas())
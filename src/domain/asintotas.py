@@ -0,0 +1,288 @@
+"""
+Asíntotas verticales, horizontales y oblicuas.
+
+- Verticales: los candidatos son las singularidades de f (sympy.singularities,
+  que para funciones periódicas entrega conjuntos infinitos como los de tan).
+  Un candidato es asíntota si algún límite lateral es infinito; los demás son
+  huecos (ej: sin(x)/x en 0).
+- Horizontales y oblicuas: límites en +∞ y -∞. Si f tiende a L es horizontal;
+  si no, se prueba m = lim f(x)/x y b = lim f(x) - m*x.
+
+Cada límite corre con un límite de tiempo y lo que no termina se da por
+desconocido. Para polinomios y racionales no se calculan límites: todo sale
+de los polos y de la división de polinomios. Los resultados quedan en caché
+por expresión, salvo los que quedaron incompletos porque algo se quedó sin
+tiempo (puede ser el límite de afuera, ej: el de un pedido del servicio):
+esos se vuelven a calcular la próxima vez.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+import math
+import os
+import sys
+from typing import List, Optional
+
+import sympy
+from sympy.calculus.singularities import singularities
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.funciones import expandir_definiciones
+from domain.polinomios import detectar_racional
+from domain.tiempo import limite_de_tiempo, TiempoAgotado
+
+
+x = sympy.Symbol('x')
+
+# segundos por cada límite o cálculo de singularidades
+PRESUPUESTO = 0.5
+
+# máximo de candidatos a asíntota vertical que se verifican con límites
+MAX_CANDIDATOS = 20
+
+# máximo de puntos que se entregan dentro de un rango (ej: tan en un rango enorme)
+MAX_PUNTOS = 1000
+
+
+@dataclass(frozen=True)
+class Asintotas:
+    """
+    Asíntotas de una función de x.
+
+    verticales: conjunto de sympy con las x de las asíntotas verticales
+        (puede ser infinito, ej: tan); None si no se pudo calcular.
+    singularidades: todos los puntos reales donde f no está definida o se
+        rompe (asíntotas y huecos), para cortar la curva; None si no se sabe.
+    mas_infinito, menos_infinito: ("horizontal", L), ("oblicua", m, b) o None.
+    """
+    verticales: Optional[sympy.Set]
+    singularidades: Optional[sympy.Set]
+    mas_infinito: Optional[tuple] = None
+    menos_infinito: Optional[tuple] = None
+
+    def verticales_en(self, rango_x) -> List[float]:
+        """x de las asíntotas verticales dentro de rango_x, ordenadas."""
+        return _puntos_en_rango(self.verticales, rango_x)
+
+    def singularidades_en(self, rango_x) -> Optional[List[float]]:
+        """Puntos donde cortar la curva dentro de rango_x; None si no se conocen."""
+        if self.singularidades is None:
+            return None
+        return _puntos_en_rango(self.singularidades, rango_x)
+
+    def rectas(self) -> List[tuple]:
+        """Asíntotas no verticales sin repetir: (m, b) con y = m*x + b."""
+        rectas = []
+        for asintota in (self.mas_infinito, self.menos_infinito):
+            if asintota is None:
+                continue
+            if asintota[0] == "horizontal":
+                recta = (0.0, float(asintota[1]))
+            else:
+                recta = (float(asintota[1]), float(asintota[2]))
+            if recta not in rectas:
+                rectas.append(recta)
+        return rectas
+
+
+def _es_finito(valor) -> bool:
+    # is_comparable deja afuera AccumBounds (ej: lim sin(x) en ∞ = <-1, 1>), que no es un valor
+    return valor is not None and valor.is_comparable and valor.is_real is True and valor.is_finite is True
+
+
+def _es_infinito(valor) -> bool:
+    return valor is not None and valor.has(sympy.oo, -sympy.oo, sympy.zoo)
+
+
+class _Incompleto(Exception):
+    """Resultado con partes desconocidas por falta de tiempo; sale por acá para no quedar en caché."""
+
+    def __init__(self, resultado):
+        super().__init__()
+        self.resultado = resultado
+
+
+@lru_cache(maxsize=2048)
+def _limite(expr, punto, lado="+-", variable=x, presupuesto=PRESUPUESTO):
+    """
+    Límite con presupuesto de tiempo; None si sympy no puede.
+
+    Raises:
+        TiempoAgotado: Si no termina a tiempo (así no queda en caché)
+    """
+    try:
+        with limite_de_tiempo(presupuesto):
+            if lado == "+-":
+                return sympy.limit(expr, variable, punto)
+            return sympy.limit(expr, variable, punto, lado)
+    except (NotImplementedError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def _en_infinito(expr, punto, variable=x, presupuesto=PRESUPUESTO) -> Optional[tuple]:
+    limite = _limite(expr, punto, "+-", variable, presupuesto)
+    if _es_finito(limite):
+        return ("horizontal", limite)
+    if not _es_infinito(limite):
+        return None
+    m = _limite(expr / variable, punto, "+-", variable, presupuesto)
+    if not _es_finito(m) or m == 0:
+        return None
+    b = _limite(expr - m * variable, punto, "+-", variable, presupuesto)
+    if not _es_finito(b):
+        return None
+    return ("oblicua", m, b)
+
+
+def _componentes(conjunto) -> List[sympy.Set]:
+    if isinstance(conjunto, sympy.Union):
+        return list(conjunto.args)
+    return [conjunto]
+
+
+def _progresion(imagen):
+    """(a, b) si el ImageSet es {a*n + b : n entero}, si no None."""
+    if not isinstance(imagen, sympy.ImageSet) or imagen.base_sets != (sympy.S.Integers,):
+        return None
+    n = imagen.lamda.variables[0]
+    forma = imagen.lamda.expr
+    a = sympy.diff(forma, n)
+    if n in a.free_symbols:
+        return None
+    return a, forma.subs(n, 0)
+
+
+def _puntos_en_rango(conjunto, rango_x, maximo=MAX_PUNTOS) -> List[float]:
+    if conjunto is None:
+        return []
+    inicio, fin = rango_x
+    puntos = set()
+    for parte in _componentes(conjunto):
+        if isinstance(parte, sympy.FiniteSet):
+            for p in parte:
+                if p.is_real:
+                    valor = float(p)
+                    if inicio <= valor <= fin:
+                        puntos.add(valor)
+            continue
+        progresion = _progresion(parte)
+        if progresion is None:
+            continue
+        a, b = progresion
+        if a.is_real and b.is_real and a != 0:
+            fa, fb = float(a), float(b)
+            n1, n2 = sorted(((inicio - fb) / fa, (fin - fb) / fa))
+            desde, hasta = math.ceil(n1), math.floor(n2)
+            if hasta - desde + 1 > maximo:
+                hasta = desde + maximo - 1
+            puntos.update(fa * n + fb for n in range(desde, hasta + 1))
+        elif b.is_real and inicio <= float(b) <= fin:
+            # ej: {2*n*I*pi + log(2)}: solo n = 0 es real
+            puntos.add(float(b))
+    return sorted(p for p in puntos if inicio <= p <= fin)[:maximo]
+
+
+def _singularidades(expr, variable, presupuesto) -> Optional[sympy.Set]:
+    try:
+        with limite_de_tiempo(presupuesto):
+            conjunto = singularities(expr, variable)
+    except (NotImplementedError, ValueError, TypeError, AttributeError):
+        return None
+    # las singularidades complejas no importan para graficar
+    partes = []
+    for parte in _componentes(conjunto):
+        if parte.is_empty:
+            # ej: exp, atan, Abs: no hay singularidades (no es "no se pudo calcular")
+            continue
+        if isinstance(parte, sympy.FiniteSet):
+            reales = [p for p in parte if p.is_real]
+            if reales:
+                partes.append(sympy.FiniteSet(*reales))
+        elif _progresion(parte) is not None:
+            a, b = _progresion(parte)
+            if a.is_real and b.is_real:
+                partes.append(parte)
+            elif b.is_real:
+                partes.append(sympy.FiniteSet(b))
+        else:
+            return None
+    return sympy.Union(*partes) if partes else sympy.S.EmptySet
+
+
+def _es_vertical(expr, punto, variable, presupuesto) -> bool:
+    return any(_es_infinito(_limite(expr, punto, lado, variable, presupuesto)) for lado in ("+", "-"))
+
+
+def _verticales(expr, singularidades, variable, presupuesto, a_tiempo) -> sympy.Set:
+    # a_tiempo(calculo, *args): None si el cálculo no terminó (ese candidato no cuenta)
+    partes = []
+    revisados = 0
+    for parte in _componentes(singularidades):
+        if isinstance(parte, sympy.FiniteSet):
+            puntos = []
+            for p in parte:
+                if revisados >= MAX_CANDIDATOS:
+                    break
+                revisados += 1
+                if a_tiempo(_es_vertical, expr, p, variable, presupuesto):
+                    puntos.append(p)
+            if puntos:
+                partes.append(sympy.FiniteSet(*puntos))
+        elif _progresion(parte) is not None:
+            # progresión periódica: se revisa un representante (n = 0)
+            _, b = _progresion(parte)
+            revisados += 1
+            if a_tiempo(_es_vertical, expr, b, variable, presupuesto):
+                partes.append(parte)
+    return sympy.Union(*partes) if partes else sympy.S.EmptySet
+
+
+def asintotas(expr, variable=x, presupuesto=PRESUPUESTO) -> Asintotas:
+    """Asíntotas de `expr` (ver Asintotas)."""
+    try:
+        return _asintotas(expr, variable, presupuesto)
+    except _Incompleto as incompleto:
+        return incompleto.resultado
+
+
+@lru_cache(maxsize=512)
+def _asintotas(expr, variable, presupuesto) -> Asintotas:
+    racional = detectar_racional(expr, variable)
+    if racional is not None:
+        en_infinito = racional.asintota_infinito()
+        return Asintotas(
+            verticales=sympy.FiniteSet(*racional.asintotas_verticales()),
+            singularidades=sympy.FiniteSet(*racional.polos()),
+            mas_infinito=en_infinito,
+            menos_infinito=en_infinito,
+        )
+
+    if not expr.free_symbols <= {variable}:
+        return Asintotas(verticales=None, singularidades=None)
+
+    # las funciones registradas con definición simbólica se analizan con ella
+    expr = expandir_definiciones(expr)
+
+    completo = True
+
+    def a_tiempo(calculo, *args):
+        # lo que no termina queda desconocido (None) y el resultado no se guarda
+        nonlocal completo
+        try:
+            return calculo(*args)
+        except TiempoAgotado:
+            completo = False
+            return None
+
+    singularidades = a_tiempo(_singularidades, expr, variable, presupuesto)
+    verticales = None
+    if singularidades is not None:
+        verticales = _verticales(expr, singularidades, variable, presupuesto, a_tiempo)
+    resultado = Asintotas(
+        verticales=verticales,
+        singularidades=singularidades,
+        mas_infinito=a_tiempo(_en_infinito, expr, sympy.oo, variable, presupuesto),
+        menos_infinito=a_tiempo(_en_infinito, expr, -sympy.oo, variable, presupuesto),
+    )
+    if not completo:
+        raise _Incompleto(resultado)
+    return resultado
@@ -0,0 +1,333 @@
+"""
+Backends de evaluación numérica y selección automática.
+
+Un backend compila una expresión a un callable sobre arreglos float64 (NaN
+donde f no está definida). Cuál conviene depende de la cantidad de puntos y
+de la forma de la expresión:
+
+- "math": lambdify con math, punto a punto. Lo más rápido para un solo punto.
+- "numpy": lambdify con numpy (domain.precision). Lo normal para grillas.
+- "horner": polinomios y racionales de una variable ya expandidos (domain.polinomios).
+- "numexpr": opcional, para grillas grandes de expresiones largas (usa
+  varios núcleos y no arma arreglos intermedios). Si numexpr no está
+  instalado simplemente no participa.
+
+El selector automático (EvaluadorAuto, ParseResult.to_backend("auto")) mide
+una vez cada backend disponible con los puntos de la primera llamada de cada
+clase de tamaño, descarta los que fallan o no coinciden con numpy, y guarda
+la decisión por (expresión, variables, clase de tamaño).
+"""
+from collections import OrderedDict
+import importlib.util
+import math
+import os
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import sympy
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.funciones import modulos_lambdify, version_registro
+from domain.polinomios import detectar_racional
+from domain.precision import compilar_vectorizado
+
+
+class BackendNoAplica(Exception):
+    """El backend no está instalado o no sabe compilar esta expresión."""
+
+
+class Backend:
+    """
+    Backend de evaluación.
+
+    Attributes:
+        nombre: Nombre con el que se elige (ej: "numpy")
+        compilar: (expr, simbolos) -> callable(*arreglos) -> ndarray float64;
+            lanza BackendNoAplica si no puede con la expresión
+        modulo: Módulo opcional que necesita (ej: "numexpr"), o None
+    """
+
+    def __init__(self, nombre: str, compilar: Callable, modulo: Optional[str] = None):
+        self.nombre = nombre
+        self.compilar = compilar
+        self.modulo = modulo
+        self._disponible = None
+
+    def __repr__(self):
+        return f"Backend({self.nombre!r})"
+
+    def disponible(self) -> bool:
+        if self._disponible is None:
+            self._disponible = self.modulo is None or importlib.util.find_spec(self.modulo) is not None
+        return self._disponible
+
+
+def _compilar_math(expr, simbolos):
+    f = sympy.lambdify(simbolos, expr, modules=modulos_lambdify(["math"]))
+
+    def evaluar(*arreglos):
+        arreglos = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in arreglos])
+        forma = arreglos[0].shape
+        planos = [a.ravel().tolist() for a in arreglos]
+        salida = np.empty(int(np.prod(forma)), dtype=np.float64)
+        for i, valores in enumerate(zip(*planos)):
+            try:
+                v = f(*valores)
+                salida[i] = np.nan if isinstance(v, complex) else v
+            except (ValueError, ZeroDivisionError, TypeError, OverflowError):
+                salida[i] = np.nan
+        return salida.reshape(forma)
+
+    return evaluar
+
+
+def _compilar_numpy(expr, simbolos):
+    f = compilar_vectorizado(expr, simbolos, "float64")
+
+    def evaluar(*arreglos):
+        return np.asarray(f(*arreglos), dtype=np.float64)
+
+    return evaluar
+
+
+def _compilar_horner(expr, simbolos):
+    if len(simbolos) != 1:
+        raise BackendNoAplica("horner es para funciones de una variable")
+    racional = detectar_racional(expr, simbolos[0])
+    if racional is None:
+        raise BackendNoAplica("la expresión no es polinomio ni racional")
+    if not racional.expandida:
+        # cerca de las raíces de (x - 1)**10 el error de Horner es mayor que el valor,
+        # y la comparación con numpy (atol) no alcanza a verlo
+        raise BackendNoAplica("horner solo para polinomios/racionales ya expandidos")
+    return lambda xs: np.asarray(racional.evaluar(np.asarray(xs, dtype=np.float64)), dtype=np.float64)
+
+
+def _compilar_numexpr(expr, simbolos):
+    try:
+        f = sympy.lambdify(simbolos, expr, modules="numexpr")
+    except Exception as e:
+        # ej: funciones registradas o que numexpr no tiene
+        raise BackendNoAplica(f"numexpr no puede compilar la expresión: {e}")
+
+    def evaluar(*arreglos):
+        arreglos = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in arreglos])
+        with np.errstate(all="ignore"):
+            val = np.asarray(f(*arreglos))
+        if np.iscomplexobj(val):
+            val = np.where(val.imag == 0, val.real, np.nan)
+        val = val.astype(np.float64, copy=False)
+        return np.array(np.broadcast_to(val, arreglos[0].shape))
+
+    return evaluar
+
+
+_backends: Dict[str, Backend] = {}
+_cerrojo = threading.Lock()
+
+
+def registrar_backend(nombre: str, compilar: Callable, modulo: Optional[str] = None) -> Backend:
+    """Registra (o reemplaza) un backend; ver Backend para el contrato de `compilar`."""
+    nuevo = Backend(nombre, compilar, modulo)
+    with _cerrojo:
+        _backends[nombre] = nuevo
+    limpiar_decisiones()
+    return nuevo
+
+
+def quitar_backend(nombre: str) -> None:
+    with _cerrojo:
+        _backends.pop(nombre, None)
+    limpiar_decisiones()
+
+
+def backend(nombre: str) -> Backend:
+    if nombre not in _backends:
+        raise ValueError(f"Backend no soportado: {nombre}. Opciones: {sorted(_backends)}")
+    return _backends[nombre]
+
+
+def backends_disponibles() -> List[str]:
+    return [nombre for nombre, b in _backends.items() if b.disponible()]
+
+
+# Compilación y selección
+
+# clases de tamaño: (máximo de puntos, nombre, puntos con que se mide)
+CLASES_TAMANO = (
+    (1, "punto", 1),
+    (1_000, "chica", 1_000),
+    (100_000, "mediana", 20_000),
+    (math.inf, "grande", 100_000),
+)
+
+# tiempo mínimo de cada medición (se repite la llamada hasta llegar)
+TIEMPO_MEDICION = 0.002
+TAM_CACHE = 1024
+
+_compilados: "OrderedDict[tuple, Callable]" = OrderedDict()
+_decisiones: "OrderedDict[tuple, str]" = OrderedDict()
+_cerrojo_cache = threading.Lock()
+
+
+def clase_tamano(puntos: int) -> str:
+    for maximo, nombre, _ in CLASES_TAMANO:
+        if puntos <= maximo:
+            return nombre
+    return CLASES_TAMANO[-1][1]
+
+
+def _guardar(cache, clave, valor):
+    with _cerrojo_cache:
+        cache[clave] = valor
+        cache.move_to_end(clave)
+        while len(cache) > TAM_CACHE:
+            cache.popitem(last=False)
+
+
+def compilar(expr, simbolos, nombre: str) -> Callable:
+    """
+    Callable de `expr` con el backend `nombre` (queda en caché).
+
+    Raises:
+        BackendNoAplica: Si el backend no está instalado o no puede con la expresión
+    """
+    b = backend(nombre)
+    if not b.disponible():
+        raise BackendNoAplica(f"El backend {nombre!r} necesita {b.modulo}, que no está instalado")
+    # con otra versión del registro de funciones cambian los núcleos que usa lambdify
+    clave = (nombre, expr, tuple(simbolos), version_registro())
+    f = _compilados.get(clave)
+    if f is None:
+        try:
+            f = b.compilar(expr, list(simbolos))
+        except BackendNoAplica:
+            raise
+        except Exception as e:
+            raise BackendNoAplica(f"{nombre}: {e}")
+        _guardar(_compilados, clave, f)
+    return f
+
+
+def _medir(f, arreglos) -> float:
+    """Segundos por llamada (la mejor de 3 mediciones de al menos TIEMPO_MEDICION)."""
+    mejor = math.inf
+    for _ in range(3):
+        llamadas = 0
+        inicio = time.perf_counter()
+        while True:
+            f(*arreglos)
+            llamadas += 1
+            transcurrido = time.perf_counter() - inicio
+            if transcurrido >= TIEMPO_MEDICION:
+                break
+        mejor = min(mejor, transcurrido / llamadas)
+    return mejor
+
+
+def _coinciden(y, referencia) -> bool:
+    with np.errstate(all="ignore"):
+        return bool(np.allclose(y, referencia, rtol=1e-9, atol=1e-12, equal_nan=True))
+
+
+def elegir_backend(expr, simbolos, arreglos, candidatos: Optional[List[str]] = None) -> str:
+    """
+    Mide los backends candidatos con (una parte de) `arreglos` y devuelve el más rápido.
+
+    Los que no están instalados, no compilan, fallan al evaluar o no
+    coinciden con numpy quedan afuera. La decisión se guarda por
+    (expresión, símbolos, clase de tamaño).
+    """
+    arreglos = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in arreglos])
+    puntos = arreglos[0].size
+    clase = clase_tamano(puntos)
+    clave = (expr, tuple(simbolos), clase, tuple(candidatos) if candidatos else None, version_registro())
+    decision = _decisiones.get(clave)
+    if decision is not None:
+        return decision
+
+    muestra = next(m for maximo, nombre, m in CLASES_TAMANO if nombre == clase)
+    prueba = [a.ravel()[:muestra] for a in arreglos]
+    # numpy primero: es la referencia con la que se comparan los demás
+    nombres = sorted(candidatos or list(_backends), key=lambda n: n != "numpy")
+    referencia = None
+    tiempos = {}
+    for nombre in nombres:
+        try:
+            f = compilar(expr, simbolos, nombre)
+            inicio = time.perf_counter()
+            with np.errstate(all="ignore"):
+                y = f(*prueba)
+            primera = time.perf_counter() - inicio
+        except Exception:
+            # no instalado, no compila o falla al evaluar: no participa
+            continue
+        if nombre == "numpy":
+            referencia = y
+        elif referencia is not None and not _coinciden(y, referencia):
+            continue
+        if tiempos and primera > 10 * min(tiempos.values()):
+            # muy lejos del mejor (ej: math con 100000 puntos): no vale la pena medirlo bien
+            tiempos[nombre] = primera
+            continue
+        with np.errstate(all="ignore"):
+            tiempos[nombre] = _medir(f, prueba)
+
+    if not tiempos:
+        raise BackendNoAplica("Ningún backend pudo evaluar la expresión")
+    decision = min(tiempos, key=tiempos.get)
+    _guardar(_decisiones, clave, decision)
+    return decision
+
+
+def decisiones() -> Dict[tuple, str]:
+    """(expresión, símbolos, clase de tamaño, candidatos) -> backend elegido."""
+    with _cerrojo_cache:
+        return dict(_decisiones)
+
+
+def limpiar_decisiones() -> None:
+    with _cerrojo_cache:
+        _decisiones.clear()
+        _compilados.clear()
+
+
+class EvaluadorAuto:
+    """
+    Callable sobre arreglos que usa, para cada clase de tamaño, el backend
+    más rápido para esta expresión (ver elegir_backend).
+
+    Attributes:
+        ultimo_backend: Backend usado en la última llamada
+    """
+
+    vectorizada = True
+
+    def __init__(self, expr, simbolos, candidatos: Optional[List[str]] = None):
+        self.expr = expr
+        self.simbolos = list(simbolos)
+        self.candidatos = candidatos
+        self.ultimo_backend = None
+        # clase de tamaño -> (versión del registro, backend, callable), para no repetir búsquedas
+        self._por_clase = {}
+
+    def __call__(self, *arreglos):
+        if len(arreglos) != len(self.simbolos):
+            raise ValueError(f"Se esperaban {len(self.simbolos)} argumentos, recibidos {len(arreglos)}")
+        clase = clase_tamano(np.broadcast(*arreglos).size)
+        elegido = self._por_clase.get(clase)
+        if elegido is None or elegido[0] != version_registro():
+            nombre = elegir_backend(self.expr, self.simbolos, arreglos, self.candidatos)
+            elegido = (version_registro(), nombre, compilar(self.expr, self.simbolos, nombre))
+            self._por_clase[clase] = elegido
+        self.ultimo_backend = elegido[1]
+        return elegido[2](*arreglos)
+
+
+registrar_backend("math", _compilar_math)
+registrar_backend("numpy", _compilar_numpy)
+registrar_backend("horner", _compilar_horner)
+registrar_backend("numexpr", _compilar_numexpr, modulo="numexpr")
@@ -0,0 +1,92 @@
+"""
+Coalescencia de llamadas concurrentes ("single-flight").
+
+Si varios hilos piden al mismo tiempo el mismo cálculo (misma clave), solo el
+primero lo ejecuta; el resto espera y recibe el mismo resultado (o la misma
+excepción). No es un caché: cuando termina el cálculo la clave se libera.
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _LlamadaEnCurso:
+    __slots__ = ("evento", "resultado", "error")
+
+    def __init__(self):
+        self.evento = threading.Event()
+        self.resultado = None
+        self.error = None
+
+
+class VueloUnico:
+    """Agrupa llamadas concurrentes con la misma clave en una sola ejecución."""
+
+    def __init__(self, nombre: str):
+        self.nombre = nombre
+        self._lock = threading.Lock()
+        self._en_curso: Dict[Hashable, _LlamadaEnCurso] = {}
+        self.llamadas = 0
+        self.ejecuciones = 0
+        self.compartidas = 0
+
+    def ejecutar(self, clave: Hashable, funcion: Callable[[], Any]) -> Any:
+        with self._lock:
+            self.llamadas += 1
+            llamada = self._en_curso.get(clave)
+            if llamada is not None:
+                self.compartidas += 1
+                lider = False
+            else:
+                llamada = _LlamadaEnCurso()
+                self._en_curso[clave] = llamada
+                self.ejecuciones += 1
+                lider = True
+
+        if not lider:
+            llamada.evento.wait()
+            if llamada.error is not None:
+                raise llamada.error
+            return llamada.resultado
+
+        try:
+            llamada.resultado = funcion()
+            return llamada.resultado
+        except BaseException as e:
+            llamada.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._en_curso[clave]
+            llamada.evento.set()
+
+    def estadisticas(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "llamadas": self.llamadas,
+                "ejecuciones": self.ejecuciones,
+                "compartidas": self.compartidas,
+                "en_curso": len(self._en_curso),
+            }
+
+    def reiniciar_contadores(self) -> None:
+        with self._lock:
+            self.llamadas = self.ejecuciones = self.compartidas = 0
+
+
+_VUELOS: Dict[str, VueloUnico] = {}
+_lock_vuelos = threading.Lock()
+
+
+def vuelo(nombre: str) -> VueloUnico:
+    """Devuelve (o crea) el VueloUnico compartido con ese nombre."""
+    with _lock_vuelos:
+        if nombre not in _VUELOS:
+            _VUELOS[nombre] = VueloUnico(nombre)
+        return _VUELOS[nombre]
+
+
+def estadisticas_coalescencia() -> Dict[str, Dict[str, int]]:
+    """Contadores de todos los vuelos: `compartidas` es el trabajo ahorrado."""
+    with _lock_vuelos:
+        vuelos = list(_VUELOS.values())
+    return {v.nombre: v.estadisticas() for v in vuelos}
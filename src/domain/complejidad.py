@@ -0,0 +1,293 @@
+"""
+Límites de complejidad de las expresiones de entrada.
+
+Entradas como x**(10**10**10), miles de términos repetidos o paréntesis
+anidados cientos de veces hacen que parse_expr (con evaluate=True),
+simplify o lambdify usen CPU y memoria sin tope. Antes de parsear se
+revisa el texto con el tokenizador de Python, que es lineal y no evalúa
+nada, y se rechaza lo que pasa alguno de los límites:
+
+- largo del texto (se revisa primero, así tokenizar también queda acotado)
+- profundidad de paréntesis
+- cantidad de operaciones (operadores y llamadas a funciones)
+- cantidad de nodos (números, nombres y operaciones)
+- tamaño de los números literales (en dígitos)
+- tamaño de los exponentes numéricos, incluidas las torres como 10**10**10 y
+  la aritmética entre constantes, como x**(100*100*100)
+
+Uso:
+    exceso = LIMITES_POR_DEFECTO.verificar("x**(10**10**10)")
+    if exceso is not None:
+        print(exceso.mensaje)
+"""
+from collections import namedtuple
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+import io
+import math
+import tokenize
+from typing import List, Optional
+
+
+Exceso = namedtuple("Exceso", ["medida", "valor", "limite", "mensaje"])
+Exceso.__doc__ = """Límite superado por una expresión.
+
+medida: nombre del límite (ej: "max_exponente").
+valor: valor medido (para exponentes y números, en dígitos decimales).
+limite: valor máximo permitido.
+mensaje: texto para mostrar al usuario.
+"""
+
+_PARENTESIS_ABREN = {"(", "[", "{"}
+_PARENTESIS_CIERRAN = {")", "]", "}"}
+_OPERADORES = {"+", "-", "*", "/", "**", "//", "%"}
+
+
+@dataclass(frozen=True)
+class LimitesComplejidad:
+    """
+    Máximos permitidos para una expresión; None desactiva ese límite.
+
+    Attributes:
+        max_largo: Caracteres del texto
+        max_profundidad: Paréntesis anidados
+        max_operaciones: Operadores más llamadas a funciones
+        max_nodos: Números, nombres y operaciones en total
+        max_digitos: Dígitos de un número literal (1e400 cuenta como 401)
+        max_exponente: Valor absoluto de un exponente numérico (ej: x**2000, 2**10**5,
+            x**(100*100*100)); un exponente que solo tiene números pero cuyo valor no se
+            puede acotar (ej: una función registrada aplicada a un número) cuenta como infinito
+    """
+    max_largo: Optional[int] = 2000
+    max_profundidad: Optional[int] = 50
+    max_operaciones: Optional[int] = 500
+    max_nodos: Optional[int] = 1000
+    max_digitos: Optional[int] = 500
+    max_exponente: Optional[float] = 1000
+
+    def verificar(self, texto: str) -> Optional[Exceso]:
+        """Primer límite que supera `texto`, o None si está dentro de todos."""
+        if self.max_largo is not None and len(texto) > self.max_largo:
+            return Exceso("max_largo", len(texto), self.max_largo,
+                          f"la expresión tiene {len(texto)} caracteres (máximo {self.max_largo})")
+
+        tokens = _tokens(texto)
+        profundidad = 0
+        maxima = 0
+        operaciones = 0
+        nodos = 0
+        for i, (tipo, valor) in enumerate(tokens):
+            if valor in _PARENTESIS_ABREN:
+                profundidad += 1
+                maxima = max(maxima, profundidad)
+                if self.max_profundidad is not None and maxima > self.max_profundidad:
+                    return Exceso("max_profundidad", maxima, self.max_profundidad,
+                                  f"hay más de {self.max_profundidad} paréntesis anidados")
+                continue
+            if valor in _PARENTESIS_CIERRAN:
+                profundidad -= 1
+                continue
+
+            if tipo == tokenize.NUMBER:
+                nodos += 1
+                digitos = _digitos(valor)
+                if self.max_digitos is not None and digitos > self.max_digitos:
+                    return Exceso("max_digitos", digitos, self.max_digitos,
+                                  f"un número tiene {digitos:g} dígitos (máximo {self.max_digitos})")
+            elif tipo == tokenize.NAME:
+                nodos += 1
+                # llamada a función: sin(...)
+                if i + 1 < len(tokens) and tokens[i + 1][1] == "(":
+                    operaciones += 1
+                    nodos += 1
+            elif valor in _OPERADORES:
+                operaciones += 1
+                nodos += 1
+                if valor == "**" and self.max_exponente is not None:
+                    exponente = _valor_exponente(tokens, i + 1)
+                    if exponente is not None and exponente > self.max_exponente:
+                        return Exceso("max_exponente", _digitos_de_valor(exponente), self.max_exponente,
+                                      f"un exponente es demasiado grande (máximo {self.max_exponente:g})")
+
+            if self.max_operaciones is not None and operaciones > self.max_operaciones:
+                return Exceso("max_operaciones", operaciones, self.max_operaciones,
+                              f"la expresión tiene más de {self.max_operaciones} operaciones")
+            if self.max_nodos is not None and nodos > self.max_nodos:
+                return Exceso("max_nodos", nodos, self.max_nodos,
+                              f"la expresión tiene más de {self.max_nodos} términos y operaciones")
+        return None
+
+
+LIMITES_POR_DEFECTO = LimitesComplejidad()
+SIN_LIMITES = LimitesComplejidad(None, None, None, None, None, None)
+
+
+def _tokens(texto: str) -> List[tuple]:
+    tokens = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(texto).readline):
+            if token.type in (tokenize.NUMBER, tokenize.NAME, tokenize.OP):
+                tokens.append((token.type, token.string))
+    except (tokenize.TokenError, SyntaxError):
+        # ej: paréntesis sin cerrar; lo leído hasta ahí se revisa igual
+        # y el error de sintaxis lo informa parse_expr
+        pass
+    return tokens
+
+
+def _log10_numero(texto: str) -> Optional[float]:
+    """log10 del valor absoluto de un literal numérico (sin convertirlo a float)."""
+    texto = texto.rstrip("jJ")
+    try:
+        if texto[:2].lower() in ("0x", "0o", "0b"):
+            valor = int(texto, 0)
+            return math.log10(valor) if valor else -math.inf
+        valor = abs(Decimal(texto))
+    except (ValueError, InvalidOperation):
+        return None
+    if valor == 0:
+        return -math.inf
+    # adjusted() es el exponente del primer dígito: cuenta dígitos sin armar el número
+    return valor.adjusted() + math.log10(valor.scaleb(-valor.adjusted()))
+
+
+def _digitos_de_log(log10: float) -> float:
+    return math.floor(log10) + 1 if math.isfinite(log10) else math.inf
+
+
+def _digitos(texto: str) -> float:
+    log10 = _log10_numero(texto)
+    if log10 is None or log10 < 0:
+        return 1
+    return _digitos_de_log(log10)
+
+
+def _digitos_de_valor(valor: float) -> float:
+    return _digitos_de_log(math.log10(valor)) if valor >= 1 else 1
+
+
+# lo que se puede calcular dentro de un exponente numérico
+_CONSTANTES = {"pi": math.pi, "e": math.e, "E": math.e}
+_FUNCIONES = {
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "asin": math.asin, "acos": math.acos, "atan": math.atan,
+    "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
+    "exp": math.exp, "log": math.log, "ln": math.log, "sqrt": math.sqrt, "abs": abs,
+}
+
+
+class _NoNumerico(Exception):
+    """El exponente tiene variables (ej: x**n): no se puede ni hace falta acotarlo."""
+
+
+class _Exponente:
+    """
+    Valor (float) de la expresión numérica que empieza en tokens[i],
+    con la precedencia de Python: lo que sigue a un ** es un factor, ej: en
+    x**-(100*100)*2 el exponente es -(100*100). Los números pegados se
+    multiplican (multiplicación implícita). Lo que se pasa de un float es inf.
+    """
+
+    def __init__(self, tokens, i):
+        self.tokens = tokens
+        self.i = i
+
+    def _actual(self):
+        return self.tokens[self.i][1] if self.i < len(self.tokens) else None
+
+    def _empieza_atomo(self):
+        return self.i < len(self.tokens) and (self.tokens[self.i][0] in (tokenize.NUMBER, tokenize.NAME)
+                                              or self._actual() == "(")
+
+    def expresion(self):
+        valor = self.termino()
+        while self._actual() in ("+", "-"):
+            signo = self._actual()
+            self.i += 1
+            valor = valor + self.termino() if signo == "+" else valor - self.termino()
+        return valor
+
+    def termino(self):
+        valor = self.factor()
+        while self._actual() in ("*", "/", "//", "%") or self._empieza_atomo():
+            operador = "*" if self._empieza_atomo() else self._actual()
+            if operador == self._actual():
+                self.i += 1
+            otro = self.factor()
+            if operador == "*":
+                valor = valor * otro
+            elif operador == "/":
+                valor = valor / otro
+            elif operador == "//":
+                valor = valor // otro
+            else:
+                valor = valor % otro
+        return valor
+
+    def factor(self):
+        if self._actual() in ("+", "-"):
+            signo = self._actual()
+            self.i += 1
+            valor = self.factor()
+            return -valor if signo == "-" else valor
+        base = self.atomo()
+        if self._actual() != "**":
+            return base
+        self.i += 1
+        exponente = self.factor()
+        try:
+            return abs(base) ** exponente
+        except OverflowError:
+            return math.inf
+
+    def atomo(self):
+        if self.i >= len(self.tokens):
+            raise _NoNumerico()
+        tipo, texto = self.tokens[self.i]
+        self.i += 1
+        if tipo == tokenize.NUMBER:
+            log10 = _log10_numero(texto)
+            if log10 is None:
+                raise _NoNumerico()
+            if log10 >= 308:
+                return math.inf
+            texto = texto.rstrip("jJ")
+            if texto[:2].lower() in ("0x", "0o", "0b"):
+                return float(int(texto, 0))
+            return float(Decimal(texto))
+        if texto == "(":
+            valor = self.expresion()
+            if self._actual() == ")":
+                self.i += 1
+            return valor
+        if tipo != tokenize.NAME:
+            raise _NoNumerico()
+        if self._actual() != "(":
+            if texto in _CONSTANTES:
+                return _CONSTANTES[texto]
+            raise _NoNumerico()
+        argumento = self.atomo()
+        funcion = _FUNCIONES.get(texto)
+        if funcion is None:
+            # función de números que no se sabe acotar (ej: una registrada)
+            return math.inf
+        try:
+            return funcion(argumento)
+        except OverflowError:
+            return math.inf
+
+
+def _valor_exponente(tokens, i) -> Optional[float]:
+    """
+    Valor absoluto del exponente numérico que empieza en tokens[i] (ej: 10,
+    -3, (10**10), 10**10**10, (100*100*100)); None si tiene variables.
+    """
+    try:
+        valor = abs(_Exponente(tokens, i).factor())
+    except _NoNumerico:
+        return None
+    except (ZeroDivisionError, ValueError, TypeError):
+        # ej: x**(1/0) o x**sqrt(-1): sympy lo resuelve sin expandir nada
+        return None
+    # nan sale de cosas como inf - inf: no se pudo acotar
+    return math.inf if math.isnan(valor) else valor
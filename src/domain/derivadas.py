@@ -0,0 +1,73 @@
+"""
+Derivadas simbólicas con caché.
+
+Cada derivada se calcula y simplifica una sola vez por expresión; su versión
+compilada para numpy también queda guardada, así la graficación (ej: recta
+tangente al mover el mouse) no hace trabajo simbólico repetido.
+
+Se deriva respecto de una x real (si no, Abs(x) da re/im/Derivative en vez
+de sign(x)) y se simplifica con las estrategias con presupuesto de
+domain.simplificacion; el resultado vuelve a quedar en la x del parser.
+"""
+from functools import lru_cache
+import os
+import sys
+
+import sympy as sp
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.parser import ParseResult
+from domain.simplificacion import simplificar
+
+
+x = sp.Symbol('x')
+
+
+@lru_cache(maxsize=512)
+def derivada(expr, orden=1, variable=x):
+    """Derivada de orden `orden` ya simplificada. Reutiliza las de orden menor."""
+    if orden < 0:
+        raise ValueError("El orden de la derivada debe ser >= 0")
+    if orden == 0:
+        return expr
+    anterior = derivada(expr, orden - 1, variable)
+    real = sp.Symbol(variable.name, real=True)
+    d = sp.diff(anterior.subs(variable, real), real)
+    try:
+        d, _ = simplificar(d, "auto")
+    except Exception:
+        pass
+    return d.subs(real, variable)
+
+
+def _para_evaluar(expr):
+    # DiracDelta (ej: f'' de Abs(x)) vale 0 donde está definida y numpy no la conoce
+    return expr.replace(lambda e: isinstance(e, sp.DiracDelta), lambda e: sp.S.Zero)
+
+
+@lru_cache(maxsize=512)
+def derivada_parse(expr, orden=1, variable=x):
+    """ParseResult de la derivada, para usarla igual que una función parseada."""
+    d = _para_evaluar(derivada(expr, orden, variable))
+    variables = sorted(str(s) for s in d.free_symbols)
+    return ParseResult(expr=d, variables=variables, warnings=[], error=None)
+
+
+@lru_cache(maxsize=512)
+def derivada_vectorizada(expr, orden=1, variable=x):
+    """Callable numpy de la derivada (f' se compila una sola vez por expresión)."""
+    return derivada_parse(expr, orden, variable).to_vectorized()
+
+
+def recta_tangente(expr, x0, variable=x):
+    """
+    Recta tangente a f en x0.
+
+    Returns:
+        tuple: (pendiente, ordenada) con y = pendiente * x + ordenada
+    """
+    f = derivada_vectorizada(expr, 0, variable)
+    fp = derivada_vectorizada(expr, 1, variable)
+    y0 = float(f(x0))
+    m = float(fp(x0))
+    return m, y0 - m * x0
@@ -0,0 +1,192 @@
+"""
+Motor de dominio por reglas.
+
+En vez de llamar `continuous_domain` sobre toda la expresión, el dominio se
+arma recorriendo el árbol y juntando las restricciones de cada función:
+
+- división / potencia negativa: base ≠ 0
+- raíz (exponente fraccionario): base ≥ 0 (o > 0 si el exponente es negativo)
+- log: argumento > 0
+- asin, acos: -1 ≤ argumento ≤ 1
+
+Cada restricción se resuelve con el método más rápido que aplique (signos de
+un racional a partir de sus raíces exactas; si no, las desigualdades de
+sympy). Los resultados quedan en caché por subexpresión. Si aparece algo que
+las reglas no cubren, se usa `continuous_domain` con un límite de tiempo.
+Lo que se queda sin tiempo (el presupuesto propio o un límite de afuera) no
+se guarda en caché: la próxima vez se vuelve a intentar.
+"""
+from functools import lru_cache
+import os
+import sys
+from typing import Optional
+
+import sympy
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.funciones import registro_de
+from domain.polinomios import detectar_racional
+from domain.tiempo import limite_de_tiempo, TiempoAgotado
+
+
+x = sympy.Symbol('x')
+
+# segundos para cada restricción que no es racional y para el respaldo con continuous_domain
+PRESUPUESTO = 2.0
+
+# funciones definidas en todos los reales (solo importa el dominio del argumento)
+_SIN_RESTRICCION = (
+    sympy.sin, sympy.cos, sympy.atan, sympy.exp,
+    sympy.sinh, sympy.cosh, sympy.tanh, sympy.Abs, sympy.sign,
+)
+
+
+class DominioNoCalculable(Exception):
+    """Ni las reglas ni continuous_domain lograron el dominio dentro del presupuesto."""
+
+
+def _punto_prueba(a, b):
+    if a == -sympy.oo and b == sympy.oo:
+        return 0.0
+    if a == -sympy.oo:
+        return float(b) - 1
+    if b == sympy.oo:
+        return float(a) + 1
+    return (float(a) + float(b)) / 2
+
+
+def _signo_racional(racional, relacion):
+    """Conjunto donde g (racional) cumple `g relacion 0`, con relacion en '!=', '>', '>='."""
+    ceros = racional.ceros()
+    if relacion == "!=":
+        return sympy.Complement(sympy.S.Reals, sympy.FiniteSet(*ceros)) if ceros else sympy.S.Reals
+
+    puntos = sorted(set(ceros) | set(racional.polos()), key=float)
+    bordes = [-sympy.oo] + puntos + [sympy.oo]
+    tramos = []
+    for a, b in zip(bordes[:-1], bordes[1:]):
+        if racional.evaluar(_punto_prueba(a, b)) > 0:
+            tramos.append(sympy.Interval.open(a, b))
+    if relacion == ">=" and ceros:
+        tramos.append(sympy.FiniteSet(*ceros))
+    return sympy.Union(*tramos) if tramos else sympy.S.EmptySet
+
+
+@lru_cache(maxsize=1024)
+def _resolver(g, relacion, variable=x, presupuesto=PRESUPUESTO) -> Optional[sympy.Set]:
+    """
+    Resuelve `g relacion 0` en los reales; None si sympy no puede.
+
+    Raises:
+        TiempoAgotado: Si no termina a tiempo (así no queda en caché)
+    """
+    if variable not in g.free_symbols:
+        # constante: o se cumple en todos lados o en ninguno
+        valor = g.evalf()
+        if not valor.is_real:
+            return None
+        cumple = {"!=": valor != 0, ">": valor > 0, ">=": valor >= 0}[relacion]
+        return sympy.S.Reals if cumple else sympy.S.EmptySet
+
+    racional = detectar_racional(g, variable)
+    if racional is not None:
+        return _signo_racional(racional, relacion)
+
+    try:
+        with limite_de_tiempo(presupuesto):
+            if relacion == "!=":
+                ceros = sympy.solveset(g, variable, sympy.S.Reals)
+                if isinstance(ceros, sympy.ConditionSet):
+                    return None
+                return sympy.Complement(sympy.S.Reals, ceros)
+            desigualdad = g > 0 if relacion == ">" else g >= 0
+            return sympy.solve_univariate_inequality(desigualdad, variable, relational=False)
+    except (NotImplementedError, ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _dominio_sub(expr, variable=x, presupuesto=PRESUPUESTO) -> Optional[sympy.Set]:
+    """
+    Dominio de una subexpresión según las reglas; None si alguna regla no alcanza.
+
+    Raises:
+        TiempoAgotado: Si alguna restricción no se resolvió a tiempo
+    """
+    if variable not in expr.free_symbols:
+        return sympy.S.Reals
+    if expr.is_Symbol:
+        return sympy.S.Reals
+
+    # primero el dominio de los argumentos
+    dominio = sympy.S.Reals
+    for arg in expr.args:
+        sub = _dominio_sub(arg, variable, presupuesto)
+        if sub is None:
+            return None
+        dominio = sympy.Intersection(dominio, sub)
+
+    if expr.is_Add or expr.is_Mul:
+        return dominio
+
+    restricciones = []
+    registro = registro_de(expr)
+    if registro is not None:
+        # funcion registrada: sus reglas de dominio (sin reglas, todos los reales)
+        restricciones.extend(registro.restricciones(expr.args[0]))
+    elif expr.is_Pow:
+        base, exponente = expr.args
+        if variable in exponente.free_symbols or not exponente.is_Rational:
+            return None
+        if exponente.is_Integer:
+            if exponente < 0:
+                restricciones.append((base, "!="))
+        else:
+            # raiz: sympy toma la raiz principal, que es compleja para base < 0
+            restricciones.append((base, ">" if exponente < 0 else ">="))
+    elif isinstance(expr, sympy.log):
+        if len(expr.args) != 1:
+            return None
+        restricciones.append((expr.args[0], ">"))
+    elif isinstance(expr, (sympy.asin, sympy.acos)):
+        arg = expr.args[0]
+        restricciones.append((arg + 1, ">="))
+        restricciones.append((1 - arg, ">="))
+    elif not isinstance(expr, _SIN_RESTRICCION):
+        return None
+
+    for g, relacion in restricciones:
+        conjunto = _resolver(g, relacion, variable, presupuesto)
+        if conjunto is None:
+            return None
+        dominio = sympy.Intersection(dominio, conjunto)
+    return dominio
+
+
+def dominio_funcion(expr, variable=x, presupuesto=PRESUPUESTO) -> sympy.Set:
+    """
+    Dominio real de `expr`.
+
+    Raises:
+        DominioNoCalculable: Si las reglas no alcanzan y continuous_domain no
+            termina dentro del presupuesto
+    """
+    try:
+        resultado = _dominio_sub(expr, variable, presupuesto)
+    except TiempoAgotado:
+        # las reglas se quedaron sin tiempo: esta vez se usa el respaldo
+        resultado = None
+    if resultado is not None:
+        return resultado
+
+    try:
+        return _continuous_domain(expr, variable, presupuesto)
+    except TiempoAgotado:
+        raise DominioNoCalculable(f"El dominio tardó más de {presupuesto} s")
+
+
+@lru_cache(maxsize=512)
+def _continuous_domain(expr, variable, presupuesto) -> sympy.Set:
+    """continuous_domain con presupuesto; TiempoAgotado sale sin quedar en caché."""
+    with limite_de_tiempo(presupuesto):
+        return sympy.calculus.util.continuous_domain(expr, variable, sympy.S.Reals)
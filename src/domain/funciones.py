@@ -0,0 +1,232 @@
+"""
+Registro de funciones propias (sigmoid, step, sinc, ...).
+
+Una función de `extra_functions` sin implementación numérica obliga a
+lambdify a evaluar con sympy punto a punto, o falla al graficar. Acá cada
+función se registra una sola vez con su definición simbólica y sus núcleos
+numéricos, y el resto del proyecto la usa igual que a sin o exp:
+
+- parse_function la reconoce por nombre (sin pasar extra_functions)
+- la compilación (to_callable, to_vectorized y domain.precision) usa el
+  núcleo escalar con "math", el vectorizado con "numpy" y el de mpmath
+- las derivadas usan la regla de derivada (o derivan la definición)
+- el motor de dominio usa sus restricciones (por defecto, todos los reales)
+
+Ejemplo:
+    import math
+    import numpy as np
+    import sympy
+
+    registrar_funcion(
+        "sigmoid",
+        escalar=lambda v: 1 / (1 + math.exp(-v)),
+        vectorizada=lambda v: 1 / (1 + np.exp(-v)),
+        definicion=lambda u: 1 / (1 + sympy.exp(-u)),
+    )
+    registrar_funcion("step", escalar=lambda v: float(v >= 0),
+                      vectorizada=lambda v: np.where(v >= 0, 1.0, 0.0),
+                      derivada=lambda u: sympy.Integer(0))
+
+Las funciones son de un argumento.
+"""
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import mpmath
+import numpy as np
+import sympy
+from sympy.core.function import ArgumentIndexError
+
+
+class FuncionRegistrada:
+    """
+    Función propia con sus núcleos numéricos y reglas opcionales.
+
+    Attributes:
+        nombre: Nombre con el que se escribe en las expresiones
+        clase: Función de sympy (se usa como sympy.sin: clase(x))
+        escalar: float -> float
+        vectorizada: ndarray -> ndarray
+        precisa: mpf -> mpf (para precision "mpmath")
+        derivada: u -> derivada respecto del argumento (expresión sympy), o None
+        dominio: u -> lista de restricciones (g, relacion) con relacion en
+            '!=', '>', '>=' (ver domain.dominio), o None si está definida en todos los reales
+        definicion: u -> expresión sympy equivalente, para límites y asíntotas (opcional)
+    """
+
+    def __init__(self, nombre, escalar, vectorizada=None, precisa=None, derivada=None, dominio=None, definicion=None):
+        self.nombre = nombre
+        self.escalar = escalar
+        self.vectorizada = vectorizada or np.vectorize(escalar, otypes=[np.float64])
+        self.precisa = precisa or (lambda v: mpmath.mpf(escalar(float(v))))
+        self.definicion = definicion
+        if derivada is None and definicion is not None:
+            derivada = _derivar_definicion(definicion)
+        self.derivada = derivada
+        self.dominio = dominio
+        self.clase = _crear_clase(self)
+
+    def __repr__(self):
+        return f"FuncionRegistrada({self.nombre!r})"
+
+    def restricciones(self, argumento) -> List[Tuple[sympy.Expr, str]]:
+        return list(self.dominio(argumento)) if self.dominio is not None else []
+
+    def expandir(self, argumento) -> Optional[sympy.Expr]:
+        return self.definicion(argumento) if self.definicion is not None else None
+
+
+def _derivar_definicion(definicion):
+    u = sympy.Dummy('u')
+    d = sympy.diff(definicion(u), u)
+    return lambda argumento: d.subs(u, argumento)
+
+
+def _aplicar(nombre, args):
+    registro = _registro.get(nombre)
+    if registro is None:
+        raise ValueError(f"La función {nombre!r} no está registrada en este proceso")
+    return registro.clase(*args)
+
+
+def _crear_clase(registro: FuncionRegistrada):
+
+    def fdiff(self, argindex=1):
+        if registro.derivada is None or argindex != 1:
+            raise ArgumentIndexError(self, argindex)
+        return registro.derivada(self.args[0])
+
+    def _eval_evalf(self, prec):
+        arg = self.args[0].evalf(prec)
+        if not arg.is_Number:
+            return None
+        try:
+            with mpmath.workprec(prec):
+                valor = registro.precisa(mpmath.mpf(float(arg)))
+        except (ValueError, ZeroDivisionError, TypeError, OverflowError):
+            return None
+        return sympy.Float(valor, precision=prec)
+
+    @classmethod
+    def eval(cls, arg):
+        # sin definición simbólica no hay forma exacta que conservar: con
+        # argumentos numéricos se evalúa con el núcleo (ej: f.subs(x, 2))
+        if arg.is_Float or (arg.is_Number and registro.definicion is None):
+            try:
+                return sympy.Float(registro.escalar(float(arg)))
+            except (ValueError, ZeroDivisionError, TypeError, OverflowError):
+                return None
+        return None
+
+    def _eval_is_real(self):
+        if registro.dominio is None:
+            return self.args[0].is_real
+        return None
+
+    def __reduce_ex__(self, protocolo):
+        # la clase se crea al registrar, asi que se reconstruye por nombre
+        # (ej: resultados que vuelven de un ProcessPoolExecutor)
+        return _aplicar, (registro.nombre, self.args)
+
+    return type(registro.nombre, (sympy.Function,), {
+        "nargs": 1,
+        "eval": eval,
+        "fdiff": fdiff,
+        "_eval_evalf": _eval_evalf,
+        "_eval_is_real": _eval_is_real,
+        "__reduce_ex__": __reduce_ex__,
+        "__module__": __name__,
+    })
+
+
+_registro: Dict[str, FuncionRegistrada] = {}
+_cerrojo = threading.Lock()
+# cambia con cada registro, asi las claves de caché de parse_function no se mezclan
+_version = 0
+
+
+def registrar_funcion(nombre: str, escalar: Callable, vectorizada: Optional[Callable] = None,
+                      precisa: Optional[Callable] = None, derivada: Optional[Callable] = None,
+                      dominio: Optional[Callable] = None, definicion: Optional[Callable] = None):
+    """
+    Registra (o reemplaza) una función propia.
+
+    Args:
+        nombre: Nombre en las expresiones (identificador válido)
+        escalar: Núcleo para un float (con math)
+        vectorizada: Núcleo para arreglos numpy; si falta se usa np.vectorize(escalar), que es lento
+        precisa: Núcleo con mpmath; si falta se usa el escalar (precisión de float)
+        derivada: Regla de derivada u -> f'(u); si falta se deriva `definicion`
+        dominio: Regla u -> [(g, relacion), ...] (ver FuncionRegistrada)
+        definicion: u -> expresión sympy equivalente (opcional)
+
+    Returns:
+        La clase sympy de la función (ej: sigmoid = registrar_funcion(...); sigmoid(x))
+    """
+    global _version
+    if not nombre.isidentifier():
+        raise ValueError(f"Nombre de función inválido: {nombre!r}")
+    registro = FuncionRegistrada(nombre, escalar, vectorizada, precisa, derivada, dominio, definicion)
+    with _cerrojo:
+        _registro[nombre] = registro
+        _version += 1
+    return registro.clase
+
+
+def quitar_funcion(nombre: str) -> None:
+    global _version
+    with _cerrojo:
+        if _registro.pop(nombre, None) is not None:
+            _version += 1
+
+
+def funcion_registrada(nombre: str) -> Optional[FuncionRegistrada]:
+    return _registro.get(nombre)
+
+
+def registro_de(expr) -> Optional[FuncionRegistrada]:
+    """FuncionRegistrada de una aplicación como sigmoid(x), o None si no es una."""
+    registro = _registro.get(type(expr).__name__)
+    if registro is not None and type(expr) is registro.clase:
+        return registro
+    return None
+
+
+def version_registro() -> int:
+    return _version
+
+
+def simbolos_parse() -> Dict[str, Any]:
+    """Nombre -> clase sympy, para el local_dict de parse_expr."""
+    return {nombre: r.clase for nombre, r in _registro.items()}
+
+
+_NUCLEOS = {
+    "math": "escalar",
+    "numpy": "vectorizada",
+    "mpmath": "precisa",
+}
+
+
+def modulos_lambdify(modules: List[Any]) -> List[Any]:
+    """
+    Antepone a `modules` un diccionario nombre -> núcleo para que lambdify
+    llame a los núcleos numéricos de las funciones registradas.
+    """
+    modules = list(modules)
+    if not _registro:
+        return modules
+    base = next((m for m in modules if isinstance(m, str) and m in _NUCLEOS), "math")
+    atributo = _NUCLEOS[base]
+    nucleos = {nombre: getattr(r, atributo) for nombre, r in _registro.items()}
+    return [nucleos] + modules
+
+
+def expandir_definiciones(expr):
+    """Reemplaza las funciones registradas que tienen definición simbólica por ella."""
+    if not _registro:
+        return expr
+    for registro in list(_registro.values()):
+        if registro.definicion is not None and expr.has(registro.clase):
+            expr = expr.replace(registro.clase, registro.definicion)
+    return expr
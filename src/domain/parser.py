@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+import dataclasses
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, TimeoutError as FuturesTimeout, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from typing import List, Dict, Iterable, Optional, Callable, Any
 
+import numpy as np
 import sympy
 from sympy import Symbol
 from sympy.core.sympify import SympifyError
@@ -12,6 +22,16 @@ from sympy.parsing.sympy_parser import (
     implicit_multiplication_application
 )
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.backends import EvaluadorAuto, compilar as compilar_backend
+from domain.coalescencia import vuelo
+from domain.complejidad import LimitesComplejidad, LIMITES_POR_DEFECTO
+from domain.funciones import modulos_lambdify, simbolos_parse, version_registro
+from domain.precision import compilar_vectorizado
+from domain.simplificacion import simplificar, ESTRATEGIAS
+from domain.polinomios import detectar_racional, FuncionRacional
+from domain.tiempo import limite_de_tiempo, TiempoAgotado
+
 
 class ParseError(Exception):
     """Error general de parsing."""
@@ -25,6 +45,14 @@ class EmptyExpressionError(ParseError):
     """Expresión vacía."""
 
 
+class ComplexityError(ParseError):
+    """La expresión supera un límite de complejidad (ver domain.complejidad)."""
+
+    def __init__(self, exceso):
+        super().__init__(f"Expresión demasiado compleja: {exceso.mensaje}.")
+        self.exceso = exceso
+
+
 class DomainWarning(Warning):
     """Advertencias relacionadas al dominio (división por cero, etc.)."""
 
@@ -60,6 +88,13 @@ class ParseResult:
     variables: List[str]
     warnings: List[str]
     error: Optional[str]
+    # estrategia de simplificación aplicada (ver domain.simplificacion), None si no se simplificó
+    simplificacion: Optional[str] = None
+    # polinomio/racional en x detectado al parsear (ver domain.polinomios), None si no lo es
+    racional: Optional[FuncionRacional] = field(default=None, repr=False, compare=False)
+    # clase del error que produjo `error` (ej: ComplexityError; TiempoAgotado si se cortó por tiempo y
+    # BrokenProcessPool si murió el worker de parse_many), None si no hubo
+    tipo_error: Optional[type] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         self.is_valid = self.error is None
@@ -76,7 +111,8 @@ class ParseResult:
             const_val = float(self.expr.evalf())
             return lambda: const_val
 
-        modules = modules or ["math"]
+        # las funciones registradas (domain.funciones) usan sus núcleos numéricos
+        modules = modulos_lambdify(modules or ["math"])
         f = sympy.lambdify(self._symbols(), self.expr, modules=modules)
 
         def wrapped(*args):
@@ -100,6 +136,72 @@ class ParseResult:
 
         return wrapped
 
+    def to_vectorized(self, precision: str = "float64") -> Callable:
+        """
+        Callable sobre arreglos numpy; devuelve NaN donde f no está definida.
+
+        precision: "float32", "float64", "mpmath" o "auto" (ver domain.precision).
+        """
+
+        if not self.is_valid or self.expr is None:
+            raise ValueError(f"No se puede crear callable: {self.error}")
+
+        if not self.variables:
+            const_val = float(self.expr.evalf())
+
+            def constante(*args):
+                forma = np.broadcast(*[np.asarray(a) for a in args]).shape if args else ()
+                return np.full(forma, const_val)
+
+            constante.vectorizada = True
+            return constante
+
+        if self.racional is not None and self.racional.expandida and precision == "float64":
+            # polinomio/racional ya expandido: Horner sobre los coeficientes
+            # (con una forma factorizada Horner pierde precisión cerca de las raíces)
+            f = self.racional.evaluar
+        else:
+            f = compilar_vectorizado(self.expr, self._symbols(), precision)
+
+        def wrapped(*args):
+            if len(args) != len(self.variables):
+                raise ValueError(
+                    f"Se esperaban {len(self.variables)} argumentos: {self.variables}, "
+                    f"recibidos {len(args)}"
+                )
+            return f(*args)
+
+        wrapped.vectorizada = True
+        return wrapped
+
+    def to_backend(self, backend: str = "auto", candidatos: Optional[List[str]] = None) -> Callable:
+        """
+        Callable sobre arreglos numpy evaluado con un backend de domain.backends.
+
+        backend: "auto" (el más rápido para cada cantidad de puntos, medido una
+        vez por expresión) o un nombre registrado ("math", "numpy", "horner", "numexpr").
+        candidatos: Backends entre los que elige "auto" (por defecto, todos los disponibles).
+        """
+        if not self.is_valid or self.expr is None:
+            raise ValueError(f"No se puede crear callable: {self.error}")
+        if not self.variables:
+            return self.to_vectorized()
+        if backend == "auto":
+            return EvaluadorAuto(self.expr, self._symbols(), candidatos)
+
+        f = compilar_backend(self.expr, self._symbols(), backend)
+
+        def wrapped(*args):
+            if len(args) != len(self.variables):
+                raise ValueError(
+                    f"Se esperaban {len(self.variables)} argumentos: {self.variables}, "
+                    f"recibidos {len(args)}"
+                )
+            return f(*args)
+
+        wrapped.vectorizada = True
+        return wrapped
+
     def evaluate(self, **kwargs) -> float:
 
         if not self.is_valid or self.expr is None:
@@ -155,13 +257,396 @@ def _collect_domain_warnings(expr: sympy.Expr) -> List[str]:
     return warnings
 
 
+def _clave_parse(expr_str, allowed_vars, extra_functions, estrategia, safe, implicit_multiplication, limites):
+    # espacios repetidos no cambian el resultado; "x y" vs "xy" si, por eso no se borran
+    texto = " ".join(expr_str.split())
+    extras = tuple(sorted((k, id(v)) for k, v in extra_functions.items())) if extra_functions else ()
+    permitidas = tuple(sorted(allowed_vars)) if allowed_vars is not None else None
+    return (texto, permitidas, extras, estrategia, safe, implicit_multiplication, limites, version_registro())
+
+
+# resultados ya parseados (LRU) por clave de _clave_parse
+TAM_CACHE_PARSE = 2048
+_cache_parse: "OrderedDict[tuple, ParseResult]" = OrderedDict()
+_cerrojo_cache = threading.Lock()
+
+
+def _cache_obtener(clave) -> Optional[ParseResult]:
+    with _cerrojo_cache:
+        resultado = _cache_parse.get(clave)
+        if resultado is not None:
+            _cache_parse.move_to_end(clave)
+        return resultado
+
+
+def _cache_guardar(clave, resultado: ParseResult) -> None:
+    # con extra_functions la clave usa id() de los objetos, que se pueden reutilizar
+    if clave[2]:
+        return
+    with _cerrojo_cache:
+        _cache_parse[clave] = resultado
+        _cache_parse.move_to_end(clave)
+        while len(_cache_parse) > TAM_CACHE_PARSE:
+            _cache_parse.popitem(last=False)
+
+
+def limpiar_cache_parse() -> None:
+    with _cerrojo_cache:
+        _cache_parse.clear()
+
+
+def _copia(resultado: ParseResult) -> ParseResult:
+    # cada llamador recibe sus propias listas
+    return dataclasses.replace(resultado, variables=list(resultado.variables), warnings=list(resultado.warnings))
+
+
 def parse_function(
     expr_str: str,
     allowed_vars: Optional[Iterable[str]] = None,
     extra_functions: Optional[Dict[str, Any]] = None,
     simplify_expression: bool = False,
     safe: bool = True,
-    implicit_multiplication: bool = True
+    implicit_multiplication: bool = True,
+    simplify_strategy: Optional[str] = None,
+    limites: Optional[LimitesComplejidad] = None
+) -> ParseResult:
+    """
+    Parsea una expresión. Los resultados quedan en una caché LRU y las
+    llamadas concurrentes con la misma expresión y opciones comparten un solo
+    cálculo (ver domain.coalescencia).
+
+    simplify_strategy elige cómo simplificar ("ninguna", "racional",
+    "polinomial", "trigonometrica", "completa" o "auto"); si no se da,
+    simplify_expression=True equivale a "completa".
+
+    limites acota la complejidad de la entrada antes de parsear (por defecto
+    LIMITES_POR_DEFECTO, SIN_LIMITES los desactiva). Si se supera alguno el
+    resultado trae el error y tipo_error=ComplexityError.
+    """
+    if simplify_strategy is not None and simplify_strategy not in ESTRATEGIAS:
+        return ParseResult(None, [], [], f"Estrategia de simplificación no soportada: {simplify_strategy}")
+    estrategia = simplify_strategy or ("completa" if simplify_expression else None)
+    limites = limites or LIMITES_POR_DEFECTO
+
+    if not isinstance(expr_str, str):
+        return _parse_function(expr_str, allowed_vars, extra_functions, estrategia, safe, implicit_multiplication, limites)
+    if allowed_vars is not None:
+        allowed_vars = list(allowed_vars)
+
+    clave = _clave_parse(expr_str, allowed_vars, extra_functions, estrategia, safe, implicit_multiplication, limites)
+    resultado = _cache_obtener(clave)
+    if resultado is None:
+        resultado = vuelo("parse").ejecutar(
+            clave,
+            lambda: _parse_function(expr_str, allowed_vars, extra_functions, estrategia, safe, implicit_multiplication,
+                                    limites)
+        )
+        _cache_guardar(clave, resultado)
+    return _copia(resultado)
+
+
+def _validar(resultado: ParseResult) -> ParseResult:
+    """Comprueba que la expresión compile y se pueda evaluar; si no, la marca con error."""
+    if not resultado.is_valid:
+        return resultado
+    try:
+        f = resultado.to_vectorized()
+        f(*[np.linspace(-1.0, 1.0, 5) for _ in resultado.variables])
+    except TiempoAgotado:
+        raise
+    except Exception as e:
+        return ParseResult(None, [], list(resultado.warnings), f"No se pudo compilar: {e}")
+    return resultado
+
+
+def _tiempo_agotado(timeout) -> ParseResult:
+    return ParseResult(None, [], [], f"Tiempo agotado: la expresión tardó más de {timeout} s",
+                       tipo_error=TiempoAgotado)
+
+
+def _worker_caido() -> ParseResult:
+    return ParseResult(None, [], [], "El proceso que parseaba la expresión terminó inesperadamente",
+                       tipo_error=BrokenProcessPool)
+
+
+def _parse_grupo(items, allowed_vars, estrategia, validar, limites, timeout):
+    """Worker de parse_many: parsea un grupo de expresiones, cada una con su límite de tiempo."""
+    salida = []
+    for indice, expr_str in items:
+        try:
+            with limite_de_tiempo(timeout):
+                resultado = _parse_function(expr_str, allowed_vars, None, estrategia, True, True, limites)
+                if validar:
+                    resultado = _validar(resultado)
+        except TiempoAgotado:
+            resultado = _tiempo_agotado(timeout)
+        except Exception as e:
+            resultado = ParseResult(None, [], [], f"Error inesperado: {e}")
+        salida.append((indice, resultado))
+    return salida
+
+
+def _terminar_pool(ejecutor):
+    # ProcessPoolExecutor no tiene API para matar un worker colgado
+    for proceso in list((getattr(ejecutor, "_processes", None) or {}).values()):
+        proceso.terminate()
+
+
+# Qué grupo está corriendo cada worker de parse_many (número + 1, 0 si ninguno), en memoria
+# compartida como en service.servidor: si un worker muere o se cuelga, el proceso principal
+# sabe qué grupos estaban en curso y solo esos se reparten de a una expresión.
+_en_curso = None
+_casillero = None
+
+
+def _iniciar_worker(en_curso, contador):
+    global _en_curso, _casillero
+    with contador.get_lock():
+        _casillero = contador.value % len(en_curso)
+        contador.value += 1
+    _en_curso = en_curso
+
+
+def _parse_grupo_numerado(numero, items, *argumentos):
+    _en_curso[_casillero] = numero + 1
+    try:
+        return _parse_grupo(items, *argumentos)
+    finally:
+        _en_curso[_casillero] = 0
+
+
+def _ronda(grupos, procesos, argumentos, calculados):
+    """
+    Corre los grupos en un pool nuevo y deja los resultados en `calculados`.
+
+    Si pasa el tiempo de un grupo entero sin que termine ninguno, algún worker
+    no respondió a su alarma (ej: una operación en C muy larga) y se matan
+    los workers. Si un worker muere, el pool entero queda roto. En los dos
+    casos los grupos que no alcanzaron a empezar se vuelven a correr igual.
+
+    Returns:
+        (grupos para otra ronda, items sospechosos a reintentar cada uno solo)
+    """
+    timeout = argumentos[-1]
+    espera = timeout * max(len(grupo) for grupo in grupos) + 5
+    trabajadores = min(procesos, len(grupos))
+    en_curso = multiprocessing.RawArray("l", trabajadores)
+    contador = multiprocessing.Value("i", 0)
+    ejecutor = ProcessPoolExecutor(max_workers=trabajadores, initializer=_iniciar_worker,
+                                   initargs=(en_curso, contador))
+    colgado = caido = False
+    try:
+        futuros = {ejecutor.submit(_parse_grupo_numerado, numero, grupo, *argumentos): numero
+                   for numero, grupo in enumerate(grupos)}
+        pendientes = set(futuros)
+        while pendientes and not caido:
+            listos, pendientes = wait(pendientes, timeout=espera, return_when=FIRST_COMPLETED)
+            if not listos:
+                colgado = True
+                break
+            caido = any(futuro.exception() is not None for futuro in listos)
+        # antes de matar los workers: los casilleros de los que no terminaron siguen marcados
+        corriendo = {valor - 1 for valor in en_curso if valor}
+        if colgado:
+            _terminar_pool(ejecutor)
+    finally:
+        ejecutor.shutdown(wait=False, cancel_futures=True)
+
+    otra_ronda = []
+    sospechosos = []
+    sin_terminar = []
+    for futuro, numero in futuros.items():
+        if futuro.done() and not futuro.cancelled() and futuro.exception() is None:
+            calculados.update(futuro.result())
+        elif numero not in corriendo:
+            otra_ronda.append(grupos[numero])
+        else:
+            sin_terminar.append(grupos[numero])
+
+    if (colgado or caido) and not sin_terminar:
+        # no se sabe cuál fue (ej: murió antes de marcar su grupo): cada uno solo
+        return [], [item for grupo in otra_ronda for item in grupo]
+    for grupo in sin_terminar:
+        if len(grupo) > 1:
+            # la culpable está en el grupo: sus expresiones van de a una en la próxima ronda
+            otra_ronda.extend([item] for item in grupo)
+        elif colgado:
+            # sin terminar ningún grupo en `espera`: todos los que corrían superaron su tiempo
+            calculados[grupo[0][0]] = _tiempo_agotado(timeout)
+        elif len(sin_terminar) == 1:
+            calculados[grupo[0][0]] = _worker_caido()
+        else:
+            # al romperse el pool se matan todos los workers: no se sabe cuál murió primero
+            sospechosos.extend(grupo)
+    return otra_ronda, sospechosos
+
+
+def _ejecutar_grupos(grupos, procesos, argumentos):
+    """
+    Corre los grupos en paralelo. Si un worker se cuelga o muere, solo los
+    grupos que estaban corriendo se reparten de a una expresión y todo lo
+    pendiente sigue en un pool nuevo, también en paralelo.
+
+    Returns:
+        dict {indice: ParseResult}
+    """
+    calculados = {}
+    sospechosos = []
+    while grupos:
+        grupos, nuevos = _ronda(grupos, procesos, argumentos, calculados)
+        sospechosos.extend(nuevos)
+    if sospechosos:
+        calculados.update(_reintentar_de_a_una(sospechosos, argumentos, argumentos[-1] + 5))
+    return calculados
+
+
+def _reintentar_de_a_una(items, argumentos, espera):
+    """Reintenta cada expresión sola en un worker, para que el error quede solo en la culpable."""
+    calculados = {}
+    ejecutor = None
+    try:
+        for item in items:
+            if ejecutor is None:
+                ejecutor = ProcessPoolExecutor(max_workers=1)
+            futuro = ejecutor.submit(_parse_grupo, [item], *argumentos)
+            try:
+                calculados.update(futuro.result(timeout=espera))
+                continue
+            except FuturesTimeout:
+                resultado = _tiempo_agotado(argumentos[-1])
+                _terminar_pool(ejecutor)
+            except BrokenProcessPool:
+                resultado = _worker_caido()
+            ejecutor.shutdown(wait=False, cancel_futures=True)
+            ejecutor = None
+            calculados[item[0]] = resultado
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown()
+    return calculados
+
+
+@dataclass
+class ResultadoLote:
+    """Resultados de parse_many en el mismo orden de la entrada, con estadísticas."""
+    resultados: List[ParseResult]
+    estadisticas: Dict[str, Any]
+
+    def __iter__(self):
+        return iter(self.resultados)
+
+    def __len__(self):
+        return len(self.resultados)
+
+    def __getitem__(self, i):
+        return self.resultados[i]
+
+
+def parse_many(
+    expresiones: Iterable[str],
+    allowed_vars: Optional[Iterable[str]] = None,
+    simplify_strategy: Optional[str] = None,
+    validar: bool = True,
+    procesos: Optional[int] = None,
+    timeout: float = 5.0,
+    tam_grupo: int = 16,
+    limites: Optional[LimitesComplejidad] = None,
+) -> ResultadoLote:
+    """
+    Parsea (y opcionalmente simplifica y valida) muchas expresiones en un pool de procesos.
+
+    Cada expresión corre con su propio límite de tiempo y sus errores quedan
+    en su ParseResult, así una entrada patológica no frena ni rompe el lote.
+    Las que ya están en la caché de parse_function no se vuelven a parsear,
+    las repetidas se parsean una vez, y los resultados nuevos quedan en la caché.
+
+    Args:
+        expresiones: Textos a parsear
+        allowed_vars: Variables permitidas (como en parse_function)
+        simplify_strategy: Estrategia de simplificación (ver domain.simplificacion)
+        validar: Si es True, además comprueba que cada expresión compile y se pueda evaluar
+        procesos: Cantidad de workers (por defecto, núcleos)
+        timeout: Segundos máximos por expresión
+        tam_grupo: Expresiones por tarea enviada a un worker
+        limites: Límites de complejidad (como en parse_function)
+
+    Returns:
+        ResultadoLote con un ParseResult por expresión (mismo orden) y
+        estadísticas: total, unicas, desde_cache, validas, errores,
+        tiempos_agotados, segundos y por_segundo
+    """
+    inicio = time.perf_counter()
+    expresiones = list(expresiones)
+    if simplify_strategy is not None and simplify_strategy not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia de simplificación no soportada: {simplify_strategy}")
+    if allowed_vars is not None:
+        allowed_vars = list(allowed_vars)
+    limites = limites or LIMITES_POR_DEFECTO
+
+    resultados: List[Optional[ParseResult]] = [None] * len(expresiones)
+    # validar cambia el resultado, por eso va en la clave junto con las opciones de parse
+    pendientes = {}
+    desde_cache = 0
+    for i, expr_str in enumerate(expresiones):
+        if not isinstance(expr_str, str):
+            resultados[i] = ParseResult(None, [], [], "La función debe ser cadena de texto.")
+            continue
+        clave = _clave_parse(expr_str, allowed_vars, None, simplify_strategy, True, True, limites)
+        if validar:
+            clave += ("validada",)
+        guardado = _cache_obtener(clave)
+        if guardado is not None:
+            resultados[i] = _copia(guardado)
+            desde_cache += 1
+        else:
+            pendientes.setdefault(clave, []).append(i)
+
+    unicas = [(indices[0], expresiones[indices[0]]) for indices in pendientes.values()]
+    grupos = [unicas[k:k + tam_grupo] for k in range(0, len(unicas), tam_grupo)]
+    calculados = {}
+    if grupos:
+        procesos = procesos or os.cpu_count() or 1
+        argumentos = (allowed_vars, simplify_strategy, validar, limites, timeout)
+        calculados = _ejecutar_grupos(grupos, procesos, argumentos)
+
+    tiempos_agotados = 0
+    for clave, indices in pendientes.items():
+        resultado = calculados[indices[0]]
+        if resultado.tipo_error is TiempoAgotado:
+            tiempos_agotados += len(indices)
+        elif resultado.tipo_error is not BrokenProcessPool:
+            # los cortes por tiempo o por un worker caído no se guardan en la caché
+            _cache_guardar(clave, resultado)
+        for i in indices:
+            resultados[i] = _copia(resultado)
+
+    segundos = time.perf_counter() - inicio
+    validas = sum(1 for r in resultados if r.is_valid)
+    estadisticas = {
+        "total": len(expresiones),
+        "unicas": len(unicas),
+        "desde_cache": desde_cache,
+        "validas": validas,
+        "errores": len(expresiones) - validas,
+        "tiempos_agotados": tiempos_agotados,
+        "segundos": segundos,
+        "por_segundo": len(expresiones) / segundos if segundos > 0 else float("inf"),
+    }
+    return ResultadoLote(resultados, estadisticas)
+
+
+def _simplificar(expr: sympy.Expr, estrategia: str):
+    return vuelo("simplify").ejecutar((expr, estrategia), lambda: simplificar(expr, estrategia))
+
+
+def _parse_function(
+    expr_str: str,
+    allowed_vars: Optional[Iterable[str]],
+    extra_functions: Optional[Dict[str, Any]],
+    estrategia: Optional[str],
+    safe: bool,
+    implicit_multiplication: bool,
+    limites: LimitesComplejidad = LIMITES_POR_DEFECTO
 ) -> ParseResult:
     
     try:
@@ -169,9 +654,15 @@ def parse_function(
         _validate_parentheses(raw)
         preprocessed = _preprocess(raw)
 
+        # antes de parse_expr: con evaluate=True ya puede ser carísimo
+        exceso = limites.verificar(preprocessed)
+        if exceso is not None:
+            raise ComplexityError(exceso)
+
         local_dict: Dict[str, Any] = {}
         local_dict.update(DEFAULT_ALLOWED_FUNCTIONS)
         local_dict.update(DEFAULT_CONSTANTS)
+        local_dict.update(simbolos_parse())
         if extra_functions:
             local_dict.update(extra_functions)
     
@@ -206,9 +697,10 @@ def parse_function(
 
         domain_warnings = _collect_domain_warnings(expr)
 
-        if simplify_expression:
+        simplificacion = None
+        if estrategia is not None:
             try:
-                expr = sympy.simplify(expr)
+                expr, simplificacion = _simplificar(expr, estrategia)
             except Exception:
                 domain_warnings.append("No se pudo simplificar (ignorado).")
 
@@ -217,12 +709,15 @@ def parse_function(
         if allowed_vars is not None:
             vars_final = [v for v in vars_final if v in allowed_vars]
 
-        return ParseResult(expr=expr, variables=vars_final, warnings=domain_warnings, error=None)
+        racional = detectar_racional(expr) if vars_final == ["x"] else None
+
+        return ParseResult(expr=expr, variables=vars_final, warnings=domain_warnings, error=None,
+                           simplificacion=simplificacion, racional=racional)
 
     except EmptyExpressionError as e:
-        return ParseResult(None, [], [], str(e))
+        return ParseResult(None, [], [], str(e), tipo_error=type(e))
     except ParseError as e:
-        return ParseResult(None, [], [], str(e))
+        return ParseResult(None, [], [], str(e), tipo_error=type(e))
     except Exception as e:
         return ParseResult(None, [], [], f"Error inesperado: {e}")
 
@@ -0,0 +1,154 @@
+"""
+Camino rápido para polinomios y funciones racionales en x.
+
+La mayoría de las funciones que se ingresan son de este tipo. Para ellas no
+hace falta `continuous_domain` ni `solve`: los ceros y polos salen del
+aislamiento exacto de raíces reales del numerador y el denominador, el
+dominio son los reales menos los polos y la evaluación es Horner con numpy.
+Solo se usa con coeficientes enteros o racionales (raíces exactas).
+
+Horner trabaja con los coeficientes expandidos, así que solo se usa para
+evaluar si la expresión ya venía expandida (`FuncionRacional.expandida`):
+con una forma factorizada como (x - 1)**10 la expansión cancela términos
+grandes cerca de las raíces y se pierde toda la precisión.
+"""
+from functools import lru_cache
+from typing import List, Optional
+
+import numpy as np
+import sympy
+
+
+x = sympy.Symbol('x')
+
+
+def _raices_reales(poly: sympy.Poly) -> List[sympy.Expr]:
+    # real_roots repite las raices segun su multiplicidad y las entrega ordenadas
+    if poly.degree() <= 0:
+        return []
+    raices = []
+    for r in sympy.real_roots(poly):
+        if r not in raices:
+            raices.append(r)
+    return raices
+
+
+def horner(coeficientes: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """Evalúa el polinomio (coeficientes de mayor a menor grado) en todos los xs."""
+    resultado = np.zeros_like(xs)
+    for c in coeficientes:
+        resultado = resultado * xs + c
+    return resultado
+
+
+class FuncionRacional:
+    """
+    Función p(x)/q(x) con p y q polinomios de coeficientes racionales.
+
+    `expandida` indica si p y q se ingresaron ya expandidos; si no, Horner no
+    coincide con la expresión original cerca de sus raíces y no debe usarse
+    para evaluar (polos, ceros y asíntotas son exactos igual).
+    """
+
+    def __init__(self, numerador: sympy.Poly, denominador: sympy.Poly, expandida: bool = True):
+        self.numerador = numerador
+        self.denominador = denominador
+        self.expandida = expandida
+        self.coef_num = np.array([float(c) for c in numerador.all_coeffs()], dtype=np.float64)
+        self.coef_den = np.array([float(c) for c in denominador.all_coeffs()], dtype=np.float64)
+        self._polos = None
+        self._ceros = None
+        self._verticales = None
+
+    @property
+    def es_polinomio(self) -> bool:
+        return self.denominador.degree() == 0
+
+    def evaluar(self, xs) -> np.ndarray:
+        """Horner vectorizado; NaN donde el denominador se anula."""
+        xs = np.asarray(xs, dtype=np.float64)
+        with np.errstate(all="ignore"):
+            num = horner(self.coef_num, xs)
+            if self.es_polinomio:
+                return num / self.coef_den[0]
+            den = horner(self.coef_den, xs)
+            return np.where(den == 0, np.nan, num / den)
+
+    def polos(self) -> List[sympy.Expr]:
+        """Raíces reales del denominador (puntos fuera del dominio), exactas."""
+        if self._polos is None:
+            self._polos = _raices_reales(self.denominador)
+        return self._polos
+
+    def ceros(self) -> List[sympy.Expr]:
+        """Raíces reales de f: las del numerador que no anulan también el denominador."""
+        if self._ceros is None:
+            polos = self.polos()
+            self._ceros = [r for r in _raices_reales(self.numerador) if r not in polos]
+        return self._ceros
+
+    def asintotas_verticales(self) -> List[sympy.Expr]:
+        """Polos que no se cancelan con el numerador (los otros son huecos removibles)."""
+        if self._verticales is None:
+            reducido = self.denominador.quo(self.denominador.gcd(self.numerador))
+            self._verticales = _raices_reales(reducido)
+        return self._verticales
+
+    def asintota_infinito(self) -> Optional[tuple]:
+        """
+        Asíntota en ±∞ (es la misma en los dos lados), por grados y división.
+
+        Returns:
+            ("horizontal", L), ("oblicua", m, b), o None si crece más rápido
+            que una recta o si es un polinomio (una recta o una constante no
+            tiene asíntota: sería ella misma)
+        """
+        comun = self.denominador.gcd(self.numerador)
+        # (x**2 - 1)/(x - 1) también es un polinomio, con un hueco
+        if self.denominador.quo(comun).degree() == 0:
+            return None
+        grado_num = self.numerador.degree()
+        grado_den = self.denominador.degree()
+        if grado_num < grado_den:
+            return ("horizontal", sympy.Integer(0))
+        if grado_num == grado_den:
+            return ("horizontal", self.numerador.LC() / self.denominador.LC())
+        if grado_num == grado_den + 1:
+            cociente, _ = self.numerador.div(self.denominador)
+            m, b = cociente.all_coeffs()
+            return ("oblicua", m, b)
+        return None
+
+    def dominio(self) -> sympy.Set:
+        polos = self.polos()
+        if not polos:
+            return sympy.S.Reals
+        return sympy.Complement(sympy.S.Reals, sympy.FiniteSet(*polos))
+
+
+@lru_cache(maxsize=512)
+def detectar_racional(expr, variable=x) -> Optional[FuncionRacional]:
+    """
+    Devuelve la FuncionRacional de `expr`, o None si no es polinomio/racional
+    en `variable` con coeficientes racionales.
+    """
+    if expr is None or not expr.free_symbols <= {variable}:
+        return None
+    try:
+        if not expr.is_rational_function(variable):
+            return None
+        # together junta sin cancelar factores, asi los polos "removibles"
+        # (ej: (x**2 - 1)/(x - 1) en x = 1) siguen fuera del dominio
+        num, den = sympy.fraction(sympy.together(expr))
+        p = sympy.Poly(num, variable)
+        q = sympy.Poly(den, variable)
+    except (sympy.PolynomialError, TypeError, ValueError):
+        return None
+    if q.is_zero:
+        return None
+    for poly in (p, q):
+        dominio = poly.get_domain()
+        if not (dominio.is_ZZ or dominio.is_QQ):
+            return None
+    expandida = sympy.expand(num) == num and sympy.expand(den) == den
+    return FuncionRacional(p, q, expandida)
@@ -0,0 +1,122 @@
+"""
+Compilación vectorizada de expresiones con distintas precisiones.
+
+- "float32": rápida, ~7 dígitos.
+- "float64": la normal, ~16 dígitos.
+- "mpmath": precisión arbitraria (lenta, punto a punto).
+- "auto": evalúa todo en float64 y solo recalcula con mpmath los puntos mal
+  condicionados (cancelación catastrófica, ej: exp(x) - 1 - x cerca de 0).
+
+Para detectar esos puntos se evalúa también en float32: donde float32 y
+float64 difieren mucho es porque la expresión está perdiendo dígitos, y a
+float64 le pasa lo mismo aunque se note menos.
+"""
+from typing import Callable, List
+
+import os
+import sys
+
+import mpmath
+import numpy as np
+import sympy
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.funciones import modulos_lambdify
+
+
+PRECISIONES = ("float32", "float64", "mpmath", "auto")
+
+DPS_MPMATH = 50
+# diferencia relativa float32/float64 desde la cual un punto se recalcula
+TOLERANCIA_AUTO = 1e-2
+_MAX_FLOAT32 = float(np.finfo(np.float32).max)
+
+
+def _a_real(val, dtype):
+    val = np.asarray(val)
+    if np.iscomplexobj(val):
+        # parte imaginaria distinta de 0 -> fuera del dominio real
+        val = np.where(val.imag == 0, val.real, np.nan)
+    return val.astype(dtype, copy=False)
+
+
+def _compilar_numpy(expr, simbolos, dtype) -> Callable:
+    f = sympy.lambdify(simbolos, expr, modules=modulos_lambdify(["numpy"]))
+
+    def evaluar(*arreglos):
+        arreglos = [np.asarray(a, dtype=dtype) for a in arreglos]
+        with np.errstate(all="ignore"):
+            val = _a_real(f(*arreglos), dtype)
+        return np.broadcast_to(val, np.broadcast(*arreglos).shape)
+
+    return evaluar
+
+
+def _compilar_mpmath(expr, simbolos, dps) -> Callable:
+    f = sympy.lambdify(simbolos, expr, modules=modulos_lambdify(["mpmath"]))
+
+    def evaluar(*arreglos):
+        arreglos = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in arreglos])
+        forma = arreglos[0].shape if arreglos else ()
+        planos = [a.ravel().tolist() for a in arreglos]
+        salida = np.empty(int(np.prod(forma)), dtype=np.float64)
+        with mpmath.workdps(dps):
+            for i, valores in enumerate(zip(*planos)):
+                try:
+                    v = f(*[mpmath.mpf(a) for a in valores])
+                    if isinstance(v, mpmath.mpc):
+                        v = v.real if v.imag == 0 else mpmath.nan
+                    salida[i] = float(v)
+                except (ValueError, ZeroDivisionError, TypeError, OverflowError):
+                    salida[i] = np.nan
+        return salida.reshape(forma)
+
+    return evaluar
+
+
+def _compilar_auto(expr, simbolos, dps, tolerancia) -> Callable:
+    f32 = _compilar_numpy(expr, simbolos, np.float32)
+    f64 = _compilar_numpy(expr, simbolos, np.float64)
+    fmp = _compilar_mpmath(expr, simbolos, dps)
+
+    def evaluar(*arreglos):
+        arreglos = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in arreglos])
+        y64 = np.array(f64(*arreglos), dtype=np.float64)
+        y32 = np.asarray(f32(*arreglos), dtype=np.float64)
+
+        with np.errstate(all="ignore"):
+            diferencia = np.abs(y32 - y64) / np.maximum(np.abs(y64), np.finfo(np.float32).tiny)
+        # si no cabe en float32 no se puede comparar (overflow, no cancelacion)
+        comparable = np.isfinite(y64) & (np.abs(y64) < _MAX_FLOAT32)
+        dudosos = comparable & (~np.isfinite(y32) | (diferencia > tolerancia))
+        evaluar.ultimos_recalculados = int(dudosos.sum())
+
+        if dudosos.any():
+            y64[dudosos] = fmp(*[a[dudosos] for a in arreglos])
+        return y64
+
+    evaluar.ultimos_recalculados = 0
+    return evaluar
+
+
+def compilar_vectorizado(expr: sympy.Expr, simbolos: List[sympy.Symbol], precision: str = "float64",
+                         dps: int = DPS_MPMATH, tolerancia: float = TOLERANCIA_AUTO) -> Callable:
+    """
+    Compila `expr` a un callable sobre arreglos numpy (NaN donde no está definida).
+
+    Args:
+        expr: Expresión sympy
+        simbolos: Símbolos en el orden de los argumentos
+        precision: Una de PRECISIONES
+        dps: Dígitos decimales para mpmath ("mpmath" y "auto")
+        tolerancia: Diferencia relativa float32/float64 para recalcular ("auto")
+    """
+    if precision == "float32":
+        return _compilar_numpy(expr, simbolos, np.float32)
+    if precision == "float64":
+        return _compilar_numpy(expr, simbolos, np.float64)
+    if precision == "mpmath":
+        return _compilar_mpmath(expr, simbolos, dps)
+    if precision == "auto":
+        return _compilar_auto(expr, simbolos, dps, tolerancia)
+    raise ValueError(f"Precisión no soportada: {precision}. Opciones: {PRECISIONES}")
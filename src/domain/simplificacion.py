@@ -0,0 +1,79 @@
+"""
+Estrategias de simplificación con costo acotado.
+
+`sympy.simplify` prueba de todo y puede tardar mucho; la mayoría de las
+expresiones que se grafican se arreglan con algo más barato. Las estrategias,
+de la más barata a la más cara:
+
+- "ninguna": deja la expresión como está.
+- "racional": junta fracciones y cancela factores comunes (together + cancel).
+- "polinomial": expande productos y potencias (expand).
+- "trigonometrica": identidades trigonométricas (trigsimp).
+- "completa": sympy.simplify.
+- "auto": la primera de racional/polinomial/trigonometrica que baje count_ops;
+  si ninguna lo logra, la expresión queda igual.
+"""
+import os
+import sys
+from typing import Tuple
+
+import sympy
+from sympy.functions.elementary.hyperbolic import HyperbolicFunction
+from sympy.functions.elementary.trigonometric import TrigonometricFunction
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.tiempo import limite_de_tiempo, TiempoAgotado
+
+
+ESTRATEGIAS = ("ninguna", "racional", "polinomial", "trigonometrica", "completa", "auto")
+
+# tiempo máximo por estrategia dentro de "auto" (segundos)
+PRESUPUESTO_AUTO = 0.5
+
+
+def _racional(expr):
+    return sympy.cancel(sympy.together(expr))
+
+
+def _trigonometrica(expr):
+    if not expr.has(TrigonometricFunction, HyperbolicFunction):
+        return expr
+    return sympy.trigsimp(expr)
+
+
+_APLICAR = {
+    "ninguna": lambda expr: expr,
+    "racional": _racional,
+    "polinomial": sympy.expand,
+    "trigonometrica": _trigonometrica,
+    "completa": sympy.simplify,
+}
+
+# orden de prueba en "auto" (de más barata a más cara)
+_ORDEN_AUTO = ("racional", "polinomial", "trigonometrica")
+
+
+def simplificar(expr: sympy.Expr, estrategia: str = "auto", presupuesto: float = PRESUPUESTO_AUTO) -> Tuple[sympy.Expr, str]:
+    """
+    Simplifica `expr` con la estrategia pedida.
+
+    Returns:
+        (expresión, estrategia usada). En "auto" la estrategia usada es la
+        que se eligió, o "ninguna" si ninguna redujo count_ops.
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia no soportada: {estrategia}. Opciones: {ESTRATEGIAS}")
+
+    if estrategia != "auto":
+        return _APLICAR[estrategia](expr), estrategia
+
+    costo_original = sympy.count_ops(expr)
+    for candidata in _ORDEN_AUTO:
+        try:
+            with limite_de_tiempo(presupuesto):
+                resultado = _APLICAR[candidata](expr)
+        except TiempoAgotado:
+            continue
+        if sympy.count_ops(resultado) < costo_original:
+            return resultado, candidata
+    return expr, "ninguna"
@@ -0,0 +1,85 @@
+"""
+Límites de tiempo para trabajo simbólico (simplify, solve, límites...).
+
+Usa SIGALRM, así que solo corta de verdad en el hilo principal de un proceso
+Unix (por ejemplo dentro de los workers de un ProcessPoolExecutor). En otros
+hilos o en Windows el bloque corre sin límite.
+"""
+from contextlib import contextmanager
+import signal
+import threading
+import time
+
+
+class TiempoAgotado(BaseException):
+    """
+    Se acabó el tiempo asignado a un cálculo.
+
+    Hereda de BaseException (como KeyboardInterrupt) para que los
+    `except Exception` del análisis no se lo traguen.
+    """
+
+
+# plazos (time.monotonic) de los límites abiertos, del más externo al más interno
+_plazos = []
+
+# mientras un límite arma o desarma la alarma, la que llegue se ignora (si no,
+# _plazos queda desparejo); al terminar de ajustar se vuelve a revisar el plazo
+_ajustando = False
+
+
+def _puede_usar_alarma() -> bool:
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+def _al_vencer(signum, frame):
+    if not _ajustando:
+        raise TiempoAgotado("Se acabó el tiempo asignado al cálculo.")
+
+
+@contextmanager
+def limite_de_tiempo(segundos):
+    """
+    Lanza TiempoAgotado si el bloque tarda más de `segundos`.
+
+    Se puede anidar: el límite interno nunca alarga al externo, y al salir se
+    restaura lo que le quedaba al externo. Si código de adentro atrapa el
+    TiempoAgotado de un límite externo (ej: un cálculo que da "desconocido"
+    cuando se le acaba su presupuesto), el externo no se pierde: los límites
+    que se abran después saltan enseguida y el bloque externo lanza
+    TiempoAgotado al terminar.
+    """
+    global _ajustando
+    if segundos is None or not _puede_usar_alarma():
+        yield
+        return
+
+    ahora = time.monotonic()
+    plazo = ahora + segundos
+    if _plazos:
+        if ahora >= _plazos[-1]:
+            raise TiempoAgotado("Se acabó el tiempo asignado al cálculo.")
+        plazo = min(plazo, _plazos[-1])
+    _ajustando = True
+    _plazos.append(plazo)
+    anterior = signal.signal(signal.SIGALRM, _al_vencer)
+    signal.setitimer(signal.ITIMER_REAL, max(plazo - time.monotonic(), 1e-6))
+    _ajustando = False
+    try:
+        if time.monotonic() >= plazo:
+            # la alarma llegó mientras se armaba
+            raise TiempoAgotado("Se acabó el tiempo asignado al cálculo.")
+        yield
+    finally:
+        _ajustando = True
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, anterior)
+        _plazos.pop()
+        if _plazos:
+            # si al externo ya no le queda tiempo, que salte apenas se pueda
+            signal.setitimer(signal.ITIMER_REAL, max(_plazos[-1] - time.monotonic(), 1e-6))
+        _ajustando = False
+    if time.monotonic() >= plazo:
+        # el bloque terminó, pero porque alguien adentro se tragó el TiempoAgotado
+        # (o la alarma llegó mientras se desarmaba)
+        raise TiempoAgotado("Se acabó el tiempo asignado al cálculo.")
@@ -0,0 +1,410 @@
+"""
+Curvas paramétricas (x(t), y(t)) e implícitas F(x, y) = 0.
+
+- Paramétricas: se muestrea t en una grilla uniforme (evaluación vectorizada)
+  y luego se subdividen, nivel por nivel, solo los tramos que doblan mucho o
+  que quedan largos en pantalla; todos los puntos nuevos de un nivel se
+  evalúan en una sola llamada. Donde la curva salta (ej: tan(t)) se corta.
+- Implícitas: F se evalúa sobre una grilla por franjas de filas (la memoria
+  no depende de la resolución total) y cada franja se pasa por marching
+  squares vectorizado, que entrega los trozos de recta donde F cambia de signo.
+"""
+import os
+import sys
+from typing import Optional, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.parser import ParseResult, parse_function
+from graphics.muestreo import MuestrasCurva, TAM_BLOQUE
+
+
+# Paramétricas
+
+PUNTOS_PARAMETRICA = 1000
+NIVELES_REFINAMIENTO = 12
+MAX_PUNTOS_PARAMETRICA = 200_000
+# ángulo (radianes) entre tramos consecutivos a partir del cual se subdivide
+ANGULO_MAX = 0.05
+# largo máximo de un tramo, con la vista escalada a un cuadrado de lado 1
+LARGO_MAX = 0.01
+# un tramo que sigue más largo que esto (misma escala) después de refinar es un salto
+SALTO = 0.25
+
+
+class CurvaParametrica(MuestrasCurva):
+    """
+    Curva (x(t), y(t)) muestreada; como MuestrasCurva, con el parámetro en `t`.
+
+    Los puntos donde x o y no están definidas quedan NaN en ambos arreglos y
+    `limites` separa los tramos entre los que la curva salta. `vista` es el
+    ((xmin, xmax), (ymin, ymax)) con que se refinó.
+    """
+
+    def __init__(self, t, x, y, limites, vista=None):
+        super().__init__(x, y, limites)
+        self.t = np.ascontiguousarray(t, dtype=np.float64)
+        self.vista = vista
+
+    @property
+    def nbytes(self):
+        return super().nbytes + self.t.nbytes
+
+    def diezmar(self, columnas, rango_x=None):
+        # x no es creciente, así que no se puede reducir por columna de píxel;
+        # la cantidad de puntos ya la limita el refinamiento adaptativo
+        return self
+
+
+def separar_parametrica(texto: str) -> Optional[Tuple[str, str]]:
+    """
+    Separa "(x(t), y(t))" (paréntesis opcionales) en sus dos componentes.
+
+    Returns:
+        (texto_x, texto_y), o None si no hay exactamente dos componentes
+    """
+    texto = texto.strip()
+    if texto.startswith("(") and texto.endswith(")"):
+        # solo si el primer paréntesis cierra al final: "(t)*2, t" no se toca
+        nivel = 0
+        for i, c in enumerate(texto):
+            nivel += c == "("
+            nivel -= c == ")"
+            if nivel == 0:
+                break
+        if i == len(texto) - 1:
+            texto = texto[1:-1]
+    partes = []
+    nivel = 0
+    inicio = 0
+    for i, c in enumerate(texto):
+        if c in "([":
+            nivel += 1
+        elif c in ")]":
+            nivel -= 1
+        elif c == "," and nivel == 0:
+            partes.append(texto[inicio:i])
+            inicio = i + 1
+    partes.append(texto[inicio:])
+    partes = [p.strip() for p in partes]
+    if len(partes) != 2 or not all(partes):
+        return None
+    return partes[0], partes[1]
+
+
+def _funcion_de(parse_result: ParseResult, nombres):
+    """
+    Callable vectorizado de `parse_result` con argumentos en el orden de `nombres`.
+
+    La expresión puede no usar todas las variables (ej: x = cos(t), y = 2 o
+    F = x^2 - 1); el resultado siempre tiene la forma de los argumentos.
+    """
+    f = parse_result.to_backend("auto")
+    orden = [nombres.index(v) for v in parse_result.variables]
+
+    def evaluar(*arreglos):
+        forma = np.broadcast(*arreglos).shape
+        with np.errstate(all="ignore"):
+            valores = np.asarray(f(*[arreglos[i] for i in orden]), dtype=np.float64)
+        return np.array(np.broadcast_to(valores, forma))
+
+    return evaluar
+
+
+def parse_parametrica(texto_x: str, texto_y: str, variable: str = "t"):
+    """
+    Parsea las dos componentes de una curva paramétrica.
+
+    Returns:
+        tuple: (parse_x, parse_y); si alguna no es válida, revisar `is_valid`
+    """
+    return tuple(parse_function(texto, allowed_vars=[variable], simplify_strategy="auto")
+                 for texto in (texto_x, texto_y))
+
+
+def _rango_robusto(valores, margen=0.05):
+    finitos = valores[np.isfinite(valores)]
+    if finitos.size == 0:
+        return (-1.0, 1.0)
+    bajo, alto = np.percentile(finitos, [1, 99])
+    if alto - bajo < 1e-12:
+        bajo, alto = bajo - 1, alto + 1
+    extra = (alto - bajo) * margen
+    return (float(bajo - extra), float(alto + extra))
+
+
+def _tramos_a_refinar(x, y, vista, escala_x, escala_y, angulo_max, largo_max):
+    """Máscara (un valor por tramo) de los tramos que conviene subdividir."""
+    # en unidades de pantalla, para que el ángulo y el largo no dependan de la escala de los ejes
+    u = x / escala_x
+    v = y / escala_y
+    du = np.diff(u)
+    dv = np.diff(v)
+    largo = np.hypot(du, dv)
+    finito = np.isfinite(u) & np.isfinite(v)
+    finito_tramo = finito[:-1] & finito[1:]
+
+    with np.errstate(invalid="ignore"):
+        marcar = finito_tramo & (largo > largo_max)
+        # donde empieza o termina el dominio, para encontrar el borde
+        marcar |= finito[:-1] != finito[1:]
+
+        # giro en cada punto interior entre dos tramos válidos
+        cruz = du[:-1] * dv[1:] - dv[:-1] * du[1:]
+        punto = du[:-1] * du[1:] + dv[:-1] * dv[1:]
+        angulo = np.arctan2(np.abs(cruz), punto)
+        dobla = finito_tramo[:-1] & finito_tramo[1:] & (angulo > angulo_max)
+        # sin un largo mínimo una punta (ej: astroide) se subdividiría hasta el último nivel
+        dobla &= np.maximum(largo[:-1], largo[1:]) > largo_max / 100
+        marcar[:-1] |= dobla
+        marcar[1:] |= dobla
+
+    return marcar & ~_afuera(x, y, vista), largo
+
+
+def _afuera(x, y, vista):
+    """Tramos enteros fuera de la vista por un mismo lado (no se ven)."""
+    (x0, x1), (y0, y1) = vista
+    with np.errstate(invalid="ignore"):
+        return (((x[:-1] < x0) & (x[1:] < x0)) | ((x[:-1] > x1) & (x[1:] > x1))
+                | ((y[:-1] < y0) & (y[1:] < y0)) | ((y[:-1] > y1) & (y[1:] > y1)))
+
+
+def muestrear_parametrica(fx, fy, rango_t, puntos=PUNTOS_PARAMETRICA, rango_x=None, rango_y=None,
+                          niveles=NIVELES_REFINAMIENTO, max_puntos=MAX_PUNTOS_PARAMETRICA,
+                          angulo_max=ANGULO_MAX, largo_max=LARGO_MAX) -> CurvaParametrica:
+    """
+    Muestrea (fx(t), fy(t)) con refinamiento adaptativo.
+
+    Args:
+        fx, fy: Callables vectorizados de t
+        rango_t: Tupla (min, max) del parámetro
+        puntos: Subdivisiones de la grilla inicial
+        rango_x, rango_y: Vista (define qué es "largo" y qué no se ve);
+            por defecto se toma de la grilla inicial
+        niveles: Máximo de rondas de subdivisión
+        max_puntos: Tope de puntos; si se llega, se subdividen primero los tramos más largos
+        angulo_max: Giro (radianes) entre tramos consecutivos que se acepta sin subdividir
+        largo_max: Largo máximo de un tramo como fracción del ancho/alto de la vista
+    """
+    t = np.linspace(rango_t[0], rango_t[1], puntos + 1)
+    x = fx(t)
+    y = fy(t)
+    vista = (rango_x or _rango_robusto(x), rango_y or _rango_robusto(y))
+    escala_x = (vista[0][1] - vista[0][0]) or 1.0
+    escala_y = (vista[1][1] - vista[1][0]) or 1.0
+
+    for _ in range(niveles):
+        marcar, largo = _tramos_a_refinar(x, y, vista, escala_x, escala_y, angulo_max, largo_max)
+        indices = np.flatnonzero(marcar)
+        disponibles = max_puntos - len(t)
+        if indices.size > disponibles:
+            orden = np.argsort(np.nan_to_num(largo[indices], nan=np.inf))[::-1]
+            indices = np.sort(indices[orden[:max(disponibles, 0)]])
+        if not indices.size:
+            break
+        tm = (t[indices] + t[indices + 1]) / 2
+        # todos los puntos nuevos del nivel en una sola evaluación
+        xm = fx(tm)
+        ym = fy(tm)
+        t = np.insert(t, indices + 1, tm)
+        x = np.insert(x, indices + 1, xm)
+        y = np.insert(y, indices + 1, ym)
+
+    invalido = ~(np.isfinite(x) & np.isfinite(y))
+    x[invalido] = np.nan
+    y[invalido] = np.nan
+
+    # lo que sigue largo después de refinar no es curva sino un salto
+    with np.errstate(invalid="ignore"):
+        largo = np.hypot(np.diff(x) / escala_x, np.diff(y) / escala_y)
+    saltos = np.flatnonzero((largo > SALTO) & ~_afuera(x, y, vista)) + 1
+    limites = np.concatenate(([0], saltos, [len(t)]))
+    return CurvaParametrica(t, x, y, limites, vista)
+
+
+def muestrear_parametrica_desde_texto(texto_x, texto_y, rango_t, puntos=PUNTOS_PARAMETRICA,
+                                      rango_x=None, rango_y=None, variable="t") -> CurvaParametrica:
+    """
+    Parsea y muestrea una curva paramétrica.
+
+    Raises:
+        ValueError: Si alguna componente no se puede parsear
+    """
+    parse_x, parse_y = parse_parametrica(texto_x, texto_y, variable)
+    for nombre, resultado in (("x", parse_x), ("y", parse_y)):
+        if not resultado.is_valid:
+            raise ValueError(f"Error al parsear {nombre}({variable}): {resultado.error}")
+    return muestrear_parametrica(_funcion_de(parse_x, [variable]), _funcion_de(parse_y, [variable]),
+                                 rango_t, puntos, rango_x, rango_y)
+
+
+# Implícitas
+
+RESOLUCION_IMPLICITA = 400
+
+# lados de cada celda: 0 abajo, 1 derecha, 2 arriba, 3 izquierda.
+# caso = bits de las esquinas con F > 0: 1 abajo-izq, 2 abajo-der, 4 arriba-der, 8 arriba-izq.
+# Para cada caso, hasta dos trozos (lado, lado); -1 si no hay.
+_TROZOS = np.full((16, 2, 2), -1, dtype=np.intp)
+for _caso, _trozos in {
+    1: [(3, 0)], 2: [(0, 1)], 3: [(3, 1)], 4: [(1, 2)],
+    5: [(3, 0), (1, 2)], 6: [(0, 2)], 7: [(3, 2)], 8: [(2, 3)],
+    9: [(0, 2)], 10: [(0, 1), (2, 3)], 11: [(1, 2)], 12: [(3, 1)],
+    13: [(0, 1)], 14: [(3, 0)],
+}.items():
+    for _i, _trozo in enumerate(_trozos):
+        _TROZOS[_caso, _i] = _trozo
+# casos ambiguos (esquinas opuestas con el mismo signo) cuando el centro tiene
+# el signo de las esquinas positivas: quedan unidas y se aíslan las negativas
+_TROZOS_SILLA = {5: [(0, 1), (2, 3)], 10: [(3, 0), (1, 2)]}
+
+
+def marching_squares(xs, ys, valores) -> np.ndarray:
+    """
+    Trozos de recta donde `valores` cambia de signo (marching squares vectorizado).
+
+    Args:
+        xs: Coordenadas de las columnas (largo nx)
+        ys: Coordenadas de las filas (largo ny)
+        valores: F en la grilla, forma (ny, nx); las celdas con NaN se saltan
+
+    Returns:
+        Arreglo (n, 2, 2): n trozos de dos puntos (x, y)
+    """
+    v00 = valores[:-1, :-1]   # abajo-izquierda
+    v10 = valores[:-1, 1:]    # abajo-derecha
+    v11 = valores[1:, 1:]     # arriba-derecha
+    v01 = valores[1:, :-1]    # arriba-izquierda
+    caso = ((v00 > 0) * 1 + (v10 > 0) * 2 + (v11 > 0) * 4 + (v01 > 0) * 8).astype(np.intp)
+    finitas = np.isfinite(v00) & np.isfinite(v10) & np.isfinite(v11) & np.isfinite(v01)
+    fila, columna = np.nonzero(finitas & (caso != 0) & (caso != 15))
+    if not fila.size:
+        return np.empty((0, 2, 2))
+
+    a, b, c, d = v00[fila, columna], v10[fila, columna], v11[fila, columna], v01[fila, columna]
+    x0, x1 = xs[columna], xs[columna + 1]
+    y0, y1 = ys[fila], ys[fila + 1]
+
+    def cruce(p, q):
+        # fracción del lado donde la interpolación lineal vale 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.clip(np.nan_to_num(p / (p - q), nan=0.5), 0.0, 1.0)
+
+    # punto de cruce en cada lado (solo se usan los de los lados con cambio de signo)
+    lados = np.empty((fila.size, 4, 2))
+    lados[:, 0, 0] = x0 + (x1 - x0) * cruce(a, b)
+    lados[:, 0, 1] = y0
+    lados[:, 1, 0] = x1
+    lados[:, 1, 1] = y0 + (y1 - y0) * cruce(b, c)
+    lados[:, 2, 0] = x0 + (x1 - x0) * cruce(d, c)
+    lados[:, 2, 1] = y1
+    lados[:, 3, 0] = x0
+    lados[:, 3, 1] = y0 + (y1 - y0) * cruce(a, d)
+
+    caso = caso[fila, columna]
+    trozos = _TROZOS[caso].copy()
+    centro_positivo = (a + b + c + d) > 0
+    for caso_silla, silla in _TROZOS_SILLA.items():
+        cambiar = (caso == caso_silla) & centro_positivo
+        trozos[cambiar] = silla
+
+    partes = []
+    filas = np.arange(fila.size)
+    for i in range(2):
+        validos = trozos[:, i, 0] >= 0
+        f = filas[validos]
+        partes.append(np.stack((lados[f, trozos[validos, i, 0]], lados[f, trozos[validos, i, 1]]), axis=1))
+    return np.concatenate(partes)
+
+
+def contorno_implicito(funcion, rango_x, rango_y, resolucion=RESOLUCION_IMPLICITA,
+                       tam_bloque=TAM_BLOQUE, verificar=True) -> np.ndarray:
+    """
+    Trozos de la curva F(x, y) = 0 dentro de la vista.
+
+    F se evalúa por franjas de filas de a lo más `tam_bloque` puntos (cada
+    franja repite la última fila de la anterior), así una grilla fina no
+    necesita tener todos los valores en memoria a la vez.
+
+    Args:
+        funcion: Callable vectorizado F(x, y)
+        rango_x, rango_y: Tuplas (min, max)
+        resolucion: Celdas por eje: un entero o (nx, ny)
+        tam_bloque: Máximo de puntos evaluados por franja
+        verificar: Si es True, se descartan los trozos donde F no pasa por
+            cero sino que salta de signo (ej: 1/x - y cerca de x = 0); se
+            detectan evaluando F en el punto medio de cada trozo
+
+    Returns:
+        Arreglo (n, 2, 2) de trozos de dos puntos (x, y)
+    """
+    if isinstance(resolucion, int):
+        nx = ny = resolucion
+    else:
+        nx, ny = resolucion
+    xs = np.linspace(rango_x[0], rango_x[1], nx + 1)
+    ys = np.linspace(rango_y[0], rango_y[1], ny + 1)
+    filas_por_franja = max(tam_bloque // len(xs), 2)
+
+    partes = []
+    desde = 0
+    while desde < ny:
+        hasta = min(desde + filas_por_franja - 1, ny)
+        X, Y = np.meshgrid(xs, ys[desde:hasta + 1])
+        valores = funcion(X, Y)
+        trozos = marching_squares(xs, ys[desde:hasta + 1], valores)
+        if verificar and len(trozos):
+            trozos = _descartar_saltos(funcion, trozos, xs, ys[desde:hasta + 1], valores)
+        partes.append(trozos)
+        desde = hasta
+    if not partes:
+        return np.empty((0, 2, 2))
+    return np.concatenate(partes)
+
+
+def _descartar_saltos(funcion, trozos, xs, ys, valores):
+    # en un cruce de verdad |F| en el medio del trozo es chico comparado con las
+    # esquinas de la celda; al atravesar un polo es más grande que todas ellas
+    medio = trozos.mean(axis=1)
+    columna = np.clip(np.searchsorted(xs, medio[:, 0]) - 1, 0, len(xs) - 2)
+    fila = np.clip(np.searchsorted(ys, medio[:, 1]) - 1, 0, len(ys) - 2)
+    esquinas = np.maximum.reduce([np.abs(valores[fila, columna]), np.abs(valores[fila, columna + 1]),
+                                  np.abs(valores[fila + 1, columna]), np.abs(valores[fila + 1, columna + 1])])
+    en_medio = np.abs(funcion(medio[:, 0], medio[:, 1]))
+    with np.errstate(invalid="ignore"):
+        return trozos[~(en_medio > esquinas)]
+
+
+def separar_implicita(texto: str) -> str:
+    """
+    Convierte "izquierda = derecha" en "(izquierda) - (derecha)"; sin "=" se toma F = texto.
+
+    Raises:
+        ValueError: Si hay más de un "="
+    """
+    partes = texto.split("=")
+    if len(partes) == 1:
+        return texto.strip()
+    if len(partes) != 2 or not partes[0].strip() or not partes[1].strip():
+        raise ValueError("La ecuación debe tener la forma izquierda = derecha")
+    return f"({partes[0].strip()}) - ({partes[1].strip()})"
+
+
+def parse_implicita(texto: str) -> ParseResult:
+    """Parsea F(x, y) de una ecuación "izquierda = derecha" (o de F sola)."""
+    return parse_function(separar_implicita(texto), allowed_vars=['x', 'y'], simplify_strategy="auto")
+
+
+def contorno_implicito_desde_texto(texto, rango_x, rango_y, resolucion=RESOLUCION_IMPLICITA) -> np.ndarray:
+    """
+    Parsea una ecuación en x e y y devuelve los trozos de su curva (ver contorno_implicito).
+
+    Raises:
+        ValueError: Si la ecuación no se puede parsear
+    """
+    resultado = parse_implicita(texto)
+    if not resultado.is_valid:
+        raise ValueError(f"Error al parsear la ecuación: {resultado.error}")
+    return contorno_implicito(_funcion_de(resultado, ['x', 'y']), rango_x, rango_y, resolucion)
@@ -0,0 +1,178 @@
+"""
+Exportación de curvas muestreadas y evaluaciones por lote.
+
+Los datos se escriben por bloques directo desde el muestreador, sin armar la
+curva completa en memoria:
+
+- .npy: arreglo estructurado (x, y, valido) escrito en un archivo mapeado en
+  memoria (np.lib.format.open_memmap). Los límites de segmento van en un
+  segundo archivo `<nombre>_segmentos.npy` (inicio de cada intervalo continuo
+  y el total al final, igual que MuestrasCurva.limites).
+- .csv: columnas x, y, valido, segmento; se escribe bloque a bloque.
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from graphics.muestreo import iterar_muestras, BloqueMuestras, TAM_BLOQUE
+
+
+DTYPE_MUESTRA = np.dtype([("x", "<f8"), ("y", "<f8"), ("valido", "?")])
+FORMATOS = ("npy", "csv")
+
+
+def _formato(ruta, formato):
+    if formato is None:
+        formato = os.path.splitext(ruta)[1].lstrip(".").lower()
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}. Opciones: {FORMATOS}")
+    return formato
+
+
+def ruta_segmentos(ruta):
+    """Archivo donde se guardan los límites de segmento de un .npy exportado."""
+    base, _ = os.path.splitext(ruta)
+    return f"{base}_segmentos.npy"
+
+
+def _escribir_npy(ruta, bloques, total):
+    # open_memmap escribe el encabezado .npy y deja el archivo del tamaño final
+    salida = np.lib.format.open_memmap(ruta, mode="w+", dtype=DTYPE_MUESTRA, shape=(total,))
+    inicio_datos = salida.offset
+    del salida
+
+    limites = []
+    pos = 0
+    validos = 0
+    segmento_actual = None
+    for bloque in bloques:
+        if bloque.segmento != segmento_actual:
+            limites.append(pos)
+            segmento_actual = bloque.segmento
+        n = len(bloque.x)
+        if pos + n > total:
+            raise ValueError(f"Llegaron más de los {total} puntos reservados")
+        # se mapea solo la ventana del bloque, asi la memoria no crece con el archivo
+        destino = np.memmap(ruta, dtype=DTYPE_MUESTRA, mode="r+",
+                            offset=inicio_datos + pos * DTYPE_MUESTRA.itemsize, shape=(n,))
+        destino["x"] = bloque.x
+        destino["y"] = bloque.y
+        destino["valido"] = bloque.mascara
+        destino.flush()
+        del destino
+        validos += int(np.count_nonzero(bloque.mascara))
+        pos += n
+    limites.append(pos)
+
+    if pos != total:
+        raise ValueError(f"Se esperaban {total} puntos y llegaron {pos}")
+    np.save(ruta_segmentos(ruta), np.asarray(limites, dtype=np.int64))
+    return pos, validos, len(limites) - 1
+
+
+def _escribir_csv(ruta, bloques):
+    pos = 0
+    validos = 0
+    segmentos = set()
+    with open(ruta, "w", encoding="utf-8", newline="", buffering=1 << 20) as archivo:
+        archivo.write("x,y,valido,segmento\n")
+        for bloque in bloques:
+            columnas = np.column_stack((
+                bloque.x,
+                bloque.y,
+                bloque.mascara.astype(np.float64),
+                np.full(len(bloque.x), bloque.segmento, dtype=np.float64),
+            ))
+            np.savetxt(archivo, columnas, delimiter=",", fmt=("%.17g", "%.17g", "%d", "%d"))
+            validos += int(np.count_nonzero(bloque.mascara))
+            pos += len(bloque.x)
+            segmentos.add(bloque.segmento)
+    return pos, validos, len(segmentos)
+
+
+def exportar_bloques(ruta, bloques, total=None, formato=None):
+    """
+    Escribe una secuencia de BloqueMuestras a disco.
+
+    Args:
+        ruta: Archivo de salida (.npy o .csv)
+        bloques: Iterable de BloqueMuestras (ej: iterar_muestras o MuestrasCurva.bloques())
+        total: Cantidad total de puntos (obligatorio para .npy, se reserva el archivo completo)
+        formato: "npy" o "csv"; por defecto según la extensión
+
+    Returns:
+        dict con ruta, puntos, validos y segmentos escritos
+    """
+    formato = _formato(ruta, formato)
+    if formato == "npy":
+        if total is None:
+            raise ValueError("Para .npy hay que indicar el total de puntos")
+        puntos, validos, segmentos = _escribir_npy(ruta, bloques, total)
+    else:
+        puntos, validos, segmentos = _escribir_csv(ruta, bloques)
+    return {"ruta": ruta, "puntos": puntos, "validos": validos, "segmentos": segmentos}
+
+
+def exportar_muestreo(ruta, funcion, intervalos, puntos=1000, formato=None, tam_bloque=TAM_BLOQUE, vectorizada=None):
+    """
+    Muestrea la función y la exporta al mismo tiempo, bloque a bloque.
+
+    Args:
+        ruta: Archivo de salida (.npy o .csv)
+        funcion: callable de una variable (escalar o vectorizado)
+        intervalos: Intervalos continuos (ver generar_intervalos_continuos)
+        puntos: Subdivisiones por intervalo
+        formato, tam_bloque, vectorizada: ver exportar_bloques e iterar_muestras
+    """
+    intervalos = [(a, b) for a, b in intervalos if a < b]
+    total = (puntos + 1) * len(intervalos)
+    bloques = iterar_muestras(funcion, None, intervalos, puntos, tam_bloque, vectorizada)
+    return exportar_bloques(ruta, bloques, total, formato)
+
+
+def exportar_muestras(ruta, muestras, formato=None, tam_bloque=TAM_BLOQUE):
+    """Exporta un MuestrasCurva ya calculado."""
+    return exportar_bloques(ruta, muestras.bloques(tam_bloque), len(muestras), formato)
+
+
+def exportar_evaluacion(ruta, funcion, xs, formato=None, tam_bloque=TAM_BLOQUE):
+    """
+    Evalúa una función vectorizada sobre `xs` (puede ser un memmap) y exporta
+    los resultados por bloques, como un solo segmento.
+    """
+    xs = np.asarray(xs)
+
+    def bloques():
+        for desde in range(0, len(xs), tam_bloque):
+            bx = np.asarray(xs[desde:desde + tam_bloque], dtype=np.float64)
+            with np.errstate(all="ignore"):
+                by = np.array(np.broadcast_to(funcion(bx), bx.shape), dtype=np.float64)
+            mascara = np.isfinite(by)
+            by[~mascara] = np.nan
+            yield BloqueMuestras(bx, by, mascara, 0)
+
+    return exportar_bloques(ruta, bloques(), len(xs), formato)
+
+
+def exportar_desde_texto(expr_str, ruta, rango_x=(-10, 10), puntos=1000, formato=None, tam_bloque=TAM_BLOQUE, allowed_vars=None):
+    """
+    Parsea, muestrea y exporta una función de texto, cortando en sus discontinuidades.
+
+    Raises:
+        ValueError: Si la expresión no se puede parsear
+    """
+    from domain.parser import parse_function
+    from graphics.graficos import detectar_discontinuidades, generar_intervalos_continuos
+
+    if allowed_vars is None:
+        allowed_vars = ['x']
+
+    parse_result = parse_function(expr_str, allowed_vars=allowed_vars, simplify_strategy="auto")
+    if not parse_result.is_valid:
+        raise ValueError(f"Error al parsear la función: {parse_result.error}")
+
+    discontinuidades = detectar_discontinuidades(parse_result, rango_x)
+    intervalos = generar_intervalos_continuos(rango_x, discontinuidades)
+    return exportar_muestreo(ruta, parse_result.to_vectorized(), intervalos, puntos, formato, tam_bloque)
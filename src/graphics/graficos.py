@@ -1,19 +1,50 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import math 
 import sys
 import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Añadir el directorio padre al path para importar el parser
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from domain.parser import parse_function, ParseResult
+from domain.derivadas import derivada_vectorizada
+from domain.asintotas import asintotas
+from graphics.muestreo import iterar_muestras, muestrear, MuestrasCurva
+from graphics.curvas import (RESOLUCION_IMPLICITA, contorno_implicito_desde_texto,
+                             muestrear_parametrica_desde_texto)
+
+# muestras por columna de píxel antes de diezmar (para no perder oscilaciones)
+MUESTRAS_POR_COLUMNA = 8
 
 
 def detectar_discontinuidades(parse_result, rango_x, tolerancia=0.01):
 
     discontinuidades = []
     
-    # Extraer puntos problemáticos de los warnings
+    # Polinomios y racionales: los polos ya se conocen exactos
+    racional = getattr(parse_result, 'racional', None)
+    if racional is not None:
+        for polo in racional.polos():
+            punto = float(polo)
+            if rango_x[0] <= punto <= rango_x[1]:
+                discontinuidades.append(punto)
+        return discontinuidades
+    
+    # Singularidades del motor de asíntotas (incluye las periódicas, ej: tan)
+    expr = getattr(parse_result, 'expr', None)
+    if expr is not None:
+        try:
+            puntos = asintotas(expr).singularidades_en(rango_x)
+        except Exception:
+            puntos = None
+        if puntos is not None:
+            return puntos
+    
+    # Respaldo: extraer puntos problemáticos de los warnings
     for warning in parse_result.warnings:
         if "≠ 0" in warning:
 
@@ -94,84 +125,74 @@ def generar_puntos_mejorado(Tipofuncion, LimitInfX, LimitSupX, discontinuidades=
     if not discontinuidades:
         return generar_puntos(Tipofuncion, LimitInfX, LimitSupX, PuntosGraf)
     
-    # Generar intervalos continuos
-    intervalos = generar_intervalos_continuos((LimitInfX, LimitSupX), discontinuidades)
+    return muestrear_funcion(Tipofuncion, LimitInfX, LimitSupX, discontinuidades, PuntosGraf).como_listas()
+
+
+def muestrear_funcion(Tipofuncion, LimitInfX, LimitSupX, discontinuidades=None, PuntosGraf=1000):
+    """
+    Muestrea la función en arreglos (MuestrasCurva), separando los intervalos continuos.
     
-    ValoresX_total = []
-    ValoresY_total = []
+    Args:
+        Tipofuncion: callable de una variable (escalar o vectorizado)
+        LimitInfX, LimitSupX: Rango de x
+        discontinuidades: Puntos donde cortar la curva (opcional)
+        PuntosGraf: Subdivisiones por intervalo
     
-    for i, (inicio, fin) in enumerate(intervalos):
-        if inicio >= fin:
-            continue
-            
-        # Generar puntos para este intervalo
-        incremento = (fin - inicio) / PuntosGraf
-        x = inicio
-        
-        intervalo_x = []
-        intervalo_y = []
-        
-        while x <= fin:
-            intervalo_x.append(x)
-            try:
-                y = Tipofuncion(x)
-                if isinstance(y, complex) or y == float('inf') or y == float('-inf') or y == float('nan'):
-                    intervalo_y.append(None)
-                else:
-                    # Filtrar valores muy grandes que podrían ser cerca de asíntotas
-                    if abs(y) > 1e6:
-                        intervalo_y.append(None)
-                    else:
-                        intervalo_y.append(y)
-                        
-            except (ValueError, ZeroDivisionError, TypeError):
-                intervalo_y.append(None)
-                
-            x += incremento
-        
-        # Agregar este intervalo a los resultados totales
-        ValoresX_total.extend(intervalo_x)
-        ValoresY_total.extend(intervalo_y)
-        
-        # Agregar separador entre intervalos (excepto el último)
-        if i < len(intervalos) - 1:
-            ValoresX_total.append(None)
-            ValoresY_total.append(None)
+    Returns:
+        MuestrasCurva con NaN en los puntos inválidos
+    """
+    if LimitInfX >= LimitSupX:
+        return MuestrasCurva.vacia()
     
-    return ValoresX_total, ValoresY_total
+    rango_x = (LimitInfX, LimitSupX)
+    if not discontinuidades:
+        return muestrear(Tipofuncion, rango_x, puntos=PuntosGraf)
+    
+    # el corte en cada discontinuidad es de un paso de la grilla: la curva llega
+    # lo más cerca posible de la asíntota y no se descartan valores grandes legítimos
+    paso = (LimitSupX - LimitInfX) / PuntosGraf
+    intervalos = generar_intervalos_continuos(rango_x, discontinuidades, gap=paso)
+    return muestrear(Tipofuncion, rango_x, intervalos, PuntosGraf)
 
 
-def generar_puntos(Tipofuncion, LimitInfX , LimitSupX , PuntosGraf=1000):
+def iterar_muestras_desde_texto(expr_str, rango_x=(-10, 10), puntos=1000, tam_bloque=65536, allowed_vars=None):
+    """
+    Muestrea una función de texto por bloques, recorriendo todos sus intervalos continuos.
     
-    ValoresX = []
-    ValoresY = []
+    Args:
+        expr_str: Expresión matemática como string
+        rango_x: Tupla con el rango de x (min, max)
+        puntos: Subdivisiones por intervalo continuo
+        tam_bloque: Máximo de muestras por bloque
+        allowed_vars: Variables permitidas (por defecto ['x'])
     
-    if LimitInfX >= LimitSupX:
-        return [] , []
+    Returns:
+        Generador de BloqueMuestras (x, y, mascara, segmento)
     
+    Raises:
+        ValueError: Si la expresión no se puede parsear
+    """
+    if allowed_vars is None:
+        allowed_vars = ['x']
     
-    incremento = (LimitSupX - LimitInfX) / PuntosGraf
+    parse_result = parse_function(expr_str, allowed_vars=allowed_vars, simplify_strategy="auto")
+    if not parse_result.is_valid:
+        raise ValueError(f"Error al parsear la función: {parse_result.error}")
     
-    x = LimitInfX
+    discontinuidades = detectar_discontinuidades(parse_result, rango_x)
+    intervalos = generar_intervalos_continuos(rango_x, discontinuidades)
+    return iterar_muestras(parse_result.to_vectorized(), rango_x, intervalos, puntos, tam_bloque)
+
+
+def generar_puntos(Tipofuncion, LimitInfX , LimitSupX , PuntosGraf=1000):
     
-    while x <= LimitSupX:
-        
-        ValoresX.append(x)
-        try:
-            y = Tipofuncion(x)
-            if isinstance(y , complex) or y == float('inf') or y == float('-inf') or y == float('nan'):
-                ValoresY.append(None)
-            else : 
-                ValoresY.append(y)
-            
-        except(ValueError, ZeroDivisionError, TypeError): #comprobar error matematico: division x 0 , etc
-            ValoresY.append(None)
-        x += incremento
+    if LimitInfX >= LimitSupX:
+        return [] , []
     
-    return ValoresX , ValoresY
+    return muestrear(Tipofuncion, (LimitInfX, LimitSupX), puntos=PuntosGraf).como_listas()
 
 
-def graficar_funcion_desde_texto(expr_str, rango_x=(-10, 10), rango_y=None, intersecciones=None, punto_evaluado=None, allowed_vars=None):
+def graficar_funcion_desde_texto(expr_str, rango_x=(-10, 10), rango_y=None, intersecciones=None, punto_evaluado=None, allowed_vars=None, tangente=False, precision=None, simplificacion="auto"):
     """
     Grafica una función a partir de una expresión de texto.
     
@@ -182,6 +203,11 @@ def graficar_funcion_desde_texto(expr_str, rango_x=(-10, 10), rango_y=None, inte
         intersecciones: Lista de puntos (x, y) para marcar intersecciones
         punto_evaluado: Tupla (x, y) para marcar un punto específico
         allowed_vars: Variables permitidas (por defecto ['x'])
+        tangente: Si es True, dibuja la recta tangente en la x bajo el mouse
+        precision: None (el backend más rápido para esta expresión y cantidad de
+            puntos, elegido midiendo; ver domain.backends) o "float32", "float64",
+            "mpmath", "auto" (evaluación vectorizada con esa precisión)
+        simplificacion: Estrategia de simplificación (ver domain.simplificacion)
     
     Returns:
         tuple: (success: bool, message: str, parse_result: ParseResult)
@@ -193,7 +219,7 @@ def graficar_funcion_desde_texto(expr_str, rango_x=(-10, 10), rango_y=None, inte
     parse_result = parse_function(
         expr_str, 
         allowed_vars=allowed_vars,
-        simplify_expression=True
+        simplify_strategy=simplificacion
     )
     
     if not parse_result.is_valid:
@@ -206,7 +232,11 @@ def graficar_funcion_desde_texto(expr_str, rango_x=(-10, 10), rango_y=None, inte
             print(f"  - {warning}")
     
     try:
-        funcion_ejecutable = parse_result.to_callable(modules=['math'])
+        if precision is None:
+            # el backend (math, numpy, horner, numexpr) se elige midiendo, ver domain.backends
+            funcion_ejecutable = parse_result.to_backend("auto")
+        else:
+            funcion_ejecutable = parse_result.to_vectorized(precision)
         
         # Adjuntar el parse_result a la función para detectar discontinuidades
         funcion_ejecutable._parse_result = parse_result
@@ -222,7 +252,8 @@ def graficar_funcion_desde_texto(expr_str, rango_x=(-10, 10), rango_y=None, inte
             intersecciones=intersecciones,
             punto_evaluado=punto_evaluado,
             rango_x=rango_x,
-            rango_y=rango_y
+            rango_y=rango_y,
+            tangente=tangente
         )
         
         return True, "Función graficada exitosamente", parse_result
@@ -329,57 +360,176 @@ def graficar_con_analisis(expr_str, rango_x=(-10, 10), mostrar_intersecciones=Tr
     print(mensaje)
 
 
-def graficar_funcion(TipoFuncion, Func_str, intersecciones=None, punto_evaluado=None, rango_x=(-10, 10), rango_y=None):
+def _columnas_ejes(ax):
+    """Ancho en píxeles de los ejes (según el tamaño y dpi de la figura)."""
+    return max(int(math.ceil(ax.get_window_extent().width)), 1)
+
+
+def _puntos_para_ejes(ax, minimo=1000):
+    """Subdivisiones por intervalo para que cada columna de píxel tenga varias muestras."""
+    return max(minimo, _columnas_ejes(ax) * MUESTRAS_POR_COLUMNA)
+
+
+def puntos_para_ancho(ancho_px, minimo=1000):
+    """
+    Lo mismo que _puntos_para_ejes para una figura de `ancho_px` píxeles con
+    un solo eje, sin crear la figura (ej: para muestrear antes de dibujar).
+    """
+    izquierda = plt.rcParams['figure.subplot.left']
+    derecha = plt.rcParams['figure.subplot.right']
+    columnas = max(int(math.ceil(ancho_px * (derecha - izquierda))), 1)
+    return max(minimo, columnas * MUESTRAS_POR_COLUMNA)
+
+
+def _dibujar_muestras(ax, muestras, label, rango_x=None, **estilo):
+    """
+    Dibuja cada intervalo continuo de `muestras`; solo el primero lleva label.
+
+    Antes de dibujar se diezma a mínimo/máximo por columna de píxel, así
+    matplotlib recibe a lo más unos pocos vértices por píxel y la envolvente
+    de curvas muy oscilantes (ej: sin(50*x)) se ve igual que con todos los puntos.
+    """
+    muestras = muestras.diezmar(_columnas_ejes(ax), rango_x)
+    con_label = False  # Para controlar el label y color
+    for seg_x, seg_y in muestras.segmentos():
+        if not np.isfinite(seg_y).any():
+            continue
+        if not con_label:
+            ax.plot(seg_x, seg_y, label=label, **estilo)
+            con_label = True
+        else:
+            ax.plot(seg_x, seg_y, **estilo)  # Mismo color, sin label
+
+
+def _dibujar_asintotas(ax, expr, rango_x):
+    """Líneas punteadas en las asíntotas verticales, horizontales y oblicuas."""
+    resultado = asintotas(expr)
+    estilo = dict(color='gray', linestyle='--', linewidth=1, alpha=0.8)
+    con_label = False
+    for xv in resultado.verticales_en(rango_x):
+        ax.axvline(xv, label=None if con_label else 'asíntotas', **estilo)
+        con_label = True
+    xs = np.array(rango_x, dtype=float)
+    for m, b in resultado.rectas():
+        if m == 0:
+            ax.axhline(b, label=None if con_label else 'asíntotas', **estilo)
+        else:
+            ax.plot(xs, m * xs + b, label=None if con_label else 'asíntotas', **estilo)
+        con_label = True
+
+
+def _decorar_ejes(ax, titulo, rango_x, rango_y=None):
+
+    #titulos
+    ax.set_title(titulo, fontsize=16)
+    ax.set_xlabel('Eje X', fontsize=12)
+    ax.set_ylabel('Eje Y', fontsize=12)
+
+
+    #cuadriculado
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+
+    #ejes X e Y (lineas de 0 0)
+    ax.axhline(0, color='black', linewidth=0.8)
+    ax.axvline(0, color='black', linewidth=0.8)
+
+    ax.legend()
+    ax.set_xlim(rango_x[0], rango_x[1])
+
+    # Aplicar rango Y si se proporciona
+    if rango_y is not None:
+        ax.set_ylim(rango_y[0], rango_y[1])
+
+
+def _conectar_tangente(fig, ax, expr):
+    """
+    Dibuja la recta tangente en la x donde está el mouse.
+
+    f y f' se compilan una sola vez (quedan en caché), así cada movimiento
+    solo evalúa dos números y mueve una línea ya creada.
+    """
+    f = derivada_vectorizada(expr, 0)
+    fp = derivada_vectorizada(expr, 1)
+    linea, = ax.plot([], [], color='C3', linestyle='--', linewidth=1, label='recta tangente')
+    punto, = ax.plot([], [], 'o', color='C3', zorder=6)
+
+    def al_mover(event):
+        if event.inaxes is not ax or event.xdata is None:
+            return
+        x0 = event.xdata
+        y0 = float(f(x0))
+        m = float(fp(x0))
+        if not (math.isfinite(y0) and math.isfinite(m)):
+            linea.set_data([], [])
+            punto.set_data([], [])
+        else:
+            xs = np.array(ax.get_xlim())
+            linea.set_data(xs, y0 + m * (xs - x0))
+            punto.set_data([x0], [y0])
+        fig.canvas.draw_idle()
+
+    # se guarda la conexion en la figura para que no se pierda la referencia
+    fig._tangente_cid = fig.canvas.mpl_connect('motion_notify_event', al_mover)
+
+
+def graficar_funcion(TipoFuncion, Func_str, intersecciones=None, punto_evaluado=None, rango_x=(-10, 10), rango_y=None, tangente=False, muestras=None):
+    
+    fig = construir_figura(TipoFuncion, Func_str, intersecciones, punto_evaluado, rango_x, rango_y, tangente,
+                           muestras=muestras)
+    if fig is not None:
+        plt.show()
+
+
+def construir_figura(TipoFuncion, Func_str, intersecciones=None, punto_evaluado=None, rango_x=(-10, 10), rango_y=None, tangente=False, figura=None, muestras=None):
+    """
+    Arma la gráfica de la función sin mostrarla.
+    
+    Si se entrega `figura` (ej: matplotlib.figure.Figure sin pyplot, para
+    renderizar a PNG desde otro hilo) se dibuja ahí; si no, se crea con pyplot.
+    Si se entregan `muestras` (MuestrasCurva ya calculado) no se vuelve a
+    muestrear; las muestras usadas quedan en `fig._muestras`.
     
+    Returns:
+        La figura, o None si TipoFuncion no es callable
+    """
     if not callable(TipoFuncion):
         print("Error: la funcion proporcionada no es un objeto valido")
-        return
+        return None
     
     #crear figura y los ejes de la grafica
-    fig, ax = plt.subplots(figsize=(10, 8))
+    if figura is None:
+        fig, ax = plt.subplots(figsize=(10, 8))
+    else:
+        fig = figura
+        ax = fig.subplots()
     
-    #generar los puntos de la funcion principal
+    #generar los puntos de la funcion principal (densidad según el ancho en píxeles)
     LimitInfX , LimitSupX = rango_x
+    puntos = _puntos_para_ejes(ax)
     
     # Intentar detectar discontinuidades desde el contexto si está disponible
-    try:
-        # Si la función fue creada con parse_function, intentar acceder a los warnings
-        if hasattr(TipoFuncion, '_parse_result'):
-            discontinuidades = detectar_discontinuidades(TipoFuncion._parse_result, rango_x)
-            ValoresX, ValoresY = generar_puntos_mejorado(TipoFuncion, LimitInfX, LimitSupX, discontinuidades)
-        else:
-            ValoresX, ValoresY = generar_puntos(TipoFuncion, LimitInfX, LimitSupX)
-    except:
-        # Fallback al método original
-        ValoresX, ValoresY = generar_puntos(TipoFuncion, LimitInfX, LimitSupX)
-    
-    # Graficar la función principal manejando discontinuidades
-    current_x = []
-    current_y = []
-    first_segment = True  # Para controlar el label y color
-    
-    for i, (x, y) in enumerate(zip(ValoresX, ValoresY)):
-        if x is None or y is None:
-            # Discontinuidad - graficar el segmento actual y empezar uno nuevo
-            if current_x and current_y:
-                if first_segment:
-                    ax.plot(current_x, current_y, label=f'f(x) = {Func_str}', color='C0')
-                    first_segment = False
-                else:
-                    ax.plot(current_x, current_y, color='C0')  # Mismo color, sin label
-                current_x = []
-                current_y = []
-        else:
-            current_x.append(x)
-            current_y.append(y)
-    
-    # Graficar el último segmento si existe
-    if current_x and current_y:
-        if first_segment:
-            ax.plot(current_x, current_y, label=f'f(x) = {Func_str}', color='C0')
-        else:
-            ax.plot(current_x, current_y, color='C0')  # Mismo color, sin label
-    
+    if muestras is None:
+        try:
+            # Si la función fue creada con parse_function, intentar acceder a los warnings
+            if hasattr(TipoFuncion, '_parse_result'):
+                discontinuidades = detectar_discontinuidades(TipoFuncion._parse_result, rango_x)
+                muestras = muestrear_funcion(TipoFuncion, LimitInfX, LimitSupX, discontinuidades, puntos)
+            else:
+                muestras = muestrear_funcion(TipoFuncion, LimitInfX, LimitSupX, PuntosGraf=puntos)
+        except:
+            # Fallback al método original
+            muestras = muestrear_funcion(TipoFuncion, LimitInfX, LimitSupX, PuntosGraf=puntos)
+    fig._muestras = muestras
+    
+    # Graficar cada intervalo continuo; matplotlib corta la línea en los NaN
+    _dibujar_muestras(ax, muestras, f'f(x) = {Func_str}', rango_x, color='C0')
+
+    # asíntotas (punteadas); las oblicuas no deben cambiar la escala del eje Y
+    if hasattr(TipoFuncion, '_parse_result') and TipoFuncion._parse_result.expr is not None:
+        limites_y = ax.get_ylim()
+        _dibujar_asintotas(ax, TipoFuncion._parse_result.expr, rango_x)
+        ax.set_ylim(limites_y)
+
     #graficar interserciones (si es k hay)
     if intersecciones:
         inter_x =[p[0] for p in intersecciones]
@@ -393,30 +543,270 @@ def graficar_funcion(TipoFuncion, Func_str, intersecciones=None, punto_evaluado=
         ax.scatter(px, py, color='green', s=100, zorder=5, edgecolors='black', label=f'punto evaluado ({px}, {py})')
     
     
+    #recta tangente interactiva (necesita la expresion para derivar)
+    if tangente and hasattr(TipoFuncion, '_parse_result'):
+        _conectar_tangente(fig, ax, TipoFuncion._parse_result.expr)
+    
     #añadir elementos extras a la grafica
+    _decorar_ejes(ax, f'Gráfica de la función f(x) = {Func_str}', rango_x, rango_y)
+
+    return fig
+
+
+def graficar_png(expr_str, rango_x=(-10, 10), rango_y=None, ancho_px=800, alto_px=600, dpi=100, allowed_vars=None):
+    """
+    Renderiza la gráfica de una función a PNG, sin abrir ventanas.
     
-    #titulos
-    ax.set_title(f'Gráfica de la función f(x) = {Func_str}', fontsize=16)
-    ax.set_xlabel('Eje X', fontsize=12)
-    ax.set_ylabel('Eje Y', fontsize=12)
+    Args:
+        expr_str: Expresión matemática como string
+        rango_x: Tupla con el rango de x (min, max)
+        rango_y: Tupla con el rango de y (min, max) - opcional
+        ancho_px, alto_px, dpi: Tamaño de la imagen
+        allowed_vars: Variables permitidas (por defecto ['x'])
     
+    Returns:
+        tuple: (success: bool, png: bytes or None, message: str)
+    """
+    if allowed_vars is None:
+        allowed_vars = ['x']
     
-    #cuadriculado
-    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    parse_result = parse_function(expr_str, allowed_vars=allowed_vars, simplify_strategy="auto")
+    if not parse_result.is_valid:
+        return False, None, f"Error al parsear la función: {parse_result.error}"
     
-    #ejes X e Y (lineas de 0 0)
-    ax.axhline(0, color='black', linewidth=0.8)
-    ax.axvline(0, color='black', linewidth=0.8)
+    try:
+        png, _ = renderizar_png(parse_result, expr_str, rango_x, rango_y, ancho_px, alto_px, dpi)
+        return True, png, "Función renderizada exitosamente"
+    except Exception as e:
+        return False, None, f"Error al graficar: {str(e)}"
+
+
+def renderizar_png(parse_result, expr_str, rango_x=(-10, 10), rango_y=None, ancho_px=800, alto_px=600, dpi=100, muestras=None, punto_evaluado=None):
+    """
+    Renderiza un ParseResult válido a PNG (sin pyplot, sirve desde cualquier hilo).
     
-    ax.legend()
-    ax.set_xlim(LimitInfX, LimitSupX)
+    Args:
+        muestras: MuestrasCurva ya calculado para rango_x (opcional)
+        (el resto como en graficar_png)
     
-    # Aplicar rango Y si se proporciona
-    if rango_y is not None:
-        ax.set_ylim(rango_y[0], rango_y[1])
-        
+    Returns:
+        tuple: (png: bytes, muestras: MuestrasCurva usadas)
+    """
+    from io import BytesIO
+    from matplotlib.figure import Figure
+    
+    funcion_ejecutable = parse_result.to_backend("auto")
+    funcion_ejecutable._parse_result = parse_result
+    
+    figura = Figure(figsize=(ancho_px / dpi, alto_px / dpi), dpi=dpi)
+    construir_figura(funcion_ejecutable, expr_str, punto_evaluado=punto_evaluado, rango_x=rango_x,
+                     rango_y=rango_y, figura=figura, muestras=muestras)
+    
+    buffer = BytesIO()
+    figura.savefig(buffer, format='png')
+    return buffer.getvalue(), figura._muestras
+
+
+def _misma_escala(ax, rango_x, rango_y, proporcion_max=4):
+    """Misma escala en los dos ejes (un círculo se ve como círculo) si los rangos son parecidos."""
+    proporcion = (rango_x[1] - rango_x[0]) / (rango_y[1] - rango_y[0])
+    if 1 / proporcion_max <= proporcion <= proporcion_max:
+        ax.set_aspect('equal', adjustable='box')
+
+
+def construir_figura_parametrica(curva, titulo, rango_x=None, rango_y=None, figura=None):
+    """
+    Arma la gráfica de una CurvaParametrica sin mostrarla.
+
+    Args:
+        curva: CurvaParametrica (ver graphics.curvas)
+        titulo: Texto de la curva para el título y la leyenda
+        rango_x, rango_y: Vista; por defecto la que se usó para refinar la curva
+        figura: Figure donde dibujar (si no, se crea con pyplot)
+    """
+    if figura is None:
+        fig, ax = plt.subplots(figsize=(10, 8))
+    else:
+        fig = figura
+        ax = fig.subplots()
+    vista_x, vista_y = curva.vista
+    rango_x = rango_x or vista_x
+    rango_y = rango_y or vista_y
+
+    _dibujar_muestras(ax, curva, titulo, color='C0')
+    _decorar_ejes(ax, f'Curva paramétrica {titulo}', rango_x, rango_y)
+    _misma_escala(ax, rango_x, rango_y)
+    return fig
+
+
+def construir_figura_implicita(trozos, titulo, rango_x=(-10, 10), rango_y=(-10, 10), figura=None):
+    """
+    Arma la gráfica de una curva implícita a partir de sus trozos (ver contorno_implicito).
+    """
+    from matplotlib.collections import LineCollection
+
+    if figura is None:
+        fig, ax = plt.subplots(figsize=(10, 8))
+    else:
+        fig = figura
+        ax = fig.subplots()
+
+    # todos los trozos en una sola colección: dibujar no depende de cuántos son
+    ax.add_collection(LineCollection(trozos, colors='C0', linewidths=1.5, label=titulo))
+    _decorar_ejes(ax, f'Curva implícita {titulo}', rango_x, rango_y)
+    _misma_escala(ax, rango_x, rango_y)
+    return fig
+
+
+def graficar_parametrica_desde_texto(texto_x, texto_y, rango_t=(0, 2 * math.pi), rango_x=None, rango_y=None):
+    """
+    Grafica la curva (x(t), y(t)).
+
+    Args:
+        texto_x, texto_y: Componentes como string (ej: "cos(t)", "sin(t)")
+        rango_t: Tupla con el rango de t (min, max)
+        rango_x, rango_y: Vista - opcional (por defecto se ajusta a la curva)
+
+    Returns:
+        tuple: (success: bool, message: str, curva: CurvaParametrica or None)
+    """
+    try:
+        curva = muestrear_parametrica_desde_texto(texto_x, texto_y, rango_t, rango_x=rango_x, rango_y=rango_y)
+    except ValueError as e:
+        return False, str(e), None
+    try:
+        construir_figura_parametrica(curva, f'({texto_x}, {texto_y})', rango_x, rango_y)
+        plt.show()
+        return True, f"Curva graficada exitosamente ({len(curva):,} puntos)", curva
+    except Exception as e:
+        return False, f"Error al graficar: {str(e)}", curva
+
+
+def graficar_implicita_desde_texto(texto, rango_x=(-10, 10), rango_y=None, resolucion=RESOLUCION_IMPLICITA):
+    """
+    Grafica la curva F(x, y) = 0 (ej: "x^2 + y^2 = 1").
+
+    Args:
+        texto: Ecuación en x e y ("izquierda = derecha", o F sola)
+        rango_x: Tupla con el rango de x (min, max)
+        rango_y: Tupla con el rango de y (min, max) - opcional (por defecto igual a rango_x)
+        resolucion: Celdas de la grilla por eje
+
+    Returns:
+        tuple: (success: bool, message: str, trozos: ndarray or None)
+    """
+    rango_y = rango_y or rango_x
+    try:
+        trozos = contorno_implicito_desde_texto(texto, rango_x, rango_y, resolucion)
+    except ValueError as e:
+        return False, str(e), None
+    if not len(trozos):
+        return False, "La curva no pasa por el rango indicado", trozos
+    try:
+        construir_figura_implicita(trozos, texto, rango_x, rango_y)
+        plt.show()
+        return True, "Curva graficada exitosamente", trozos
+    except Exception as e:
+        return False, f"Error al graficar: {str(e)}", trozos
+
+
+# pool de procesos para muestrear curvas superpuestas; se crea la primera vez y
+# se reutiliza (levantar procesos cuesta más que muestrear unas pocas curvas)
+_POOL_CURVAS = None
+_LOCK_POOL_CURVAS = threading.Lock()
+
+
+def _pool_curvas():
+    global _POOL_CURVAS
+    with _LOCK_POOL_CURVAS:
+        if _POOL_CURVAS is None:
+            _POOL_CURVAS = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _POOL_CURVAS
+
+
+def _descartar_pool_curvas(pool):
+    # un worker murió: el pool quedó roto y el próximo pedido crea otro
+    global _POOL_CURVAS
+    with _LOCK_POOL_CURVAS:
+        if _POOL_CURVAS is pool:
+            _POOL_CURVAS = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _muestrear_curva(parse_result, rango_x, puntos):
+    """Discontinuidades y muestras de una curva ya parseada (también corre en los workers)."""
+    discontinuidades = detectar_discontinuidades(parse_result, rango_x)
+    return muestrear_funcion(parse_result.to_vectorized(), rango_x[0], rango_x[1], discontinuidades, puntos)
+
+
+def _muestrear_curvas(parse_results, rango_x, puntos, paralelo):
+    n = len(parse_results)
+    if paralelo == "hilos":
+        # numpy suelta el GIL mientras evalúa
+        with ThreadPoolExecutor(max_workers=n) as ejecutor:
+            return list(ejecutor.map(_muestrear_curva, parse_results, [rango_x] * n, [puntos] * n))
+    if paralelo != "procesos":
+        raise ValueError(f"Modo paralelo no soportado: {paralelo}")
+    pool = _pool_curvas()
+    try:
+        return list(pool.map(_muestrear_curva, parse_results, [rango_x] * n, [puntos] * n))
+    except BrokenProcessPool:
+        _descartar_pool_curvas(pool)
+        raise
+
+
+def graficar_superpuestas(expresiones, rango_x=(-10, 10), rango_y=None, estilos=None, allowed_vars=None, paralelo="hilos"):
+    """
+    Grafica varias funciones en los mismos ejes (ej: f, f' y una recta tangente).
+
+    Las expresiones se parsean en este proceso con parse_function, así se
+    aprovecha su caché. El muestreo vectorizado va en paralelo: con hilos por
+    defecto (numpy suelta el GIL), o en un pool de procesos que se reutiliza
+    entre llamadas para expresiones muy caras. Todas las curvas se dibujan en
+    una sola figura y se muestra una única vez.
+
+    Args:
+        expresiones: Lista de expresiones como string
+        rango_x: Tupla con el rango de x (min, max)
+        rango_y: Tupla con el rango de y (min, max) - opcional
+        estilos: Lista de dicts con kwargs de matplotlib por curva (color, linestyle, ...)
+        allowed_vars: Variables permitidas (por defecto ['x'])
+        paralelo: "hilos" o "procesos" para el muestreo
+
+    Returns:
+        tuple: (success: bool, message: str, parse_results: list[ParseResult])
+    """
+    if allowed_vars is None:
+        allowed_vars = ['x']
+    expresiones = [e for e in expresiones if e and e.strip()]
+    if not expresiones:
+        return False, "No hay funciones para graficar", []
+
+    parse_results = [parse_function(e, allowed_vars=allowed_vars, simplify_strategy="auto") for e in expresiones]
+    errores = [f"{e}: {r.error}" for e, r in zip(expresiones, parse_results) if not r.is_valid]
+    if errores:
+        return False, "Error al parsear: " + "; ".join(errores), parse_results
+
+    fig, ax = plt.subplots(figsize=(10, 8))
+    puntos = _puntos_para_ejes(ax)
+    try:
+        curvas = _muestrear_curvas(parse_results, rango_x, puntos, paralelo)
+    except Exception as e:
+        plt.close(fig)
+        return False, f"Error al evaluar: {str(e)}", parse_results
+
+    estilos = list(estilos or [])
+    for i, (expr_str, muestras) in enumerate(zip(expresiones, curvas)):
+        estilo = {'color': f'C{i % 10}'}
+        if i < len(estilos) and estilos[i]:
+            estilo.update(estilos[i])
+        _dibujar_muestras(ax, muestras, f'f{i + 1}(x) = {expr_str}', rango_x, **estilo)
+
+    _decorar_ejes(ax, 'Gráfica de ' + ', '.join(expresiones), rango_x, rango_y)
     plt.show()
 
+    return True, f"{len(expresiones)} funciones graficadas exitosamente", parse_results
+
 
 # Función de demostración
 def demo_graficador():
@@ -447,8 +837,3 @@ if __name__ == "__main__":
     expr = "x**2 - 4*x + 3"
     print(f"Graficando: {expr}")
     graficar_con_analisis(expr, rango_x=(-2, 6), evaluar_en=2)
-
-
-
-
-
@@ -0,0 +1,396 @@
+"""
+Muestreo por bloques de funciones reales.
+
+En vez de armar listas completas de X e Y, `iterar_muestras` entrega la curva
+en bloques de tamaño fijo (x, y, máscara) a medida que se van pidiendo, así la
+memoria usada no depende de la cantidad total de puntos.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
+
+import numpy as np
+
+
+BloqueMuestras = namedtuple("BloqueMuestras", ["x", "y", "mascara", "segmento"])
+BloqueMuestras.__doc__ = """Bloque de muestras de un intervalo continuo.
+
+x, y: arreglos float64 del bloque (y vale NaN donde no hay valor).
+mascara: arreglo bool, True donde el punto es válido.
+segmento: índice del intervalo continuo al que pertenece el bloque.
+"""
+
+TAM_BLOQUE = 65536
+
+
+def _evaluar_bloque(funcion, xs, vectorizada):
+    if vectorizada:
+        with np.errstate(all="ignore"):
+            ys = np.asarray(funcion(xs), dtype=np.float64)
+        return np.array(np.broadcast_to(ys, xs.shape), dtype=np.float64)
+
+    # funcion escalar (ej: to_callable con 'math'), se evalua punto a punto
+    ys = np.empty_like(xs)
+    for i, xv in enumerate(xs.tolist()):
+        try:
+            yv = funcion(xv)
+            ys[i] = np.nan if isinstance(yv, complex) else yv
+        except (ValueError, ZeroDivisionError, TypeError, OverflowError):
+            ys[i] = np.nan
+    return ys
+
+
+def iterar_muestras(funcion, rango_x, intervalos=None, puntos=1000, tam_bloque=TAM_BLOQUE,
+                    vectorizada=None, recorte=None):
+    """
+    Genera las muestras de una función por bloques, sin materializar la curva completa.
+
+    Args:
+        funcion: callable de una variable (escalar o vectorizado)
+        rango_x: Tupla (min, max), se usa si no se entregan intervalos
+        intervalos: Lista de intervalos continuos (ver generar_intervalos_continuos)
+        puntos: Cantidad de subdivisiones por intervalo (se generan puntos + 1 muestras)
+        tam_bloque: Máximo de muestras por bloque
+        vectorizada: Si la función acepta arreglos numpy. Por defecto se usa
+            el atributo `vectorizada` del callable (ver ParseResult.to_vectorized)
+        recorte: Si se entrega, los |y| mayores a este valor se marcan inválidos
+
+    Yields:
+        BloqueMuestras con x, y, mascara y el índice de segmento
+    """
+    if tam_bloque <= 0:
+        raise ValueError("tam_bloque debe ser positivo")
+    if vectorizada is None:
+        vectorizada = getattr(funcion, "vectorizada", False)
+    if intervalos is None:
+        intervalos = [rango_x]
+
+    segmento = 0
+    for inicio, fin in intervalos:
+        if inicio >= fin:
+            continue
+        total = puntos + 1
+        for desde in range(0, total, tam_bloque):
+            hasta = min(desde + tam_bloque, total)
+            yield muestrear_bloque(funcion, (inicio, fin), puntos, desde, hasta, segmento, vectorizada, recorte)
+        segmento += 1
+
+
+def muestrear_bloque(funcion, intervalo, puntos, desde, hasta, segmento=0, vectorizada=None, recorte=None):
+    """
+    Un bloque de iterar_muestras: las muestras desde..hasta-1 de `intervalo`
+    subdividido en `puntos` partes. Sirve para repartir bloques entre
+    procesos o tareas y obtener exactamente los mismos valores.
+    """
+    if vectorizada is None:
+        vectorizada = getattr(funcion, "vectorizada", False)
+    inicio, fin = intervalo
+    incremento = (fin - inicio) / puntos
+    xs = inicio + incremento * np.arange(desde, hasta, dtype=np.float64)
+    ys = _evaluar_bloque(funcion, xs, vectorizada)
+    mascara = np.isfinite(ys)
+    if recorte is not None:
+        mascara &= np.abs(ys) <= recorte
+    ys[~mascara] = np.nan
+    return BloqueMuestras(xs, ys, mascara, segmento)
+
+
+def resumen_muestras(bloques):
+    """
+    Estadísticas de una curva calculadas bloque a bloque (memoria constante).
+
+    Returns:
+        dict con total, validos, min, max y promedio de los valores válidos
+    """
+    total = 0
+    validos = 0
+    suma = 0.0
+    minimo = math.inf
+    maximo = -math.inf
+    for bloque in bloques:
+        total += len(bloque.x)
+        ys = bloque.y[bloque.mascara]
+        if ys.size:
+            validos += ys.size
+            suma += float(ys.sum())
+            minimo = min(minimo, float(ys.min()))
+            maximo = max(maximo, float(ys.max()))
+
+    if not validos:
+        return {"total": total, "validos": 0, "min": None, "max": None, "promedio": None}
+    return {
+        "total": total,
+        "validos": validos,
+        "min": minimo,
+        "max": maximo,
+        "promedio": suma / validos,
+    }
+
+
+class MuestrasCurva:
+    """
+    Curva muestreada guardada en arreglos float64 contiguos.
+
+    Los puntos inválidos quedan como NaN en `y` y `limites` guarda dónde empieza
+    cada intervalo continuo (con el total al final), así los segmentos se
+    obtienen como vistas sin copiar datos.
+    """
+
+    def __init__(self, x, y, limites):
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.y = np.ascontiguousarray(y, dtype=np.float64)
+        self.limites = np.asarray(limites, dtype=np.intp)
+        if self.x.shape != self.y.shape:
+            raise ValueError("x e y deben tener el mismo largo")
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def mascara(self):
+        return np.isfinite(self.y)
+
+    @property
+    def cantidad_segmentos(self):
+        return max(len(self.limites) - 1, 0)
+
+    @property
+    def nbytes(self):
+        return self.x.nbytes + self.y.nbytes + self.limites.nbytes
+
+    def segmentos(self):
+        """Entrega (x, y) de cada intervalo continuo como vistas de los arreglos."""
+        for i in range(self.cantidad_segmentos):
+            desde, hasta = self.limites[i], self.limites[i + 1]
+            yield self.x[desde:hasta], self.y[desde:hasta]
+
+    def bloques(self, tam_bloque=TAM_BLOQUE):
+        """Recorre la curva como BloqueMuestras, igual que iterar_muestras."""
+        for segmento, (xs, ys) in enumerate(self.segmentos()):
+            for desde in range(0, len(xs), tam_bloque):
+                bx = xs[desde:desde + tam_bloque]
+                by = ys[desde:desde + tam_bloque]
+                yield BloqueMuestras(bx, by, np.isfinite(by), segmento)
+
+    def como_listas(self):
+        """Formato antiguo: listas con None en puntos inválidos y entre intervalos."""
+        ValoresX = []
+        ValoresY = []
+        for i, (xs, ys) in enumerate(self.segmentos()):
+            if i > 0:
+                ValoresX.append(None)
+                ValoresY.append(None)
+            ValoresX.extend(xs.tolist())
+            ValoresY.extend(None if math.isnan(v) else v for v in ys.tolist())
+        return ValoresX, ValoresY
+
+    def diezmar(self, columnas, rango_x=None):
+        """
+        Versión reducida para dibujar en `columnas` píxeles de ancho (ver diezmar_minmax).
+
+        Returns:
+            Un MuestrasCurva nuevo con los mismos segmentos
+        """
+        partes_x = []
+        partes_y = []
+        limites = [0]
+        for xs, ys in self.segmentos():
+            dx, dy = diezmar_minmax(xs, ys, columnas, rango_x)
+            partes_x.append(dx)
+            partes_y.append(dy)
+            limites.append(limites[-1] + len(dx))
+        if not partes_x:
+            return MuestrasCurva.vacia()
+        return MuestrasCurva(np.concatenate(partes_x), np.concatenate(partes_y), limites)
+
+    @classmethod
+    def vacia(cls):
+        return cls(np.empty(0), np.empty(0), [0])
+
+
+def diezmar_minmax(x, y, columnas, rango_x=None):
+    """
+    Reduce una curva (x creciente) a lo que se puede ver en `columnas` píxeles.
+
+    En cada columna de píxeles se conservan el primer y el último punto y los
+    puntos de mínimo y máximo, en su orden original. Así la línea dibujada
+    cubre exactamente la misma franja vertical que la curva completa y el
+    costo de dibujar depende del ancho en píxeles, no de la cantidad de
+    muestras. Los tramos separados por NaN se reducen por separado y se deja
+    un NaN entre ellos, de modo que los bordes de cada hueco se mantienen.
+
+    Args:
+        x, y: Arreglos de la curva (NaN en y donde no hay valor)
+        columnas: Ancho de los ejes en píxeles
+        rango_x: Rango visible (min, max); por defecto el de x
+
+    Returns:
+        (x, y) reducidos; si ya hay pocos puntos se devuelven sin cambios
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    columnas = max(int(columnas), 1)
+    if len(x) <= 4 * columnas:
+        return x, y
+
+    validos = np.isfinite(y)
+    indices = np.flatnonzero(validos)
+    if not indices.size:
+        return x[:0], y[:0]
+
+    if rango_x is None:
+        rango_x = (x[0], x[-1])
+    inicio, fin = rango_x
+    ancho = (fin - inicio) or 1.0
+    columna = np.clip(((x[indices] - inicio) / ancho * columnas).astype(np.int64), -1, columnas)
+
+    # tramo = cuantos NaN hubo antes; un grupo es (tramo, columna) consecutivo
+    tramo = np.cumsum(~validos)[indices]
+    corte = np.flatnonzero((np.diff(columna) != 0) | (np.diff(tramo) != 0)) + 1
+    inicios = np.concatenate(([0], corte))
+    finales = np.concatenate((corte, [len(indices)])) - 1
+
+    yv = y[indices]
+    largos = finales - inicios + 1
+    # primera posición del mínimo y del máximo de cada grupo
+    elegidos = [inicios, finales]
+    for reducir in (np.minimum, np.maximum):
+        extremo = np.repeat(reducir.reduceat(yv, inicios), largos)
+        posiciones = np.flatnonzero(yv == extremo)
+        grupo = np.searchsorted(inicios, posiciones, side="right") - 1
+        primeras = np.concatenate(([True], grupo[1:] != grupo[:-1]))
+        elegidos.append(posiciones[primeras])
+    elegidos = np.unique(np.concatenate(elegidos))
+
+    dx = x[indices[elegidos]]
+    dy = yv[elegidos]
+    # NaN entre tramos para que la línea se corte igual que antes
+    saltos = np.flatnonzero(np.diff(tramo[elegidos]) != 0) + 1
+    if saltos.size:
+        dx = np.insert(dx, saltos, (dx[saltos - 1] + dx[saltos]) / 2)
+        dy = np.insert(dy, saltos, np.nan)
+    return dx, dy
+
+
+def muestrear(funcion, rango_x, intervalos=None, puntos=1000, vectorizada=None, recorte=None):
+    """
+    Muestrea una función completa dentro de un MuestrasCurva.
+
+    Los arreglos se reservan una sola vez con el tamaño final y se llenan con
+    los bloques de iterar_muestras (ver sus argumentos).
+    """
+    if intervalos is None:
+        intervalos = [rango_x]
+    intervalos = [(inicio, fin) for inicio, fin in intervalos if inicio < fin]
+    if not intervalos:
+        return MuestrasCurva.vacia()
+
+    total = (puntos + 1) * len(intervalos)
+    x = np.empty(total)
+    y = np.empty(total)
+    limites = [(puntos + 1) * i for i in range(len(intervalos) + 1)]
+
+    pos = 0
+    for bloque in iterar_muestras(funcion, rango_x, intervalos, puntos,
+                                  vectorizada=vectorizada, recorte=recorte):
+        n = len(bloque.x)
+        x[pos:pos + n] = bloque.x
+        y[pos:pos + n] = bloque.y
+        pos += n
+    return MuestrasCurva(x, y, limites)
+
+
+def tabla_de_valores(funcion, inicio, fin, paso, vectorizada=None, tam_bloque=TAM_BLOQUE):
+    """
+    Evalúa f en inicio, inicio + paso, ... hasta fin (inclusive).
+
+    Returns:
+        (x, y) arreglos float64, con NaN donde f no está definida
+    """
+    if paso <= 0:
+        raise ValueError("El paso debe ser positivo")
+    if inicio > fin:
+        raise ValueError("El inicio debe ser menor o igual al final")
+    if vectorizada is None:
+        vectorizada = getattr(funcion, "vectorizada", False)
+
+    # el pequeño margen evita perder el último punto por redondeo (ej: 0.1 * 30)
+    filas = int(math.floor((fin - inicio) / paso + 1e-9)) + 1
+    x = inicio + paso * np.arange(filas, dtype=np.float64)
+    y = np.empty(filas)
+    for desde in range(0, filas, tam_bloque):
+        bx = x[desde:desde + tam_bloque]
+        y[desde:desde + len(bx)] = _evaluar_bloque(funcion, bx, vectorizada)
+    y[~np.isfinite(y)] = np.nan
+    return x, y
+
+
+# Muestreo en paralelo
+
+_FUNCION_WORKER = None
+
+
+def _iniciar_worker(parse_result, precision):
+    # cada worker compila la expresion una sola vez (los lambdify no se pueden picklear)
+    global _FUNCION_WORKER
+    _FUNCION_WORKER = parse_result.to_vectorized(precision)
+
+
+def _evaluar_tramo(tarea):
+    inicio, incremento, desde, hasta = tarea
+    xs = inicio + incremento * np.arange(desde, hasta, dtype=np.float64)
+    return _evaluar_bloque(_FUNCION_WORKER, xs, True)
+
+
+def muestrear_paralelo(parse_result, rango_x, intervalos=None, puntos=1000, procesos=None,
+                       tam_bloque=TAM_BLOQUE, precision="float64", recorte=None):
+    """
+    Igual que muestrear, pero repartiendo intervalos y bloques en un pool de procesos.
+
+    Conviene para expresiones caras (composiciones de exp/log/trig, muchos
+    puntos o precision "mpmath"/"auto"). La expresión se envía a cada worker
+    una vez al iniciarlo y los bloques se reensamblan en orden.
+
+    Args:
+        parse_result: ParseResult válido de una variable
+        procesos: Cantidad de workers (por defecto, núcleos)
+        precision: Ver ParseResult.to_vectorized
+        (el resto como en muestrear)
+    """
+    if intervalos is None:
+        intervalos = [rango_x]
+    intervalos = [(inicio, fin) for inicio, fin in intervalos if inicio < fin]
+    if not intervalos:
+        return MuestrasCurva.vacia()
+
+    procesos = procesos or os.cpu_count() or 1
+    total = (puntos + 1) * len(intervalos)
+    # bloques mas chicos que tam_bloque si hace falta para repartir bien la carga
+    tam = max(1, min(tam_bloque, -(-total // (procesos * 4))))
+
+    x = np.empty(total)
+    y = np.empty(total)
+    limites = [(puntos + 1) * i for i in range(len(intervalos) + 1)]
+
+    tareas = []
+    posiciones = []
+    for i, (inicio, fin) in enumerate(intervalos):
+        incremento = (fin - inicio) / puntos
+        for desde in range(0, puntos + 1, tam):
+            hasta = min(desde + tam, puntos + 1)
+            tareas.append((inicio, incremento, desde, hasta))
+            posiciones.append(limites[i] + desde)
+
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_worker,
+                             initargs=(parse_result, precision)) as ejecutor:
+        for (inicio, incremento, desde, hasta), pos, ys in zip(tareas, posiciones, ejecutor.map(_evaluar_tramo, tareas)):
+            n = hasta - desde
+            x[pos:pos + n] = inicio + incremento * np.arange(desde, hasta, dtype=np.float64)
+            y[pos:pos + n] = ys
+
+    mascara = np.isfinite(y)
+    if recorte is not None:
+        mascara &= np.abs(y) <= recorte
+    y[~mascara] = np.nan
+    return MuestrasCurva(x, y, limites)
@@ -0,0 +1,77 @@
+"""
+Familias de funciones con parámetros libres (ej: a*sin(b*x) + c).
+
+La expresión se compila una sola vez como función vectorizada de (x, a, b, ...)
+y la grilla de x se arma una sola vez; cambiar un parámetro es solo evaluar
+numpy sobre esa grilla, sin trabajo simbólico. Como las asíntotas dependen
+de los parámetros (ej: 1/(x - h)), la curva se corta donde salta de un
+extremo al otro de la vista en vez de usar detectar_discontinuidades.
+"""
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.parser import ParseResult
+
+
+# valores iniciales y rango por defecto de cada parámetro
+VALOR_INICIAL = 1.0
+RANGO_PARAMETRO = (-10.0, 10.0)
+
+
+class FamiliaParametrica:
+    """
+    f(x; parámetros) lista para evaluar muchas veces sobre la misma grilla.
+
+    Args:
+        parse_result: ParseResult válido (parseado sin restringir variables)
+        rango_x: Tupla (min, max)
+        puntos: Subdivisiones de la grilla
+        variable: Nombre de la variable independiente
+    """
+
+    def __init__(self, parse_result: ParseResult, rango_x, puntos: int = 4000, variable: str = "x"):
+        if not parse_result.is_valid:
+            raise ValueError(f"Error al parsear la función: {parse_result.error}")
+        self.variable = variable
+        self.parametros: List[str] = [v for v in parse_result.variables if v != variable]
+        self._orden = list(parse_result.variables)
+        self._f = parse_result.to_vectorized()
+        self.x = np.linspace(rango_x[0], rango_x[1], puntos + 1)
+
+    def valores_iniciales(self) -> Dict[str, float]:
+        return {p: VALOR_INICIAL for p in self.parametros}
+
+    def evaluar(self, valores: Dict[str, float], alto_vista: Optional[float] = None) -> np.ndarray:
+        """
+        y sobre la grilla para los valores de los parámetros.
+
+        Args:
+            valores: nombre -> valor de cada parámetro
+            alto_vista: Alto del rango Y visible; si se da, se corta la curva
+                (NaN) donde un paso de la grilla cruza más que eso cambiando
+                de signo, que es lo que pasa al atravesar una asíntota vertical
+        """
+        argumentos = [self.x if v == self.variable else valores[v] for v in self._orden]
+        y = np.array(np.broadcast_to(self._f(*argumentos), self.x.shape), dtype=np.float64)
+        y[~np.isfinite(y)] = np.nan
+        if alto_vista is not None and len(y) > 1:
+            with np.errstate(invalid="ignore"):
+                salto = (np.abs(np.diff(y)) > alto_vista) & (y[:-1] * y[1:] < 0)
+            y[1:][salto] = np.nan
+        return y
+
+
+def limites_y(y: np.ndarray, margen: float = 0.1) -> Tuple[float, float]:
+    """Rango Y que muestra la curva sin dejar que unos pocos valores enormes lo dominen."""
+    finitos = y[np.isfinite(y)]
+    if finitos.size == 0:
+        return (-10.0, 10.0)
+    bajo, alto = np.percentile(finitos, [2, 98])
+    if alto - bajo < 1e-9:
+        bajo, alto = bajo - 1, alto + 1
+    extra = (alto - bajo) * margen
+    return (float(bajo - extra), float(alto + extra))
@@ -0,0 +1,191 @@
+"""
+Pipeline incremental para graficar.
+
+Graficar es una cadena de etapas (parsear, compilar, buscar singularidades,
+cortar en intervalos, muestrear, dibujar) y cada una depende solo de algunas
+entradas. El Pipeline guarda el resultado de cada etapa junto con la firma
+de lo que usó (sus entradas y las firmas de las etapas de las que depende) y
+solo vuelve a calcular las etapas cuya firma cambió. Por ejemplo, al cambiar
+solo el rango X se muestrea el rango nuevo sin volver a parsear ni compilar,
+y al cambiar solo el rango Y solo se vuelve a dibujar.
+
+Uso:
+    pipeline = pipeline_grafico()
+    valores = pipeline.calcular(["png"], expr_str="sin(x)", rango_x=(-5, 5), ...)
+    pipeline.ultimas_etapas   # ej: ["muestras", "png"]
+"""
+from collections import OrderedDict, deque, namedtuple
+import math
+import os
+import sys
+from typing import Dict, Iterable, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.asintotas import asintotas
+from domain.parser import parse_function
+from graphics.graficos import detectar_discontinuidades, evaluar_funcion_en_punto, muestrear_funcion, renderizar_png
+
+
+Etapa = namedtuple("Etapa", ["calcular", "dependencias", "entradas"])
+Etapa.__doc__ = """Etapa de un Pipeline.
+
+calcular: se llama con los valores de las dependencias y luego los de las entradas, en orden.
+dependencias: nombres de las etapas cuyos resultados usa.
+entradas: nombres de los parámetros de Pipeline.calcular que usa.
+"""
+
+# resultados que se guardan por etapa (ej: vista previa y ventana externa tienen distinta densidad)
+MEMORIA_POR_ETAPA = 4
+
+
+class Pipeline:
+    """
+    Etapas con dependencias que se recalculan solo cuando cambian sus entradas.
+
+    Args:
+        etapas: dict nombre -> Etapa
+        memoria: Resultados que se guardan por etapa (LRU por firma)
+    """
+
+    def __init__(self, etapas: Dict[str, Etapa], memoria: int = MEMORIA_POR_ETAPA):
+        self.etapas = etapas
+        self.memoria = memoria
+        self._resultados = {nombre: OrderedDict() for nombre in etapas}
+        self.ultimas_etapas: List[str] = []
+        # (objetivos, etapas que corrieron) de los últimos pedidos
+        self.registro = deque(maxlen=100)
+
+    def _firma(self, nombre, entradas, firmas):
+        if nombre not in firmas:
+            etapa = self.etapas[nombre]
+            firmas[nombre] = (
+                tuple(self._firma(d, entradas, firmas) for d in etapa.dependencias),
+                tuple(entradas[p] for p in etapa.entradas),
+            )
+        return firmas[nombre]
+
+    def _valor(self, nombre, entradas, firmas, valores, ejecutadas):
+        if nombre in valores:
+            return valores[nombre]
+        etapa = self.etapas[nombre]
+        firma = self._firma(nombre, entradas, firmas)
+        guardados = self._resultados[nombre]
+        if firma in guardados:
+            guardados.move_to_end(firma)
+            valores[nombre] = guardados[firma]
+            return valores[nombre]
+
+        argumentos = [self._valor(d, entradas, firmas, valores, ejecutadas) for d in etapa.dependencias]
+        argumentos += [entradas[p] for p in etapa.entradas]
+        valor = etapa.calcular(*argumentos)
+        ejecutadas.append(nombre)
+        guardados[firma] = valor
+        while len(guardados) > self.memoria:
+            guardados.popitem(last=False)
+        valores[nombre] = valor
+        return valor
+
+    def calcular(self, objetivos: Iterable[str], **entradas) -> Dict[str, object]:
+        """
+        Calcula (o recupera) las etapas `objetivos` y todo lo que necesitan.
+
+        Las etapas que corrieron quedan en `ultimas_etapas` y en `registro`.
+
+        Returns:
+            dict nombre -> valor de cada etapa usada
+        """
+        objetivos = list(objetivos)
+        firmas = {}
+        valores = {}
+        ejecutadas = []
+        try:
+            for nombre in objetivos:
+                self._valor(nombre, entradas, firmas, valores, ejecutadas)
+        finally:
+            self.ultimas_etapas = ejecutadas
+            self.registro.append((tuple(objetivos), tuple(ejecutadas)))
+        return valores
+
+    def limpiar(self):
+        for guardados in self._resultados.values():
+            guardados.clear()
+
+
+# Etapas para graficar una función de x
+
+def _etapa_parse(expr_str):
+    parse_result = parse_function(expr_str, allowed_vars=['x'], simplify_strategy="auto")
+    if not parse_result.is_valid:
+        raise ValueError(f"Error al parsear la función: {parse_result.error}")
+    return parse_result
+
+
+def _etapa_funcion(parse_result):
+    funcion = parse_result.to_backend("auto")
+    # construir_figura lo usa para las asíntotas y la tangente
+    funcion._parse_result = parse_result
+    return funcion
+
+
+def _etapa_asintotas(parse_result):
+    # no depende del rango: con tan(x) es un conjunto infinito de puntos
+    if parse_result.racional is not None or parse_result.expr is None:
+        return None
+    try:
+        return asintotas(parse_result.expr)
+    except Exception:
+        return None
+
+
+def _etapa_discontinuidades(parse_result, resultado_asintotas, rango_x):
+    if resultado_asintotas is not None:
+        puntos = resultado_asintotas.singularidades_en(rango_x)
+        if puntos is not None:
+            return puntos
+    return detectar_discontinuidades(parse_result, rango_x)
+
+
+def _etapa_muestras(funcion, discontinuidades, rango_x, puntos):
+    return muestrear_funcion(funcion, rango_x[0], rango_x[1], discontinuidades, puntos)
+
+
+def _etapa_punto(expr_str, x_punto):
+    if x_punto is None:
+        return None
+    # con la expresión sin simplificar, como evaluar_funcion_en_punto: (x^2 - 1)/(x - 1)
+    # no está definida en x = 1 aunque la versión simplificada (x + 1) sí lo esté
+    ok, y, _ = evaluar_funcion_en_punto(expr_str, x_punto)
+    try:
+        y = float(y)
+    except (TypeError, ValueError):
+        return None
+    # None si f no está definida en x_punto (el gráfico sale igual, sin el punto)
+    return (x_punto, y) if ok and math.isfinite(y) else None
+
+
+def _etapa_png(parse_result, muestras, punto, expr_str, rango_x, rango_y, ancho_px, alto_px, dpi):
+    png, _ = renderizar_png(parse_result, expr_str, rango_x, rango_y, ancho_px, alto_px, dpi,
+                            muestras=muestras, punto_evaluado=punto)
+    return png
+
+
+ETAPAS_GRAFICO = {
+    "parse": Etapa(_etapa_parse, (), ("expr_str",)),
+    "funcion": Etapa(_etapa_funcion, ("parse",), ()),
+    "asintotas": Etapa(_etapa_asintotas, ("parse",), ()),
+    "discontinuidades": Etapa(_etapa_discontinuidades, ("parse", "asintotas"), ("rango_x",)),
+    "muestras": Etapa(_etapa_muestras, ("funcion", "discontinuidades"), ("rango_x", "puntos")),
+    "punto": Etapa(_etapa_punto, (), ("expr_str", "x_punto")),
+    "png": Etapa(_etapa_png, ("parse", "muestras", "punto"),
+                 ("expr_str", "rango_x", "rango_y", "ancho_px", "alto_px", "dpi")),
+}
+
+
+def pipeline_grafico(memoria: int = MEMORIA_POR_ETAPA) -> Pipeline:
+    """
+    Pipeline con las etapas de ETAPAS_GRAFICO.
+
+    Entradas de calcular: expr_str, rango_x, rango_y, x_punto (o None),
+    puntos (ver puntos_para_ancho), ancho_px, alto_px y dpi (solo para "png").
+    """
+    return Pipeline(ETAPAS_GRAFICO, memoria)
@@ -0,0 +1,377 @@
+"""
+API asíncrona (asyncio) para parsear, evaluar, analizar y graficar.
+
+Todo el trabajo pesado corre en un pool de procesos propio, así el event loop
+nunca se bloquea. Cada llamada:
+
+- espera un cupo del semáforo (máximo de trabajos en curso),
+- tiene límite de tiempo, contado desde que un worker la empieza (el tiempo
+  en la cola del pool no cuenta): el worker se corta solo con domain.tiempo
+  y, si igual no responde, se lo interrumpe y se deja de esperarlo,
+- respeta la cancelación: si la tarea que espera se cancela (o vence un
+  asyncio.wait_for/timeout de afuera), el trabajo que todavía no empezó se
+  descarta y al que ya está corriendo se le envía SIGUSR1 para que se
+  interrumpa, liberando el worker.
+
+El muestreo se entrega como iterador asíncrono de BloqueMuestras: cada bloque
+se calcula en el pool y se piden unos pocos por adelantado, así la memoria no
+depende de la cantidad total de puntos.
+
+Uso:
+    async with ServicioAsincrono(procesos=4, concurrencia=8, timeout=10) as servicio:
+        resultado = await servicio.parse_function("x**2 + 1", allowed_vars=["x"])
+        async for bloque in servicio.iterar_muestras("sin(x)/x", (-50, 50), puntos=10**6):
+            ...
+
+También hay funciones sueltas (parse_function_async, ...) que usan un
+servicio compartido creado al primer uso.
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+import itertools
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import weakref
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.parser import parse_function
+from domain.tiempo import limite_de_tiempo, TiempoAgotado
+
+
+# margen que se le da al worker para cortar solo antes de dejar de esperarlo
+MARGEN_TIMEOUT = 1.0
+
+# cada cuánto se revisa si un trabajo que ya empezó se pasó de su límite
+ESPERA_SONDEO = 0.1
+
+# bloques de muestreo que se piden por adelantado
+ADELANTO = 2
+
+_SECCIONES_ANALISIS = ("dominio", "recorrido", "intersecciones", "derivadas", "monotonia", "extremos", "asintotas")
+
+
+class TrabajoCancelado(BaseException):
+    """El trabajo de un worker se interrumpió porque se canceló su tarea."""
+
+
+# Lado del worker
+#
+# Cada worker ocupa un casillero de un arreglo compartido con su pid, el
+# trabajo que está corriendo y cuándo lo empezó (time.monotonic_ns, común a
+# todos los procesos); otro arreglo (circular) guarda los últimos
+# trabajos cancelados. Un trabajo cancelado se descarta al empezar, y si ya
+# estaba corriendo el worker recibe SIGUSR1 y se interrumpe solo si el
+# trabajo en curso es uno cancelado (si ya empezó otro, la señal se ignora).
+
+_PID, _ACTUAL, _INICIO = 0, 1, 2
+_CAMPOS = 3
+TAM_CANCELADOS = 256
+_estado = None
+_cancelados = None
+_casillero = None
+
+
+def _iniciar_worker(estado, cancelados, contador):
+    global _estado, _cancelados, _casillero
+    with contador.get_lock():
+        _casillero = contador.value
+        contador.value += 1
+    _estado = estado
+    _cancelados = cancelados
+    _estado[_casillero * _CAMPOS + _PID] = os.getpid()
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, _al_cancelar)
+
+
+def _al_cancelar(signum, frame):
+    actual = _estado[_casillero * _CAMPOS + _ACTUAL]
+    if actual and actual in _cancelados:
+        raise TrabajoCancelado()
+
+
+def _correr(id_trabajo, funcion, args, timeout):
+    # primero el inicio: quien vea el id ya tiene la hora correcta
+    _estado[_casillero * _CAMPOS + _INICIO] = time.monotonic_ns()
+    _estado[_casillero * _CAMPOS + _ACTUAL] = id_trabajo
+    try:
+        if id_trabajo in _cancelados:
+            return None
+        with limite_de_tiempo(timeout):
+            return funcion(*args)
+    except TiempoAgotado:
+        raise TimeoutError(f"El cálculo superó el límite de {timeout} s")
+    except TrabajoCancelado:
+        return None  # nadie espera el resultado
+    finally:
+        _estado[_casillero * _CAMPOS + _ACTUAL] = 0
+
+
+# Tareas (corren dentro de los workers)
+
+def _parsear(expr_str, allowed_vars):
+    resultado = parse_function(expr_str, allowed_vars=allowed_vars, simplify_strategy="auto")
+    if not resultado.is_valid:
+        raise ValueError(f"Error al parsear la función: {resultado.error}")
+    return resultado
+
+
+@lru_cache(maxsize=64)
+def _funcion_vectorizada(expr_str, allowed_vars):
+    # los bloques de una misma curva caen muchas veces en el mismo worker
+    return _parsear(expr_str, list(allowed_vars)).to_vectorized()
+
+
+def _tarea_parse(expr_str, opciones):
+    return parse_function(expr_str, **opciones)
+
+
+def _tarea_evaluar(expr_str, x_valor, allowed_vars):
+    from graphics.graficos import evaluar_funcion_en_punto
+
+    return evaluar_funcion_en_punto(expr_str, x_valor, allowed_vars)
+
+
+def _tarea_analizar(expr_str, secciones, allowed_vars):
+    from domain.analysis import AnalisisFuncion
+
+    analisis = AnalisisFuncion(_parsear(expr_str, allowed_vars).expr)
+    return {seccion: getattr(analisis, seccion)() for seccion in secciones}
+
+
+def _tarea_png(expr_str, opciones):
+    from graphics.graficos import graficar_png
+
+    return graficar_png(expr_str, **opciones)
+
+
+def _tarea_intervalos(expr_str, rango_x, allowed_vars):
+    from graphics.graficos import detectar_discontinuidades, generar_intervalos_continuos
+
+    resultado = _parsear(expr_str, allowed_vars)
+    discontinuidades = detectar_discontinuidades(resultado, rango_x)
+    return [(a, b) for a, b in generar_intervalos_continuos(rango_x, discontinuidades) if a < b]
+
+
+def _tarea_bloque(expr_str, allowed_vars, intervalo, puntos, desde, hasta, segmento):
+    from graphics.muestreo import muestrear_bloque
+
+    funcion = _funcion_vectorizada(expr_str, tuple(allowed_vars))
+    return muestrear_bloque(funcion, intervalo, puntos, desde, hasta, segmento)
+
+
+class ServicioAsincrono:
+    """
+    Pool de procesos con semáforo, límites de tiempo y cancelación para asyncio.
+
+    Args:
+        procesos: Cantidad de workers (por defecto, núcleos)
+        concurrencia: Máximo de trabajos en curso o en cola del pool por event
+            loop (por defecto, procesos)
+        timeout: Segundos máximos por trabajo desde que empieza a correr (None: sin límite)
+    """
+
+    def __init__(self, procesos=None, concurrencia=None, timeout=30.0):
+        self.procesos = procesos or os.cpu_count() or 1
+        self.concurrencia = concurrencia or self.procesos
+        self.timeout = timeout
+        # un semáforo por event loop: asyncio.Semaphore queda atado al primer loop que lo usa
+        self._semaforos = weakref.WeakKeyDictionary()
+        self._ids = itertools.count(1)
+        self._pool = None
+        self._estado = None
+        self._cancelados = None
+        self._siguiente_cancelado = 0
+
+    def _pool_activo(self):
+        if self._pool is None:
+            self._estado = multiprocessing.RawArray("q", self.procesos * _CAMPOS)
+            self._cancelados = multiprocessing.RawArray("q", TAM_CANCELADOS)
+            contador = multiprocessing.Value("i", 0)
+            self._pool = ProcessPoolExecutor(max_workers=self.procesos, initializer=_iniciar_worker,
+                                             initargs=(self._estado, self._cancelados, contador))
+        return self._pool
+
+    def _interrumpir(self, id_trabajo):
+        """Marca `id_trabajo` como cancelado y, si ya está corriendo, interrumpe a su worker."""
+        if self._cancelados is None:
+            return
+        # primero la marca: si el worker lo toma después, lo descarta al empezar
+        self._cancelados[self._siguiente_cancelado] = id_trabajo
+        self._siguiente_cancelado = (self._siguiente_cancelado + 1) % TAM_CANCELADOS
+        if not hasattr(signal, "SIGUSR1"):
+            return
+        for casillero in range(self.procesos):
+            if self._estado[casillero * _CAMPOS + _ACTUAL] == id_trabajo:
+                try:
+                    os.kill(self._estado[casillero * _CAMPOS + _PID], signal.SIGUSR1)
+                except ProcessLookupError:
+                    pass
+                return
+
+    def _semaforo(self):
+        loop = asyncio.get_running_loop()
+        semaforo = self._semaforos.get(loop)
+        if semaforo is None:
+            semaforo = self._semaforos[loop] = asyncio.Semaphore(self.concurrencia)
+        return semaforo
+
+    def _inicio(self, id_trabajo):
+        """Cuándo empezó a correr `id_trabajo` (time.monotonic_ns), o None si no está corriendo."""
+        if self._estado is None:
+            return None
+        for casillero in range(self.procesos):
+            if self._estado[casillero * _CAMPOS + _ACTUAL] == id_trabajo:
+                return self._estado[casillero * _CAMPOS + _INICIO]
+        return None
+
+    async def _esperar(self, envuelto, id_trabajo, timeout):
+        """Espera el resultado; el límite se cuenta desde que un worker empezó el trabajo."""
+        if timeout is None:
+            return await asyncio.shield(envuelto)
+        margen_ns = (timeout + MARGEN_TIMEOUT) * 1e9
+        while True:
+            hechos, _ = await asyncio.wait({envuelto}, timeout=ESPERA_SONDEO)
+            if hechos:
+                return envuelto.result()
+            inicio = self._inicio(id_trabajo)
+            if inicio is not None and time.monotonic_ns() - inicio > margen_ns:
+                raise TimeoutError(f"El cálculo superó el límite de {timeout} s")
+
+    async def ejecutar(self, funcion, *args, timeout=None):
+        """
+        Ejecuta funcion(*args) en el pool (funcion debe poder picklearse).
+
+        Raises:
+            TimeoutError: Si corre más que el límite de tiempo (la espera en la cola no cuenta)
+            asyncio.CancelledError: Si se cancela la tarea que espera
+        """
+        timeout = self.timeout if timeout is None else timeout
+        async with self._semaforo():
+            id_trabajo = next(self._ids)
+            pool = self._pool_activo()
+            futuro = pool.submit(_correr, id_trabajo, funcion, args, timeout)
+            envuelto = asyncio.wrap_future(futuro)
+            try:
+                return await self._esperar(envuelto, id_trabajo, timeout)
+            except (asyncio.CancelledError, TimeoutError):
+                if not futuro.cancel():
+                    self._interrumpir(id_trabajo)
+                envuelto.cancel()
+                raise
+            except BrokenProcessPool:
+                # un worker murió (ej: sin memoria): el próximo trabajo usa un pool nuevo
+                if self._pool is pool:
+                    self._pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    async def parse_function(self, expr_str, timeout=None, **opciones):
+        """Como domain.parser.parse_function (mismas opciones)."""
+        return await self.ejecutar(_tarea_parse, expr_str, opciones, timeout=timeout)
+
+    async def evaluar_funcion_en_punto(self, expr_str, x_valor, allowed_vars=None, timeout=None):
+        """Como graphics.graficos.evaluar_funcion_en_punto: (success, resultado, mensaje)."""
+        return await self.ejecutar(_tarea_evaluar, expr_str, x_valor, allowed_vars, timeout=timeout)
+
+    async def analizar(self, expr_str, secciones=_SECCIONES_ANALISIS, allowed_vars=("x",), timeout=None):
+        """
+        Corre las secciones pedidas de AnalisisFuncion.
+
+        Returns:
+            dict sección -> texto (ej: {"dominio": ..., "extremos": ...})
+        """
+        desconocidas = set(secciones) - set(_SECCIONES_ANALISIS)
+        if desconocidas:
+            raise ValueError(f"Secciones de análisis desconocidas: {sorted(desconocidas)}")
+        return await self.ejecutar(_tarea_analizar, expr_str, tuple(secciones), list(allowed_vars), timeout=timeout)
+
+    async def graficar_png(self, expr_str, timeout=None, **opciones):
+        """Como graphics.graficos.graficar_png: (success, png, mensaje)."""
+        return await self.ejecutar(_tarea_png, expr_str, opciones, timeout=timeout)
+
+    async def iterar_muestras(self, expr_str, rango_x=(-10, 10), puntos=1000, tam_bloque=65536,
+                              allowed_vars=("x",), adelanto=ADELANTO, timeout=None):
+        """
+        Versión asíncrona de iterar_muestras_desde_texto: entrega BloqueMuestras
+        en orden, calculando hasta `adelanto` bloques por adelantado.
+
+        Si el consumidor deja de iterar (break, aclose o cancelación), los
+        bloques pendientes se cancelan.
+
+        Raises:
+            ValueError: Si la expresión no se puede parsear
+        """
+        allowed_vars = list(allowed_vars)
+        intervalos = await self.ejecutar(_tarea_intervalos, expr_str, tuple(rango_x), allowed_vars, timeout=timeout)
+        trabajos = (
+            (intervalo, desde, min(desde + tam_bloque, puntos + 1), segmento)
+            for segmento, intervalo in enumerate(intervalos)
+            for desde in range(0, puntos + 1, tam_bloque)
+        )
+
+        pendientes = []
+
+        def pedir():
+            for intervalo, desde, hasta, segmento in itertools.islice(trabajos, adelanto + 1 - len(pendientes)):
+                pendientes.append(asyncio.ensure_future(self.ejecutar(
+                    _tarea_bloque, expr_str, allowed_vars, intervalo, puntos, desde, hasta, segmento,
+                    timeout=timeout)))
+
+        try:
+            pedir()
+            while pendientes:
+                bloque = await pendientes.pop(0)
+                pedir()
+                yield bloque
+        finally:
+            for tarea in pendientes:
+                tarea.cancel()
+            if pendientes:
+                await asyncio.gather(*pendientes, return_exceptions=True)
+
+    def cerrar(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.cerrar()
+
+
+_servicio = None
+
+
+def servicio_compartido():
+    """Servicio usado por las funciones sueltas (se crea al primer uso)."""
+    global _servicio
+    if _servicio is None:
+        _servicio = ServicioAsincrono()
+    return _servicio
+
+
+async def parse_function_async(expr_str, **opciones):
+    return await servicio_compartido().parse_function(expr_str, **opciones)
+
+
+async def evaluar_funcion_en_punto_async(expr_str, x_valor, allowed_vars=None):
+    return await servicio_compartido().evaluar_funcion_en_punto(expr_str, x_valor, allowed_vars)
+
+
+async def analizar_async(expr_str, secciones=_SECCIONES_ANALISIS):
+    return await servicio_compartido().analizar(expr_str, secciones)
+
+
+async def graficar_png_async(expr_str, **opciones):
+    return await servicio_compartido().graficar_png(expr_str, **opciones)
+
+
+def iterar_muestras_async(expr_str, rango_x=(-10, 10), puntos=1000, tam_bloque=65536):
+    return servicio_compartido().iterar_muestras(expr_str, rango_x, puntos, tam_bloque)
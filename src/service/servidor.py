@@ -0,0 +1,352 @@
+"""
+Servicio local de análisis (JSON-RPC 2.0 sobre HTTP, solo en localhost).
+
+Métodos: parse, evaluate, evaluate_batch, analyze y render_png. El trabajo se
+hace en un pool de procesos, así un simplify lento no bloquea los hilos que
+atienden HTTP. Cada pedido tiene su límite de tiempo y la cantidad de pedidos
+en curso está acotada: si la cola se llena se responde 503 de inmediato.
+
+Uso:
+    python src/service/servidor.py --puerto 8765 --procesos 4 --timeout 10 --cola 32
+"""
+import argparse
+import base64
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError as FuturesTimeout
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+# los workers nunca abren ventanas
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from domain.parser import ComplexityError, parse_function
+from domain.tiempo import limite_de_tiempo, TiempoAgotado
+
+
+# codigos JSON-RPC
+ERROR_PARSEO_JSON = -32700
+ERROR_PEDIDO_INVALIDO = -32600
+ERROR_METODO_NO_EXISTE = -32601
+ERROR_PARAMETROS = -32602
+ERROR_INTERNO = -32603
+ERROR_TIEMPO_AGOTADO = -32001
+ERROR_SERVIDOR_OCUPADO = -32002
+ERROR_DEMASIADO_COMPLEJA = -32003
+
+# cada cuánto se revisa si una tarea que ya empezó se pasó del margen
+ESPERA_SONDEO = 0.1
+
+
+class ErrorServicio(Exception):
+    """Error que se devuelve al cliente como error JSON-RPC."""
+
+    def __init__(self, codigo, mensaje):
+        # ambos en args para que se pueda picklear desde los workers
+        super().__init__(codigo, mensaje)
+        self.codigo = codigo
+        self.mensaje = mensaje
+
+
+# Tareas (corren dentro de los workers)
+
+def _parsear(params):
+    # "simplify" puede ser true/false o el nombre de una estrategia
+    simplificar = params.get("simplify", False)
+    resultado = parse_function(
+        params["expr"],
+        allowed_vars=params.get("allowed_vars", ["x"]),
+        simplify_expression=simplificar is True,
+        simplify_strategy=simplificar if isinstance(simplificar, str) else None,
+    )
+    if not resultado.is_valid:
+        codigo = ERROR_DEMASIADO_COMPLEJA if resultado.tipo_error is ComplexityError else ERROR_PARAMETROS
+        raise ErrorServicio(codigo, resultado.error)
+    return resultado
+
+
+def _a_json(valor):
+    # NaN/inf no son JSON valido
+    return valor if math.isfinite(valor) else None
+
+
+def _tarea_parse(params):
+    resultado = _parsear(params)
+    return {
+        "expr": str(resultado.expr),
+        "variables": resultado.variables,
+        "warnings": resultado.warnings,
+        "simplificacion": resultado.simplificacion,
+    }
+
+
+def _tarea_evaluate(params):
+    resultado = _parsear(params)
+    try:
+        valor = resultado.evaluate(**params.get("valores", {}))
+    except ValueError as e:
+        raise ErrorServicio(ERROR_PARAMETROS, str(e))
+    return {"valor": valor}
+
+
+def _tarea_evaluate_batch(params):
+    resultado = _parsear(params)
+    try:
+        ys = resultado.to_vectorized()(params["xs"])
+    except ValueError as e:
+        raise ErrorServicio(ERROR_PARAMETROS, str(e))
+    return {"valores": [_a_json(y) for y in ys.tolist()]}
+
+
+def _tarea_analyze(params):
+    from domain.analysis import AnalisisFuncion
+
+    resultado = _parsear(dict(params, simplify=params.get("simplify", "auto")))
+    analisis = AnalisisFuncion(resultado.expr)
+    return {
+        "dominio": analisis.dominio(),
+        "recorrido": analisis.recorrido(),
+        "intersecciones": analisis.intersecciones(),
+        "derivadas": analisis.derivadas(),
+        "monotonia": analisis.monotonia(),
+        "extremos": analisis.extremos(),
+        "asintotas": analisis.asintotas(),
+    }
+
+
+def _tarea_render_png(params):
+    from graphics.graficos import graficar_png
+
+    ok, png, mensaje = graficar_png(
+        params["expr"],
+        rango_x=tuple(params.get("rango_x", (-10, 10))),
+        rango_y=tuple(params["rango_y"]) if params.get("rango_y") else None,
+        ancho_px=params.get("ancho", 800),
+        alto_px=params.get("alto", 600),
+    )
+    if not ok:
+        raise ErrorServicio(ERROR_PARAMETROS, mensaje)
+    return {"png_base64": base64.b64encode(png).decode("ascii")}
+
+
+TAREAS = {
+    "parse": _tarea_parse,
+    "evaluate": _tarea_evaluate,
+    "evaluate_batch": _tarea_evaluate_batch,
+    "analyze": _tarea_analyze,
+    "render_png": _tarea_render_png,
+}
+
+
+# Cada worker ocupa un casillero de un arreglo compartido donde publica la
+# tarea que está corriendo y cuándo empezó (time.monotonic, común a todos los
+# procesos). Así el margen de seguridad se cuenta desde que la tarea empieza
+# y no desde que se encoló.
+
+_ID, _INICIO = 0, 1
+_inicios = None
+_casillero = None
+
+
+def _iniciar_worker(inicios, contador):
+    global _inicios, _casillero
+    with contador.get_lock():
+        _casillero = contador.value % (len(inicios) // 2)
+        contador.value += 1
+    _inicios = inicios
+
+
+def _ejecutar_tarea(id_tarea, metodo, params, timeout):
+    """Punto de entrada en el worker: aplica el límite de tiempo a la tarea."""
+    # primero el inicio: quien vea el id ya tiene la hora correcta
+    _inicios[_casillero * 2 + _INICIO] = time.monotonic()
+    _inicios[_casillero * 2 + _ID] = id_tarea
+    try:
+        with limite_de_tiempo(timeout):
+            return TAREAS[metodo](params)
+    except TiempoAgotado:
+        raise ErrorServicio(ERROR_TIEMPO_AGOTADO, f"El pedido superó el límite de {timeout} s")
+    except (KeyError, TypeError) as e:
+        raise ErrorServicio(ERROR_PARAMETROS, f"Parámetros inválidos: {e}")
+    finally:
+        _inicios[_casillero * 2 + _ID] = 0
+
+
+class ServicioAnalisis:
+    """
+    Pool de procesos con cola acotada.
+
+    Args:
+        procesos: Cantidad de workers
+        timeout: Segundos máximos por pedido
+        cola: Pedidos que pueden esperar además de los que están corriendo
+    """
+
+    def __init__(self, procesos=None, timeout=10.0, cola=32):
+        self.procesos = procesos or os.cpu_count() or 1
+        self.timeout = timeout
+        self._ids = itertools.count(1)
+        self._lock_pool = threading.Lock()
+        self._pool, self._inicios = self._crear_pool()
+        self._cupos = threading.BoundedSemaphore(self.procesos + cola)
+
+    def _crear_pool(self):
+        inicios = multiprocessing.RawArray("d", self.procesos * 2)
+        contador = multiprocessing.Value("i", 0)
+        pool = ProcessPoolExecutor(max_workers=self.procesos, initializer=_iniciar_worker,
+                                   initargs=(inicios, contador))
+        return pool, inicios
+
+    @staticmethod
+    def _inicio(inicios, id_tarea):
+        """Cuándo empezó a correr `id_tarea` (time.monotonic), o None si no está corriendo."""
+        for casillero in range(len(inicios) // 2):
+            if inicios[casillero * 2 + _ID] == id_tarea:
+                return inicios[casillero * 2 + _INICIO]
+        return None
+
+    def _reiniciar_pool(self, pool):
+        """Reemplaza un pool con un worker colgado (no respondió a su límite de tiempo)."""
+        with self._lock_pool:
+            if self._pool is not pool:
+                return  # otro hilo ya lo reinicio
+            self._pool, self._inicios = self._crear_pool()
+        # ProcessPoolExecutor no tiene API para matar workers
+        for proceso in list(getattr(pool, "_processes", {}).values()):
+            proceso.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _esperar(self, pool, inicios, id_tarea, futuro):
+        """
+        Espera el resultado; solo reinicia el pool si la tarea lleva corriendo
+        más que el margen (el tiempo en la cola no cuenta).
+        """
+        # margen extra por si el worker no alcanza a cortar (ej: codigo en C)
+        margen = self.timeout * 2 + 1
+        while True:
+            try:
+                return futuro.result(timeout=ESPERA_SONDEO)
+            except FuturesTimeout:
+                inicio = self._inicio(inicios, id_tarea)
+                if inicio is not None and time.monotonic() - inicio > margen:
+                    self._reiniciar_pool(pool)
+                    raise ErrorServicio(ERROR_TIEMPO_AGOTADO, f"El pedido superó el límite de {self.timeout} s")
+
+    def llamar(self, metodo, params):
+        if metodo not in TAREAS:
+            raise ErrorServicio(ERROR_METODO_NO_EXISTE, f"Método no existe: {metodo}")
+        if not isinstance(params, dict):
+            raise ErrorServicio(ERROR_PARAMETROS, "params debe ser un objeto")
+
+        if not self._cupos.acquire(blocking=False):
+            raise ErrorServicio(ERROR_SERVIDOR_OCUPADO, "Servidor ocupado, intenta más tarde")
+        try:
+            # si otro pedido se colgó y el pool se reinició, este (en cola o
+            # corriendo al lado) se manda una vez más al pool nuevo: las tareas
+            # no tienen efectos secundarios
+            for intento in range(2):
+                with self._lock_pool:
+                    pool, inicios = self._pool, self._inicios
+                id_tarea = next(self._ids)
+                futuro = pool.submit(_ejecutar_tarea, id_tarea, metodo, params, self.timeout)
+                try:
+                    return self._esperar(pool, inicios, id_tarea, futuro)
+                except (CancelledError, BrokenProcessPool):
+                    if intento == 0 and self._pool is not pool:
+                        continue
+                    raise ErrorServicio(ERROR_INTERNO, "Se reinició el worker que atendía el pedido, reintenta")
+        finally:
+            self._cupos.release()
+
+    def cerrar(self):
+        self._pool.shutdown(cancel_futures=True)
+
+
+def _respuesta(id_pedido, resultado=None, error=None):
+    cuerpo = {"jsonrpc": "2.0", "id": id_pedido}
+    if error is not None:
+        cuerpo["error"] = {"code": error.codigo, "message": error.mensaje}
+    else:
+        cuerpo["result"] = resultado
+    return cuerpo
+
+
+def crear_manejador(servicio):
+
+    class Manejador(BaseHTTPRequestHandler):
+
+        def _enviar(self, estado, cuerpo):
+            datos = json.dumps(cuerpo, ensure_ascii=False).encode("utf-8")
+            self.send_response(estado)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(datos)))
+            self.end_headers()
+            self.wfile.write(datos)
+
+        def do_POST(self):
+            try:
+                largo = int(self.headers.get("Content-Length", 0))
+                pedido = json.loads(self.rfile.read(largo) or b"null")
+            except (ValueError, UnicodeDecodeError):
+                self._enviar(400, _respuesta(None, error=ErrorServicio(ERROR_PARSEO_JSON, "JSON inválido")))
+                return
+
+            if not isinstance(pedido, dict) or "method" not in pedido:
+                self._enviar(400, _respuesta(None, error=ErrorServicio(ERROR_PEDIDO_INVALIDO, "Pedido inválido")))
+                return
+
+            id_pedido = pedido.get("id")
+            try:
+                resultado = servicio.llamar(pedido["method"], pedido.get("params", {}))
+                self._enviar(200, _respuesta(id_pedido, resultado))
+            except ErrorServicio as e:
+                estado = 503 if e.codigo == ERROR_SERVIDOR_OCUPADO else 200
+                self._enviar(estado, _respuesta(id_pedido, error=e))
+            except Exception as e:
+                self._enviar(500, _respuesta(id_pedido, error=ErrorServicio(ERROR_INTERNO, str(e))))
+
+        def log_message(self, format, *args):
+            # sin log por pedido, molesta en las pruebas de carga
+            pass
+
+    return Manejador
+
+
+def crear_servidor(puerto=8765, procesos=None, timeout=10.0, cola=32):
+    """Crea el servidor HTTP (sin arrancarlo). Solo escucha en 127.0.0.1."""
+    servicio = ServicioAnalisis(procesos, timeout, cola)
+    servidor = ThreadingHTTPServer(("127.0.0.1", puerto), crear_manejador(servicio))
+    servidor.daemon_threads = True
+    servidor.servicio = servicio
+    return servidor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servicio local de análisis de funciones")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--procesos", type=int, default=None, help="workers (por defecto, núcleos)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="segundos máximos por pedido")
+    parser.add_argument("--cola", type=int, default=32, help="pedidos en espera antes de responder 503")
+    args = parser.parse_args()
+
+    servidor = crear_servidor(args.puerto, args.procesos, args.timeout, args.cola)
+    print(f"Escuchando en http://127.0.0.1:{args.puerto} "
+          f"({servidor.servicio.procesos} procesos, timeout {args.timeout} s, cola {args.cola})")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        servidor.servicio.cerrar()
+
+
+if __name__ == "__main__":
+    main()
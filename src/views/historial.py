@@ -0,0 +1,143 @@
+"""
+Historial de la sesión con caché de resultados.
+
+Cada entrada guarda lo que se calculó para una (expresión, rango X, rango Y,
+x del punto resaltado): el ParseResult, las muestras, el punto, el texto del
+análisis y la imagen PNG ya renderizada, así volver a una entrada es instantáneo. La caché es LRU con un
+tope de memoria: cuando se pasa del tope se descartan las entradas usadas
+hace más tiempo.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# memoria máxima de la caché y cantidad máxima de entradas
+MAX_BYTES = 64 * 1024 * 1024
+MAX_ENTRADAS = 50
+
+# tamaño aproximado de un ParseResult (expresión de sympy y listas)
+_BYTES_PARSE = 4096
+
+
+def clave_historial(expr_str: str, rango_x, rango_y=None, x_punto=None) -> Tuple:
+    """Clave de una entrada; los espacios repetidos no cuentan."""
+    texto = " ".join(expr_str.split())
+    return (
+        texto,
+        tuple(float(v) for v in rango_x),
+        tuple(float(v) for v in rango_y) if rango_y is not None else None,
+        float(x_punto) if x_punto is not None else None,
+    )
+
+
+@dataclass
+class EntradaHistorial:
+    """Resultados guardados de una función con sus rangos."""
+    expr_str: str
+    rango_x: Tuple[float, float]
+    rango_y: Optional[Tuple[float, float]] = None
+    x_punto: Optional[float] = None
+    parse_result: object = None
+    muestras: object = None  # MuestrasCurva
+    punto: Optional[Tuple[float, float]] = None  # (x_punto, f(x_punto)); None si no está definida
+    analisis: Optional[str] = None
+    png: Optional[bytes] = None
+
+    @property
+    def nbytes(self) -> int:
+        total = _BYTES_PARSE
+        if self.muestras is not None:
+            total += self.muestras.nbytes
+        if self.analisis is not None:
+            total += len(self.analisis.encode("utf-8"))
+        if self.png is not None:
+            total += len(self.png)
+        return total
+
+    @property
+    def titulo(self) -> str:
+        texto = f"{self.expr_str}  x∈[{self.rango_x[0]:g}, {self.rango_x[1]:g}]"
+        if self.rango_y is not None:
+            texto += f" y∈[{self.rango_y[0]:g}, {self.rango_y[1]:g}]"
+        if self.x_punto is not None:
+            texto += f" x0={self.x_punto:g}"
+        return texto
+
+
+class CacheResultados:
+    """
+    Caché LRU de EntradaHistorial acotada por memoria y por cantidad.
+
+    `entradas()` devuelve las entradas de la más reciente a la más antigua,
+    que es el orden en que se muestran en el panel de historial.
+    """
+
+    def __init__(self, max_bytes: int = MAX_BYTES, max_entradas: int = MAX_ENTRADAS):
+        self.max_bytes = max_bytes
+        self.max_entradas = max_entradas
+        self._entradas = OrderedDict()
+        self._bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __contains__(self, clave):
+        return clave in self._entradas
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def obtener(self, clave) -> Optional[EntradaHistorial]:
+        """Entrada de la clave (la marca como la más reciente), o None."""
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            self.fallos += 1
+            return None
+        self._entradas.move_to_end(clave)
+        self.aciertos += 1
+        return entrada
+
+    def guardar(self, clave, entrada: EntradaHistorial) -> EntradaHistorial:
+        """Guarda (o reemplaza) la entrada y descarta las más antiguas si hace falta."""
+        anterior = self._entradas.pop(clave, None)
+        if anterior is not None:
+            self._bytes -= anterior.nbytes
+        self._entradas[clave] = entrada
+        self._bytes += entrada.nbytes
+        self._recortar()
+        return entrada
+
+    def actualizar(self, clave, **campos) -> EntradaHistorial:
+        """Completa campos de una entrada (la crea si no existe), ej: el análisis."""
+        entrada = self._entradas.pop(clave, None)
+        if entrada is None:
+            entrada = EntradaHistorial(*clave)
+        else:
+            self._bytes -= entrada.nbytes
+        for nombre, valor in campos.items():
+            setattr(entrada, nombre, valor)
+        return self.guardar(clave, entrada)
+
+    def buscar_analisis(self, expr_str: str) -> Optional[str]:
+        """El análisis no depende del rango: sirve el de cualquier entrada de la misma expresión."""
+        texto = " ".join(expr_str.split())
+        for (expr, *_), entrada in reversed(self._entradas.items()):
+            if expr == texto and entrada.analisis is not None:
+                return entrada.analisis
+        return None
+
+    def entradas(self):
+        return [(clave, entrada) for clave, entrada in reversed(self._entradas.items())]
+
+    def limpiar(self):
+        self._entradas.clear()
+        self._bytes = 0
+
+    def _recortar(self):
+        # siempre queda al menos la entrada recién guardada
+        while len(self._entradas) > 1 and (self._bytes > self.max_bytes or len(self._entradas) > self.max_entradas):
+            _, descartada = self._entradas.popitem(last=False)
+            self._bytes -= descartada.nbytes
@@ -1,24 +1,45 @@
+import base64
+import math
 import sys
 import os
 import tkinter as tk
 import customtkinter as ctk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
 from tkinter import ttk
 from typing import Optional
 
 import sympy as sp
 
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# mismo esquema de imports que graphics/graficos.py, asi domain.* se carga una sola vez
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 # Importar lógica de dominio y gráficos
-from src.domain.parser import parse_function
-from src.domain.analysis import AnalisisFuncion, x as sym_x
-from src.graphics.graficos import graficar_funcion_desde_texto, evaluar_funcion_en_punto
+from domain.parser import parse_function
+from domain.analysis import AnalisisFuncion, x as sym_x
+from graphics.graficos import (graficar_funcion, evaluar_funcion_en_punto, graficar_superpuestas, puntos_para_ancho,
+                               graficar_parametrica_desde_texto, graficar_implicita_desde_texto)
+from graphics.curvas import separar_parametrica
+from graphics.exportacion import exportar_muestras
+from graphics.muestreo import MuestrasCurva, tabla_de_valores
+from graphics.pipeline import pipeline_grafico
+from views.historial import CacheResultados, clave_historial
+from views.parametros import VentanaParametros
+from views.tabla import TablaVirtual
 
 # Configuración principal
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# máximo de filas de la tabla de valores (dos columnas float64: 160 MB)
+MAX_FILAS_TABLA = 10_000_000
+
+# tamaño de la vista previa del gráfico (px)
+ANCHO_PREVIA = 480
+ALTO_PREVIA = 340
+
+# ancho de la ventana externa (figsize=(10, 8) de construir_figura a 100 dpi)
+ANCHO_VENTANA = 1000
+
 
 class MainApp(ctk.CTk):
     def __init__(self):
@@ -28,6 +49,11 @@ class MainApp(ctk.CTk):
         self.geometry("1100x720")
         self.minsize(950, 640)
 
+        self.cache = CacheResultados()
+        # etapas del gráfico ya calculadas (al cambiar solo el rango no se vuelve a parsear)
+        self.pipeline = pipeline_grafico()
+        self._imagen_previa = None  # referencia para que tk no borre la imagen
+
         self.constrir_interfaz()
 
     # Interfaz
@@ -58,6 +84,12 @@ class MainApp(ctk.CTk):
         self.entrada_xmax = ctk.CTkEntry(entradas_frame, width=90, placeholder_text="xmax")
         self.entrada_xmax.grid(row=1, column=1, sticky="w", padx=(100,2), pady=4)
 
+        # paso de la tabla de valores
+        label_paso = ctk.CTkLabel(entradas_frame, text="Paso =", font=("Arial", 14))
+        label_paso.grid(row=1, column=2, padx=(30, 4), pady=4, sticky="e")
+        self.entrada_paso = ctk.CTkEntry(entradas_frame, width=100, placeholder_text="Tabla: 0.1")
+        self.entrada_paso.grid(row=1, column=3, padx=4, pady=4)
+
         # rango y grafico (opcional)
         label_rango_y = ctk.CTkLabel(entradas_frame, text="Rango Y (Opcional):", font=("Arial", 14))
         label_rango_y.grid(row=2, column=0, padx=6, pady=4, sticky="e")
@@ -79,6 +111,26 @@ class MainApp(ctk.CTk):
         graficar_boton = ctk.CTkButton(botones_frame, text="Graficar", command=self.graficar)
         graficar_boton.pack(side="left", padx=6, pady=6)
 
+        superponer_boton = ctk.CTkButton(botones_frame, text="Superponer", command=self.superponer)
+        superponer_boton.pack(side="left", padx=6, pady=6)
+
+        tabla_boton = ctk.CTkButton(botones_frame, text="Tabla", command=self.tabular)
+        tabla_boton.pack(side="left", padx=6, pady=6)
+
+        parametros_boton = ctk.CTkButton(botones_frame, text="Parámetros", command=self.parametros)
+        parametros_boton.pack(side="left", padx=6, pady=6)
+
+        curva_boton = ctk.CTkButton(botones_frame, text="Curva", command=self.curva)
+        curva_boton.pack(side="left", padx=6, pady=6)
+
+        self.var_tangente = tk.BooleanVar(value=False)
+        tangente_check = ctk.CTkCheckBox(botones_frame, text="Tangente (mouse)", variable=self.var_tangente)
+        tangente_check.pack(side="left", padx=6, pady=6)
+
+        self.var_ventana = tk.BooleanVar(value=False)
+        ventana_check = ctk.CTkCheckBox(botones_frame, text="Ventana externa", variable=self.var_ventana)
+        ventana_check.pack(side="left", padx=6, pady=6)
+
         limpiar_boton = ctk.CTkButton(botones_frame, text="Limpiar", fg_color="gray30", command=self.clear_outputs)
         limpiar_boton.pack(side="left", padx=6, pady=6)
 
@@ -105,8 +157,25 @@ class MainApp(ctk.CTk):
         frame_derecha = ctk.CTkFrame(division_inferior)
         frame_derecha.pack(side="left", fill="both", expand=True, padx=(5,0), pady=5)
 
-        self.label_instrucciones = ctk.CTkLabel(frame_derecha, text="Usa 'Graficar' para mostrar la función en una ventana externa.\n\nPuedes especificar rangos X e Y personalizados para controlar mejor la visualización.", wraplength=420, font=("Arial", 14))
-        self.label_instrucciones.pack(padx=20, pady=20)
+        self.label_instrucciones = ctk.CTkLabel(frame_derecha, text="Usa 'Graficar' para ver la función aquí (o en una ventana externa si marcas la opción).", wraplength=420, font=("Arial", 14))
+        self.label_instrucciones.pack(padx=20, pady=(10, 4))
+
+        # vista previa del gráfico
+        self.label_previa = tk.Label(frame_derecha, bg="gray20", width=ANCHO_PREVIA, height=ALTO_PREVIA)
+        self.label_previa.pack(padx=10, pady=4)
+
+        # historial de la sesión (más reciente arriba)
+        lbl_hist = ctk.CTkLabel(frame_derecha, text="Historial", font=("Arial", 14, "bold"))
+        lbl_hist.pack(anchor="w", padx=10, pady=(6, 2))
+        historial_frame = ctk.CTkFrame(frame_derecha)
+        historial_frame.pack(fill="x", padx=10, pady=(0, 4))
+        self.lista_historial = tk.Listbox(historial_frame, height=5, font=("Consolas", 11), activestyle="none", exportselection=False)
+        self.lista_historial.pack(side="left", fill="both", expand=True)
+        scroll_historial = tk.Scrollbar(historial_frame, command=self.lista_historial.yview)
+        scroll_historial.pack(side="right", fill="y")
+        self.lista_historial.configure(yscrollcommand=scroll_historial.set)
+        self.lista_historial.bind("<<ListboxSelect>>", self._seleccionar_historial)
+        self._claves_historial = []
 
         ayuda_texto = ("Formato soportado:\n"
                       " - Multiplicación implícita: 2x -> 2*x automático\n"
@@ -114,6 +183,11 @@ class MainApp(ctk.CTk):
                       " - Funciones: sin, cos, tan, exp, log, sqrt, abs ...\n"
                       " - Constantes: pi, e\n"
                       " - Rango Y: Útil para funciones con asíntotas\n"
+                      " - Superponer: separar funciones con ; (ej: x^2; 2x)\n"
+                      " - Historial: clic en una entrada para volver a verla\n"
+                      " - Tabla: f(x) en el rango X cada 'Paso' (exportable)\n"
+                      " - Parámetros: letras libres con deslizadores (ej: a*sin(b*x) + c)\n"
+                      " - Curva: (cos(t), sin(t)) con t en el rango X, o x^2 + y^2 = 1\n"
                       "Ejemplo: (x^2 - 1)/(x-2) + sin(x)")
         self.label_ayuda = ctk.CTkLabel(frame_derecha, text=ayuda_texto, justify="left", anchor="w")
         self.label_ayuda.pack(padx=15, pady=10, fill="x")
@@ -139,7 +213,7 @@ class MainApp(ctk.CTk):
         if not expr_str:
             messagebox.showwarning("Entrada vacía", "Ingresa una función en el campo f(x).")
             return None
-        result = parse_function(expr_str, allowed_vars=['x'], simplify_expression=True)
+        result = parse_function(expr_str, allowed_vars=['x'], simplify_strategy="auto")
         self.txt_warnings.delete("1.0", "end")
         if not result.is_valid:
             self._append_warning(f"Error: {result.error}")
@@ -148,22 +222,161 @@ class MainApp(ctk.CTk):
             self._append_warning(w)
         return result.expr
 
-    # Acciones de los botones
-    def analizar(self):
-        self._append_result("===== Análisis de función =====")
-        expr = self._parse_expr()
-        if expr is None:
+    def _leer_rangos(self, avisar=True):
+        """Lee los rangos X e Y de la interfaz; devuelve None si son inválidos."""
+        # rango X
+        xmin = self.entrada_xmin.get().strip()
+        xmax = self.entrada_xmax.get().strip()
+        try:
+            if xmin and xmax:
+                rxmin = float(xmin)
+                rxmax = float(xmax)
+                if rxmin >= rxmax:
+                    raise ValueError("xmin debe ser menor que xmax")
+                rango_x = (rxmin, rxmax)
+            else:
+                rango_x = (-10, 10)
+        except ValueError as e:
+            if avisar:
+                messagebox.showerror("Rango X inválido", f"Revisa los valores de rango X: {e}")
+            return None
+
+        # rango Y (opcional)
+        ymin = self.entrada_ymin.get().strip()
+        ymax = self.entrada_ymax.get().strip()
+        rango_y = None
+        try:
+            if ymin and ymax:
+                rymin = float(ymin)
+                rymax = float(ymax)
+                if rymin >= rymax:
+                    raise ValueError("ymin debe ser menor que ymax")
+                rango_y = (rymin, rymax)
+                if avisar:
+                    self._append_result(f"Usando rango Y personalizado: [{rymin}, {rymax}]")
+        except ValueError as e:
+            if avisar:
+                messagebox.showerror("Rango Y inválido", f"Revisa los valores de rango Y: {e}")
+            return None
+
+        return rango_x, rango_y
+
+    def _leer_x_punto(self, avisar=True) -> Optional[float]:
+        """x del punto a resaltar, o None si el campo está vacío o no es un número."""
+        x_raw = self.entrada_x.get().strip()
+        if not x_raw:
+            return None
+        try:
+            return float(x_raw)
+        except ValueError:
+            if avisar:
+                self._append_warning("No se pudo interpretar x para graficar el punto.")
+            return None
+
+    # historial
+    def _refrescar_historial(self):
+        self.lista_historial.delete(0, "end")
+        self._claves_historial = []
+        for clave, entrada in self.cache.entradas():
+            self.lista_historial.insert("end", entrada.titulo)
+            self._claves_historial.append(clave)
+
+    def _mostrar_entrada(self, entrada):
+        """Muestra lo guardado de una entrada: gráfico en la vista previa y análisis."""
+        if entrada.png is not None:
+            self._imagen_previa = tk.PhotoImage(data=base64.b64encode(entrada.png))
+            self.label_previa.configure(image=self._imagen_previa, width=ANCHO_PREVIA, height=ALTO_PREVIA)
+        if entrada.analisis is not None:
+            self._append_result(entrada.analisis)
+
+    def _seleccionar_historial(self, _event=None):
+        seleccion = self.lista_historial.curselection()
+        if not seleccion:
+            return
+        clave = self._claves_historial[seleccion[0]]
+        entrada = self.cache.obtener(clave)
+        if entrada is None:
+            self._refrescar_historial()
             return
+
+        # volver a dejar la función y los rangos en las entradas
+        for campo, valor in ((self.entrada_funcion, entrada.expr_str),
+                             (self.entrada_xmin, f"{entrada.rango_x[0]:g}"),
+                             (self.entrada_xmax, f"{entrada.rango_x[1]:g}"),
+                             (self.entrada_ymin, f"{entrada.rango_y[0]:g}" if entrada.rango_y else ""),
+                             (self.entrada_ymax, f"{entrada.rango_y[1]:g}" if entrada.rango_y else ""),
+                             (self.entrada_x, f"{entrada.x_punto:g}" if entrada.x_punto is not None else "")):
+            campo.delete(0, "end")
+            if valor:
+                campo.insert(0, valor)
+
+        self._append_result(f"===== Historial: {entrada.titulo} =====")
+        self._mostrar_entrada(entrada)
+        self._refrescar_historial()
+
+    def _etapas(self, objetivos, expr_str, rango_x, rango_y=None, x_punto=None, ancho_px=ANCHO_PREVIA,
+                alto_px=ALTO_PREVIA):
+        """
+        Corre el pipeline de gráfico (solo las etapas cuyas entradas cambiaron).
+
+        Returns:
+            dict etapa -> valor, o None si hubo un error (ya informado)
+        """
         try:
-            analisis = AnalisisFuncion(expr)
-            self._append_result(analisis.dominio())
-            self._append_result("")
-            self._append_result(analisis.recorrido())
-            self._append_result("")
-            self._append_result(analisis.intersecciones())
-            self._append_result("---------------------------------------------")
+            valores = self.pipeline.calcular(
+                objetivos, expr_str=expr_str, rango_x=rango_x, rango_y=rango_y, x_punto=x_punto,
+                puntos=puntos_para_ancho(ancho_px), ancho_px=ancho_px, alto_px=alto_px, dpi=80)
+        except ValueError as e:
+            self._append_warning(str(e))
+            return None
         except Exception as e:
-            self._append_warning(f"Error en análisis: {e}")
+            self._append_warning(f"Error al graficar: {e}")
+            return None
+        self._append_result(f"Etapas recalculadas: {', '.join(self.pipeline.ultimas_etapas) or 'ninguna'}")
+        return valores
+
+    def _calcular_grafico(self, expr_str, rango_x, rango_y, x_punto, clave):
+        """Calcula la vista previa (con el punto resaltado, si hay) y la guarda en la caché."""
+        valores = self._etapas(["parse", "muestras", "punto", "png"], expr_str, rango_x, rango_y, x_punto)
+        if valores is None:
+            return None
+        return self.cache.actualizar(clave, parse_result=valores["parse"], muestras=valores["muestras"],
+                                     punto=valores["punto"], png=valores["png"],
+                                     analisis=self.cache.buscar_analisis(expr_str))
+
+    def _texto_analisis(self, expr) -> str:
+        analisis = AnalisisFuncion(expr)
+        return "\n".join([
+            analisis.dominio(), "",
+            analisis.recorrido(), "",
+            analisis.intersecciones(), "",
+            analisis.derivadas(),
+            analisis.monotonia(),
+            analisis.extremos(),
+            analisis.asintotas(),
+        ])
+
+    # Acciones de los botones
+    def analizar(self):
+        self._append_result("===== Análisis de función =====")
+        expr_str = self._get_function_text()
+        texto = self.cache.buscar_analisis(expr_str) if expr_str else None
+        if texto is None:
+            expr = self._parse_expr()
+            if expr is None:
+                return
+            try:
+                texto = self._texto_analisis(expr)
+            except Exception as e:
+                self._append_warning(f"Error en análisis: {e}")
+                return
+        rangos = self._leer_rangos(avisar=False)
+        if rangos is not None:
+            self.cache.actualizar(clave_historial(expr_str, *rangos, self._leer_x_punto(avisar=False)),
+                                  analisis=texto)
+            self._refrescar_historial()
+        self._append_result(texto)
+        self._append_result("---------------------------------------------")
 
     def evaluar(self):
         expr_str = self._get_function_text()
@@ -191,66 +404,171 @@ class MainApp(ctk.CTk):
             messagebox.showwarning("Entrada vacía", "Ingresa una función primero.")
             return
         
-        # rango X
-        xmin = self.entrada_xmin.get().strip()
-        xmax = self.entrada_xmax.get().strip()
-        try:
-            if xmin and xmax:
-                rxmin = float(xmin)
-                rxmax = float(xmax)
-                if rxmin >= rxmax:
-                    raise ValueError("xmin debe ser menor que xmax")
-                rango_x = (rxmin, rxmax)
+        rangos = self._leer_rangos()
+        if rangos is None:
+            return
+        rango_x, rango_y = rangos
+        # punto para resaltarlo si se ingresó (con la expresión sin simplificar, como 'Evaluar')
+        x_punto = self._leer_x_punto()
+
+        # si ya se graficó con los mismos rangos y el mismo punto se muestra lo guardado
+        clave = clave_historial(expr_str, rango_x, rango_y, x_punto)
+        entrada = self.cache.obtener(clave)
+        if entrada is not None and entrada.png is not None:
+            self._append_result("Gráfico: recuperado del historial")
+        else:
+            entrada = self._calcular_grafico(expr_str, rango_x, rango_y, x_punto, clave)
+            if entrada is None:
+                return
+            self._append_result("Gráfico: función graficada exitosamente")
+        if x_punto is not None:
+            if entrada.punto is not None:
+                self._append_result(f"(Graficar) f({x_punto}) = {entrada.punto[1]}")
             else:
-                rango_x = (-10, 10)
-        except ValueError as e:
-            messagebox.showerror("Rango X inválido", f"Revisa los valores de rango X: {e}")
+                self._append_warning(f"Error al evaluar: f({x_punto}) no está definida")
+        self._mostrar_entrada(entrada)
+        self._refrescar_historial()
+
+        # la ventana externa es interactiva (zoom, tangente con el mouse)
+        if not (self.var_ventana.get() or self.var_tangente.get()):
             return
 
-        # rango Y (opcional)
-        ymin = self.entrada_ymin.get().strip()
-        ymax = self.entrada_ymax.get().strip()
-        rango_y = None
+        valores = self._etapas(["funcion", "muestras", "punto"], expr_str, rango_x, x_punto=x_punto,
+                               ancho_px=ANCHO_VENTANA)
+        if valores is None:
+            return
+        graficar_funcion(valores["funcion"], expr_str, punto_evaluado=valores["punto"], rango_x=rango_x,
+                         rango_y=rango_y, tangente=self.var_tangente.get(), muestras=valores["muestras"])
+        self._append_result("Gráfico: Función graficada exitosamente")
+
+    def parametros(self):
+        expr_str = self._get_function_text()
+        if not expr_str:
+            messagebox.showwarning("Entrada vacía", "Ingresa una función con parámetros (ej: a*sin(b*x) + c).")
+            return
+        rangos = self._leer_rangos()
+        if rangos is None:
+            return
+        rango_x, rango_y = rangos
+
+        # cualquier símbolo libre además de x es un parámetro
+        result = parse_function(expr_str, allowed_vars=None, simplify_strategy="auto")
+        self.txt_warnings.delete("1.0", "end")
+        if not result.is_valid:
+            self._append_warning(f"Error: {result.error}")
+            return
+        parametros = [v for v in result.variables if v != 'x']
+        if not parametros:
+            self._append_warning("La función no tiene parámetros; usa 'Graficar'.")
+            return
         try:
-            if ymin and ymax:
-                rymin = float(ymin)
-                rymax = float(ymax)
-                if rymin >= rymax:
-                    raise ValueError("ymin debe ser menor que ymax")
-                rango_y = (rymin, rymax)
-                self._append_result(f"Usando rango Y personalizado: [{rymin}, {rymax}]")
-        except ValueError as e:
-            messagebox.showerror("Rango Y inválido", f"Revisa los valores de rango Y: {e}")
+            VentanaParametros(self, expr_str, result, rango_x, rango_y)
+        except Exception as e:
+            self._append_warning(f"Error al graficar: {e}")
             return
+        self._append_result(f"Parámetros: {', '.join(parametros)} (mover los deslizadores)")
 
-        # evaluar punto para resaltarlo si se ingresó
-        punto = None
-        x_raw = self.entrada_x.get().strip()
-        if x_raw:
-            try:
-                x_val = float(x_raw)
-                success_eval, res_eval, mensaje_eval = evaluar_funcion_en_punto(expr_str, x_val)
-                if success_eval:
-                    punto = (x_val, res_eval)
-                    self._append_result(f"(Graficar) {mensaje_eval}")
-                else:
-                    self._append_warning(mensaje_eval)
-            except ValueError:
-                self._append_warning("No se pudo interpretar x para graficar el punto.")
+    def curva(self):
+        texto = self._get_function_text()
+        if not texto:
+            messagebox.showwarning("Entrada vacía", "Ingresa (x(t), y(t)) o una ecuación en x e y.")
+            return
+        rangos = self._leer_rangos()
+        if rangos is None:
+            return
+        rango_x, rango_y = rangos
+
+        self.txt_warnings.delete("1.0", "end")
+        partes = separar_parametrica(texto)
+        if partes is not None:
+            # para una paramétrica el rango X de la interfaz es el de t
+            ok, mensaje, _ = graficar_parametrica_desde_texto(*partes, rango_t=rango_x, rango_y=rango_y)
+        else:
+            ok, mensaje, _ = graficar_implicita_desde_texto(texto, rango_x, rango_y)
+        if ok:
+            self._append_result(f"Curva: {mensaje}")
+        else:
+            self._append_warning(mensaje)
 
-        success, msg, parse_result = graficar_funcion_desde_texto(
-            expr_str,
-            rango_x=rango_x,
-            rango_y=rango_y,  # Nuevo parámetro
-            punto_evaluado=punto,
-            intersecciones=None  
-        )
+    def superponer(self):
+        expresiones = [e.strip() for e in self._get_function_text().split(";") if e.strip()]
+        if not expresiones:
+            messagebox.showwarning("Entrada vacía", "Ingresa una o más funciones separadas por ';'.")
+            return
+
+        rangos = self._leer_rangos()
+        if rangos is None:
+            return
+        rango_x, rango_y = rangos
+
+        success, msg, _ = graficar_superpuestas(expresiones, rango_x=rango_x, rango_y=rango_y)
         if not success:
             self._append_warning(msg)
         else:
             self._append_result(f"Gráfico: {msg}")
 
 
+    def tabular(self):
+        expr_str = self._get_function_text()
+        if not expr_str:
+            messagebox.showwarning("Entrada vacía", "Ingresa una función primero.")
+            return
+        rangos = self._leer_rangos()
+        if rangos is None:
+            return
+        inicio, fin = rangos[0]
+        try:
+            paso = float(self.entrada_paso.get().strip() or 0.1)
+            if not (paso > 0 and math.isfinite(paso)):
+                raise ValueError("el paso debe ser positivo")
+        except ValueError as e:
+            messagebox.showerror("Paso inválido", f"Revisa el paso de la tabla: {e}")
+            return
+        filas = int((fin - inicio) / paso) + 1
+        if filas > MAX_FILAS_TABLA:
+            messagebox.showerror("Tabla muy grande", f"Serían {filas:,} filas; el máximo es {MAX_FILAS_TABLA:,}. Usa un paso mayor.")
+            return
+
+        result = parse_function(expr_str, allowed_vars=['x'], simplify_strategy="auto")
+        if not result.is_valid:
+            self._append_warning(f"Error: {result.error}")
+            return
+        try:
+            xs, ys = tabla_de_valores(result.to_vectorized(), inicio, fin, paso)
+        except Exception as e:
+            self._append_warning(f"Error al tabular: {e}")
+            return
+        self._append_result(f"Tabla: {len(xs):,} filas de f(x) = {expr_str} en [{inicio:g}, {fin:g}] cada {paso:g}")
+        self._abrir_tabla(expr_str, xs, ys)
+
+    def _abrir_tabla(self, expr_str, xs, ys):
+        ventana = ctk.CTkToplevel(self)
+        ventana.title(f"Tabla de valores - f(x) = {expr_str}")
+        ventana.geometry("520x600")
+
+        barra = ctk.CTkFrame(ventana)
+        barra.pack(fill="x", padx=8, pady=6)
+        ctk.CTkLabel(barra, text=f"{len(xs):,} filas").pack(side="left", padx=6)
+
+        def exportar():
+            ruta = filedialog.asksaveasfilename(parent=ventana, defaultextension=".csv",
+                                                filetypes=[("CSV", "*.csv"), ("NumPy", "*.npy")])
+            if not ruta:
+                return
+            try:
+                # se escribe por bloques desde los arreglos, sin armar el texto de todas las filas
+                info = exportar_muestras(ruta, MuestrasCurva(xs, ys, [0, len(xs)]))
+                self._append_result(f"Tabla exportada: {info['puntos']:,} filas en {info['ruta']}")
+            except Exception as e:
+                messagebox.showerror("No se pudo exportar", str(e), parent=ventana)
+
+        ctk.CTkButton(barra, text="Exportar...", width=110, command=exportar).pack(side="right", padx=6)
+
+        tabla = TablaVirtual(ventana, columnas=("x", "f(x)"))
+        tabla.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        tabla.cargar(xs, ys)
+
+
 if __name__ == "__main__":
     app = MainApp()
     app.mainloop()
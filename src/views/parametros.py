@@ -0,0 +1,120 @@
+"""
+Ventana con deslizadores para funciones con parámetros (ej: a*sin(b*x) + c).
+
+La gráfica va embebida (FigureCanvasTkAgg) y al mover un deslizador solo se
+evalúa la función ya compilada sobre la grilla fija (ver
+graphics.parametros), se cambian los datos de la línea con set_ydata y se
+redibuja solo esa línea sobre el fondo guardado (blitting). Los movimientos
+que llegan antes de que Tk quede libre se juntan en una sola actualización.
+"""
+import os
+import sys
+import time
+
+import customtkinter as ctk
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from graphics.graficos import puntos_para_ancho
+from graphics.parametros import FamiliaParametrica, RANGO_PARAMETRO, limites_y
+
+
+ANCHO_FIGURA = 760
+ALTO_FIGURA = 480
+DPI = 100
+PASOS_DESLIZADOR = 2000
+
+
+class VentanaParametros(ctk.CTkToplevel):
+    """
+    Args:
+        master: Ventana principal
+        expr_str: Texto de la función (para el título)
+        parse_result: ParseResult válido con x y los parámetros como variables
+        rango_x: Tupla (min, max)
+        rango_y: Tupla (min, max) fija, o None para calcularla con los valores iniciales
+    """
+
+    def __init__(self, master, expr_str, parse_result, rango_x, rango_y=None):
+        super().__init__(master)
+        self.title(f"Parámetros - f(x) = {expr_str}")
+
+        self.familia = FamiliaParametrica(parse_result, rango_x, puntos_para_ancho(ANCHO_FIGURA))
+        self.valores = self.familia.valores_iniciales()
+        self._rango_y_fijo = rango_y
+        self._fondo = None
+        self._pendiente = False
+        self.tiempo_ultima = 0.0
+
+        self.figura = Figure(figsize=(ANCHO_FIGURA / DPI, ALTO_FIGURA / DPI), dpi=DPI)
+        self.ax = self.figura.subplots()
+        self.ax.set_title(f"f(x) = {expr_str}", fontsize=13)
+        self.ax.grid(True, linestyle='--', linewidth=0.5)
+        self.ax.axhline(0, color='black', linewidth=0.8)
+        self.ax.axvline(0, color='black', linewidth=0.8)
+        self.ax.set_xlim(*rango_x)
+        # animated: la línea no entra en el fondo, se dibuja aparte en cada actualización
+        self.linea, = self.ax.plot(self.familia.x, self.familia.x * 0, color='C0', animated=True)
+        self._ajustar_y()
+
+        self.canvas = FigureCanvasTkAgg(self.figura, master=self)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=8, pady=(8, 4))
+        self.canvas.mpl_connect("draw_event", self._al_dibujar)
+
+        controles = ctk.CTkFrame(self)
+        controles.pack(fill="x", padx=8, pady=(0, 8))
+        self._etiquetas = {}
+        for fila, nombre in enumerate(self.familia.parametros):
+            ctk.CTkLabel(controles, text=f"{nombre} =", width=40).grid(row=fila, column=0, padx=4, pady=2)
+            deslizador = ctk.CTkSlider(controles, from_=RANGO_PARAMETRO[0], to=RANGO_PARAMETRO[1],
+                                       number_of_steps=PASOS_DESLIZADOR,
+                                       command=lambda valor, nombre=nombre: self._mover(nombre, valor))
+            deslizador.set(self.valores[nombre])
+            deslizador.grid(row=fila, column=1, sticky="ew", padx=4, pady=2)
+            self._etiquetas[nombre] = ctk.CTkLabel(controles, text=f"{self.valores[nombre]:.2f}", width=60)
+            self._etiquetas[nombre].grid(row=fila, column=2, padx=4, pady=2)
+        controles.grid_columnconfigure(1, weight=1)
+
+        abajo = ctk.CTkFrame(self)
+        abajo.pack(fill="x", padx=8, pady=(0, 8))
+        ctk.CTkButton(abajo, text="Reajustar Y", width=110, command=self._reajustar).pack(side="left", padx=4)
+        self.label_tiempo = ctk.CTkLabel(abajo, text="")
+        self.label_tiempo.pack(side="right", padx=4)
+
+    def _ajustar_y(self):
+        y = self.familia.evaluar(self.valores)
+        rango_y = self._rango_y_fijo or limites_y(y)
+        self.ax.set_ylim(*rango_y)
+        self.linea.set_ydata(self.familia.evaluar(self.valores, alto_vista=rango_y[1] - rango_y[0]))
+
+    def _reajustar(self):
+        self._rango_y_fijo = None
+        self._ajustar_y()
+        self.canvas.draw_idle()
+
+    def _al_dibujar(self, event):
+        # después de cada redibujado completo (inicio, cambio de tamaño) se guarda el fondo
+        self._fondo = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.linea)
+
+    def _mover(self, nombre, valor):
+        self.valores[nombre] = float(valor)
+        self._etiquetas[nombre].configure(text=f"{valor:.2f}")
+        if not self._pendiente:
+            self._pendiente = True
+            self.after_idle(self._actualizar)
+
+    def _actualizar(self):
+        self._pendiente = False
+        inicio = time.perf_counter()
+        limites = self.ax.get_ylim()
+        self.linea.set_ydata(self.familia.evaluar(self.valores, alto_vista=limites[1] - limites[0]))
+        if self._fondo is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._fondo)
+        self.ax.draw_artist(self.linea)
+        self.canvas.blit(self.ax.bbox)
+        self.tiempo_ultima = time.perf_counter() - inicio
+        self.label_tiempo.configure(text=f"actualización: {self.tiempo_ultima * 1000:.1f} ms")
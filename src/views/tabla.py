@@ -0,0 +1,135 @@
+"""
+Tabla de valores virtualizada.
+
+La tabla guarda solo los arreglos numpy de cada columna. En el Canvas se
+dibujan únicamente las filas visibles (se reutilizan los mismos items al
+desplazarse) y el texto de cada celda se arma al momento de dibujarla, así
+una tabla de un millón de filas se abre y se recorre igual que una de diez.
+"""
+import math
+import tkinter as tk
+
+import numpy as np
+
+
+ALTO_FILA = 22
+ANCHO_COLUMNA = 200
+FUENTE = ("Consolas", 11)
+COLOR_FONDO = ("#2b2b2b", "#323232")  # filas alternadas
+COLOR_TEXTO = "white"
+COLOR_ENCABEZADO = "#1f538d"
+
+
+def formatear_valor(valor: float) -> str:
+    if math.isnan(valor):
+        return "no definida"
+    return f"{valor:.10g}"
+
+
+class TablaVirtual(tk.Frame):
+    """
+    Tabla de solo lectura sobre arreglos numpy.
+
+    Args:
+        master: Widget padre
+        columnas: Títulos de las columnas
+        formato: float -> str para cada celda (por defecto formatear_valor)
+    """
+
+    def __init__(self, master, columnas=("x", "f(x)"), formato=formatear_valor, **kwargs):
+        super().__init__(master, **kwargs)
+        self.columnas = list(columnas)
+        self.formato = formato
+        self._datos = [np.empty(0) for _ in self.columnas]
+        self._primera = 0
+        self._filas = []  # items reutilizables: (rectangulo, [textos])
+
+        ancho = ANCHO_COLUMNA * (len(self.columnas) + 1)
+        self.encabezado = tk.Canvas(self, height=ALTO_FILA, width=ancho, bg=COLOR_ENCABEZADO, highlightthickness=0)
+        self.encabezado.grid(row=0, column=0, sticky="ew")
+        for j, titulo in enumerate(["#"] + self.columnas):
+            self.encabezado.create_text(j * ANCHO_COLUMNA + 8, ALTO_FILA // 2, text=titulo, anchor="w",
+                                        font=(FUENTE[0], FUENTE[1], "bold"), fill=COLOR_TEXTO)
+
+        self.canvas = tk.Canvas(self, width=ancho, bg=COLOR_FONDO[0], highlightthickness=0)
+        self.canvas.grid(row=1, column=0, sticky="nsew")
+        self.barra = tk.Scrollbar(self, orient="vertical", command=self._al_desplazar)
+        self.barra.grid(row=1, column=1, sticky="ns")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda _e: self._dibujar())
+        # rueda del mouse (Windows/macOS y Linux)
+        self.canvas.bind("<MouseWheel>", lambda e: self.desplazar(-3 if e.delta > 0 else 3))
+        self.canvas.bind("<Button-4>", lambda _e: self.desplazar(-3))
+        self.canvas.bind("<Button-5>", lambda _e: self.desplazar(3))
+
+    def __len__(self):
+        return len(self._datos[0])
+
+    def cargar(self, *arreglos):
+        """Reemplaza los datos (un arreglo por columna, todos del mismo largo)."""
+        if len(arreglos) != len(self.columnas):
+            raise ValueError(f"Se esperaban {len(self.columnas)} columnas, llegaron {len(arreglos)}")
+        largos = {len(a) for a in arreglos}
+        if len(largos) > 1:
+            raise ValueError("Todas las columnas deben tener el mismo largo")
+        self._datos = [np.asarray(a, dtype=np.float64) for a in arreglos]
+        self._primera = 0
+        self._dibujar()
+
+    def _visibles(self) -> int:
+        return max(self.canvas.winfo_height() // ALTO_FILA, 1)
+
+    def desplazar(self, filas: int):
+        self.ir_a(self._primera + filas)
+
+    def ir_a(self, fila: int):
+        """Deja `fila` como la primera visible."""
+        maximo = max(len(self) - self._visibles(), 0)
+        self._primera = int(min(max(fila, 0), maximo))
+        self._dibujar()
+
+    def _al_desplazar(self, accion, cantidad, unidad=None):
+        # protocolo de tk.Scrollbar: ("moveto", fraccion) o ("scroll", n, "units"/"pages")
+        if accion == "moveto":
+            self.ir_a(round(float(cantidad) * len(self)))
+        elif accion == "scroll":
+            paso = self._visibles() if unidad == "pages" else 1
+            self.desplazar(int(cantidad) * paso)
+
+    def _asegurar_items(self, visibles: int):
+        ancho = ANCHO_COLUMNA * (len(self.columnas) + 1)
+        while len(self._filas) < visibles:
+            i = len(self._filas)
+            y = i * ALTO_FILA
+            rect = self.canvas.create_rectangle(0, y, ancho, y + ALTO_FILA, width=0, fill=COLOR_FONDO[i % 2])
+            textos = [self.canvas.create_text(j * ANCHO_COLUMNA + 8, y + ALTO_FILA // 2, anchor="w",
+                                              font=FUENTE, fill=COLOR_TEXTO)
+                      for j in range(len(self.columnas) + 1)]
+            self._filas.append((rect, textos))
+
+    def _dibujar(self):
+        total = len(self)
+        visibles = self._visibles()
+        self._asegurar_items(visibles)
+
+        hasta = min(self._primera + visibles, total)
+        bloque = [col[self._primera:hasta] for col in self._datos]
+        for i, (rect, textos) in enumerate(self._filas):
+            fila = self._primera + i
+            if fila >= hasta:
+                self.canvas.itemconfigure(rect, state="hidden")
+                for t in textos:
+                    self.canvas.itemconfigure(t, state="hidden")
+                continue
+            # el color va por número de fila, asi no "salta" al desplazarse
+            self.canvas.itemconfigure(rect, state="normal", fill=COLOR_FONDO[fila % 2])
+            self.canvas.itemconfigure(textos[0], state="normal", text=str(fila + 1))
+            for j, col in enumerate(bloque):
+                self.canvas.itemconfigure(textos[j + 1], state="normal", text=self.formato(float(col[i])))
+
+        if total:
+            self.barra.set(self._primera / total, hasta / total)
+        else:
+            self.barra.set(0, 1)
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# las pruebas nunca abren ventanas
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# mismo esquema de imports que el resto del proyecto: domain.*, graphics.*, service.*
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -0,0 +1,49 @@
+import pytest
+import sympy
+
+from domain.asintotas import _asintotas, _limite, asintotas, x
+from domain.tiempo import limite_de_tiempo, TiempoAgotado
+
+
+def test_racional():
+    resultado = asintotas((x ** 2 + 1) / (x - 2))
+    assert resultado.verticales_en((-10, 10)) == [2.0]
+    assert resultado.rectas() == [(1.0, 2.0)]
+
+
+def test_polinomio_sin_asintotas():
+    resultado = asintotas(2 * x + 1)
+    assert resultado.rectas() == []
+    assert resultado.verticales_en((-10, 10)) == []
+
+
+def test_tan_verticales_en_rango():
+    resultado = asintotas(sympy.tan(x))
+    verticales = resultado.verticales_en((-4, 4))
+    assert len(verticales) == 2
+    assert verticales == pytest.approx([-sympy.pi.evalf() / 2, sympy.pi.evalf() / 2])
+
+
+def test_hueco_no_es_vertical():
+    resultado = asintotas(sympy.sin(x) / x)
+    assert resultado.verticales_en((-5, 5)) == []
+    assert resultado.singularidades_en((-5, 5)) == [0.0]
+    assert resultado.rectas() == [(0.0, 0.0)]
+
+
+def test_sin_tiempo_no_queda_en_cache():
+    expr = sympy.exp(x) * sympy.sin(x) / (x ** 3 - sympy.log(x + 7))
+    _asintotas.cache_clear()
+    _limite.cache_clear()
+    parcial = asintotas(expr, presupuesto=1e-6)
+    assert None in (parcial.verticales, parcial.mas_infinito, parcial.menos_infinito)
+    assert _asintotas.cache_info().currsize == 0
+
+
+def test_limite_de_afuera_se_propaga():
+    _asintotas.cache_clear()
+    _limite.cache_clear()
+    with pytest.raises(TiempoAgotado):
+        with limite_de_tiempo(1e-3):
+            asintotas(sympy.exp(x) * sympy.sin(x) / (x ** 3 - sympy.log(x + 7)), presupuesto=5)
+    assert _asintotas.cache_info().currsize == 0
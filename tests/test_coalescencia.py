@@ -0,0 +1,65 @@
+import threading
+import time
+
+import pytest
+
+from domain.coalescencia import VueloUnico
+
+
+def _en_paralelo(cantidad, funcion):
+    resultados = [None] * cantidad
+    errores = [None] * cantidad
+    barrera = threading.Barrier(cantidad)
+
+    def correr(i):
+        barrera.wait()
+        try:
+            resultados[i] = funcion()
+        except Exception as e:
+            errores[i] = e
+
+    hilos = [threading.Thread(target=correr, args=(i,)) for i in range(cantidad)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    return resultados, errores
+
+
+def test_llamadas_iguales_corren_una_vez():
+    vuelo = VueloUnico("prueba")
+    ejecuciones = []
+
+    def lento():
+        ejecuciones.append(1)
+        time.sleep(0.2)
+        return 42
+
+    resultados, _ = _en_paralelo(8, lambda: vuelo.ejecutar("clave", lento))
+    assert resultados == [42] * 8
+    assert len(ejecuciones) == 1
+    estadisticas = vuelo.estadisticas()
+    assert estadisticas["ejecuciones"] == 1
+    assert estadisticas["compartidas"] == 7
+    assert estadisticas["en_curso"] == 0
+
+
+def test_la_excepcion_se_comparte():
+    vuelo = VueloUnico("prueba")
+
+    def falla():
+        time.sleep(0.2)
+        raise ValueError("mal")
+
+    _, errores = _en_paralelo(4, lambda: vuelo.ejecutar("clave", falla))
+    assert all(isinstance(e, ValueError) for e in errores)
+    assert vuelo.estadisticas()["ejecuciones"] == 1
+
+
+def test_no_es_un_cache():
+    vuelo = VueloUnico("prueba")
+    assert vuelo.ejecutar("clave", lambda: 1) == 1
+    assert vuelo.ejecutar("clave", lambda: 2) == 2
+    with pytest.raises(KeyError):
+        vuelo.ejecutar("otra", lambda: {}["nada"])
+    assert vuelo.estadisticas()["en_curso"] == 0
@@ -0,0 +1,46 @@
+import pytest
+
+from domain.complejidad import LIMITES_POR_DEFECTO, LimitesComplejidad, SIN_LIMITES
+
+
+@pytest.mark.parametrize("texto", [
+    "x**(100*100*100)",
+    "(x+1)**(10*10*10*10)",
+    "x**(10**10**10)",
+    "x**2000",
+    "x**-(100*100)",
+    "x**(999+2)",
+    "x**(2 pi 1000)",
+    "x**exp(10)",
+])
+def test_exponentes_grandes(texto):
+    exceso = LIMITES_POR_DEFECTO.verificar(texto)
+    assert exceso is not None and exceso.medida == "max_exponente"
+
+
+@pytest.mark.parametrize("texto", [
+    "x**2 + 3*x",
+    "x**(1/2)",
+    "x**(10*10)",
+    "x**n",
+    "x**(x*1000000)",
+    "2**x",
+    "x**(1/0)",
+    "sin(x)**(2)",
+])
+def test_exponentes_permitidos(texto):
+    assert LIMITES_POR_DEFECTO.verificar(texto) is None
+
+
+def test_otros_limites():
+    assert LIMITES_POR_DEFECTO.verificar("x" * 3000).medida == "max_largo"
+    assert LIMITES_POR_DEFECTO.verificar("(" * 60 + "x" + ")" * 60).medida == "max_profundidad"
+    assert LIMITES_POR_DEFECTO.verificar("+".join(["x"] * 1000)).medida == "max_nodos"
+    sin_nodos = LimitesComplejidad(max_nodos=None)
+    assert sin_nodos.verificar("+".join(["x"] * 600)).medida == "max_operaciones"
+    assert LIMITES_POR_DEFECTO.verificar("1" * 600).medida == "max_digitos"
+    assert LimitesComplejidad(max_exponente=10).verificar("x**11").limite == 10
+
+
+def test_sin_limites():
+    assert SIN_LIMITES.verificar("x**(10**10**10)") is None
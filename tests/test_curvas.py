@@ -0,0 +1,119 @@
+import math
+
+import numpy as np
+import pytest
+
+from graphics.curvas import (_TROZOS, contorno_implicito, contorno_implicito_desde_texto, marching_squares,
+                             muestrear_parametrica, muestrear_parametrica_desde_texto, separar_implicita,
+                             separar_parametrica)
+
+
+# Marching squares
+
+def test_tabla_cada_caso_cruza_los_lados_con_cambio_de_signo():
+    # esquinas de cada lado (0 abajo, 1 derecha, 2 arriba, 3 izquierda) como bits del caso
+    esquinas = {0: (1, 2), 1: (2, 4), 2: (8, 4), 3: (1, 8)}
+    for caso in range(16):
+        cambian = {lado for lado, (p, q) in esquinas.items() if bool(caso & p) != bool(caso & q)}
+        usados = [lado for trozo in _TROZOS[caso] for lado in trozo if lado >= 0]
+        assert sorted(usados) == sorted(cambian), caso
+
+
+def test_una_celda_interpola_el_cruce():
+    # F = x - 0.25 en la celda [0, 1]^2: la recta x = 0.25
+    xs = np.array([0.0, 1.0])
+    ys = np.array([0.0, 1.0])
+    valores = np.array([[-0.25, 0.75], [-0.25, 0.75]])
+    trozos = marching_squares(xs, ys, valores)
+    assert trozos.shape == (1, 2, 2)
+    assert np.allclose(sorted(trozos[0][:, 1]), [0.0, 1.0])
+    assert np.allclose(trozos[0][:, 0], 0.25)
+
+
+def test_silla_depende_del_centro():
+    xs = ys = np.array([0.0, 1.0])
+    # caso 5: abajo-izquierda y arriba-derecha positivas
+    centro_negativo = marching_squares(xs, ys, np.array([[1.0, -2.0], [-2.0, 1.0]]))
+    centro_positivo = marching_squares(xs, ys, np.array([[2.0, -1.0], [-1.0, 2.0]]))
+    assert len(centro_negativo) == len(centro_positivo) == 2
+
+    def lados(trozos):
+        return sorted(tuple(sorted((round(p[0], 6), round(p[1], 6)) for p in t)) for t in trozos)
+
+    assert lados(centro_negativo) != lados(centro_positivo)
+
+
+def test_celdas_con_nan_se_saltan():
+    xs = ys = np.array([0.0, 1.0, 2.0])
+    valores = np.array([[-1.0, 1.0, np.nan], [-1.0, 1.0, 1.0], [-1.0, 1.0, 1.0]])
+    trozos = marching_squares(xs, ys, valores)
+    assert len(trozos) == 2
+    assert np.all(trozos[:, :, 0] <= 1.0)
+
+
+def test_circulo_por_franjas_igual_que_de_una_vez():
+    def F(x, y):
+        return x ** 2 + y ** 2 - 25
+
+    entero = contorno_implicito(F, (-10, 10), (-10, 10), 200)
+    franjas = contorno_implicito(F, (-10, 10), (-10, 10), 200, tam_bloque=1000)
+    assert len(entero) == len(franjas)
+    radios = np.hypot(franjas[:, :, 0], franjas[:, :, 1])
+    assert np.allclose(radios, 5, atol=0.01)
+
+
+def test_polo_no_se_dibuja_como_curva():
+    # y = 1/x: F cambia de signo al cruzar x = 0 sin pasar por cero
+    trozos = contorno_implicito_desde_texto("y = 1/x", (-5, 5), (-5, 5), 100)
+    assert len(trozos)
+    producto = trozos[:, :, 0] * trozos[:, :, 1]
+    assert np.allclose(producto, 1, atol=0.1)
+
+
+def test_separar_implicita():
+    assert separar_implicita("x^2 + y^2 = 1") == "(x^2 + y^2) - (1)"
+    assert separar_implicita("x - y") == "x - y"
+    with pytest.raises(ValueError):
+        separar_implicita("x = y = 1")
+
+
+# Paramétricas
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("(cos(t), sin(t))", ("cos(t)", "sin(t)")),
+    ("cos(t), sin(2*t)", ("cos(t)", "sin(2*t)")),
+    ("(t)*2, t", ("(t)*2", "t")),
+    ("(max(t, 1), t)", ("max(t, 1)", "t")),
+    ("(t, t, t)", None),
+    ("t", None),
+])
+def test_separar_parametrica(texto, esperado):
+    assert separar_parametrica(texto) == esperado
+
+
+def test_circulo_refinado_queda_cerca_de_la_curva():
+    curva = muestrear_parametrica(np.cos, np.sin, (0, 2 * math.pi), puntos=20)
+    assert curva.cantidad_segmentos == 1
+    assert np.allclose(np.hypot(curva.x, curva.y), 1)
+    # los tramos terminan cortos aunque la grilla inicial sea gruesa
+    assert np.max(np.hypot(np.diff(curva.x), np.diff(curva.y))) < 0.05
+    assert np.all(np.diff(curva.t) > 0)
+
+
+def test_saltos_cortan_la_curva():
+    with np.errstate(all="ignore"):
+        curva = muestrear_parametrica(lambda t: t, np.tan, (-5, 5), rango_y=(-10, 10))
+    # tan tiene polos en ±π/2 y ±3π/2 dentro de (-5, 5)
+    assert curva.cantidad_segmentos == 5
+
+
+def test_tope_de_puntos():
+    curva = muestrear_parametrica(lambda t: t * np.cos(t), lambda t: t * np.sin(t), (0, 200), max_puntos=5000)
+    assert len(curva) <= 5000
+
+
+def test_parametrica_desde_texto():
+    curva = muestrear_parametrica_desde_texto("cos(t)^3", "sin(t)^3", (0, 2 * math.pi))
+    assert np.allclose(np.abs(curva.x) ** (2 / 3) + np.abs(curva.y) ** (2 / 3), 1)
+    with pytest.raises(ValueError):
+        muestrear_parametrica_desde_texto("cos(t", "t", (0, 1))
@@ -0,0 +1,43 @@
+import pytest
+import sympy
+
+from domain.dominio import _continuous_domain, _dominio_sub, _resolver, dominio_funcion, DominioNoCalculable, x
+from domain.tiempo import limite_de_tiempo, TiempoAgotado
+
+
+@pytest.mark.parametrize("expr, esperado", [
+    (sympy.log(x), sympy.Interval.open(0, sympy.oo)),
+    (sympy.sqrt(x - 1), sympy.Interval(1, sympy.oo)),
+    (1 / (x ** 2 - 1), sympy.Complement(sympy.S.Reals, sympy.FiniteSet(-1, 1))),
+    (sympy.asin(x), sympy.Interval(-1, 1)),
+    (sympy.sin(x) + x ** 2, sympy.S.Reals),
+])
+def test_reglas(expr, esperado):
+    assert dominio_funcion(expr) == esperado
+
+
+def test_sqrt_de_log():
+    assert dominio_funcion(sympy.sqrt(sympy.log(x))) == sympy.Interval(1, sympy.oo)
+
+
+def _limpiar():
+    for funcion in (_resolver, _dominio_sub, _continuous_domain):
+        funcion.cache_clear()
+
+
+def test_sin_tiempo_no_queda_en_cache():
+    _limpiar()
+    with pytest.raises(DominioNoCalculable):
+        dominio_funcion(sympy.log(sympy.sin(x) + x / 3), presupuesto=1e-6)
+    assert _resolver.cache_info().currsize == 0
+    assert _continuous_domain.cache_info().currsize == 0
+
+
+def test_limite_de_afuera_no_queda_en_cache():
+    _limpiar()
+    with pytest.raises((TiempoAgotado, DominioNoCalculable)):
+        with limite_de_tiempo(1e-3):
+            dominio_funcion(sympy.log(sympy.sin(x) + x / 3), presupuesto=5)
+    assert _resolver.cache_info().currsize == 0
+    assert _continuous_domain.cache_info().currsize == 0
+    assert dominio_funcion(sympy.log(x)) == sympy.Interval.open(0, sympy.oo)
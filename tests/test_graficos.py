@@ -0,0 +1,42 @@
+import matplotlib.pyplot as plt
+import pytest
+
+from domain.parser import parse_function
+from graphics.graficos import evaluar_funcion_en_punto, graficar_superpuestas, renderizar_png
+
+
+@pytest.fixture(autouse=True)
+def cerrar_figuras():
+    yield
+    plt.close("all")
+
+
+@pytest.mark.parametrize("paralelo", ["hilos", "procesos"])
+def test_superpuestas(paralelo):
+    ok, mensaje, resultados = graficar_superpuestas(["sin(x)", "1/x", "x^2"], rango_x=(-3, 3), paralelo=paralelo)
+    assert ok, mensaje
+    assert [r.is_valid for r in resultados] == [True, True, True]
+    # una sola figura con una curva (al menos un segmento) por expresión
+    ax = plt.gcf().axes[0]
+    assert {linea.get_label() for linea in ax.get_lines()} >= {"f1(x) = sin(x)", "f2(x) = 1/x", "f3(x) = x^2"}
+
+
+def test_superpuestas_con_error():
+    ok, mensaje, resultados = graficar_superpuestas(["x", "sin("])
+    assert not ok
+    assert "sin(" in mensaje
+    assert not resultados[1].is_valid
+    assert graficar_superpuestas(["", "  "])[0] is False
+
+
+def test_evaluar_en_punto():
+    ok, y, _ = evaluar_funcion_en_punto("x^2 + 1", 2)
+    assert ok and float(y) == 5
+    ok, _, _ = evaluar_funcion_en_punto("(x^2 - 1)/(x - 1)", 1)
+    assert not ok
+
+
+def test_renderizar_png_con_punto():
+    resultado = parse_function("x^2", allowed_vars=["x"])
+    png, _ = renderizar_png(resultado, "x^2", (-2, 2), None, 200, 150, 50, punto_evaluado=(1.0, 1.0))
+    assert png.startswith(b"\x89PNG")
@@ -0,0 +1,70 @@
+import numpy as np
+
+from graphics.muestreo import MuestrasCurva, diezmar_minmax, muestrear
+
+
+def _por_columna(x, y, columnas, rango_x):
+    columna = np.clip(((x - rango_x[0]) / (rango_x[1] - rango_x[0]) * columnas).astype(int), -1, columnas)
+    return {c: (np.nanmin(y[columna == c]), np.nanmax(y[columna == c])) for c in np.unique(columna)}
+
+
+def test_diezmar_pocos_puntos_no_cambia():
+    x = np.linspace(0, 1, 10)
+    y = x ** 2
+    dx, dy = diezmar_minmax(x, y, columnas=100)
+    assert dx is x or np.array_equal(dx, x)
+    assert np.array_equal(dy, y)
+
+
+def test_diezmar_conserva_min_y_max_de_cada_columna():
+    x = np.linspace(0, 10, 100_001)
+    y = np.sin(40 * x) + 0.01 * x
+    dx, dy = diezmar_minmax(x, y, columnas=200)
+    assert len(dx) <= 4 * 200 + 1
+    assert np.all(np.diff(dx) >= 0)
+    original = _por_columna(x, y, 200, (0, 10))
+    reducida = _por_columna(dx, dy, 200, (0, 10))
+    assert original.keys() == reducida.keys()
+    for columna, (minimo, maximo) in original.items():
+        assert reducida[columna] == (minimo, maximo)
+
+
+def test_diezmar_mantiene_los_huecos():
+    x = np.linspace(-1, 1, 20_001)
+    with np.errstate(divide="ignore"):
+        y = 1 / x
+    y[np.abs(x) < 0.1] = np.nan
+    dx, dy = diezmar_minmax(x, y, columnas=50)
+    huecos = np.flatnonzero(np.isnan(dy))
+    assert len(huecos) == 1
+    # el NaN queda entre los dos bordes del hueco
+    assert dx[huecos[0] - 1] < -0.09 and dx[huecos[0] + 1] > 0.09
+
+
+def test_diezmar_sin_valores_validos():
+    dx, dy = diezmar_minmax(np.linspace(0, 1, 1000), np.full(1000, np.nan), columnas=10)
+    assert len(dx) == len(dy) == 0
+
+
+def test_muestrear_un_segmento_por_intervalo():
+    curva = muestrear(np.sin, (-5, 5), intervalos=[(-5, -1), (1, 5)], puntos=100, vectorizada=True)
+    assert isinstance(curva, MuestrasCurva)
+    assert curva.cantidad_segmentos == 2
+    assert len(curva) == 2 * 101
+    (x1, y1), (x2, y2) = curva.segmentos()
+    assert x1[0] == -5 and x1[-1] == -1 and x2[0] == 1 and x2[-1] == 5
+    assert np.allclose(y1, np.sin(x1))
+
+
+def test_muestrear_nan_donde_no_esta_definida():
+    with np.errstate(invalid="ignore"):
+        curva = muestrear(np.sqrt, (-1, 1), puntos=200, vectorizada=True)
+    assert np.all(np.isnan(curva.y[curva.x < 0]))
+    assert np.all(np.isfinite(curva.y[curva.x >= 0]))
+
+
+def test_diezmar_curva_mantiene_segmentos():
+    curva = muestrear(np.cos, (0, 10), intervalos=[(0, 4), (6, 10)], puntos=50_000, vectorizada=True)
+    reducida = curva.diezmar(100, (0, 10))
+    assert reducida.cantidad_segmentos == 2
+    assert len(reducida) < len(curva) / 10
@@ -0,0 +1,22 @@
+from domain.parser import ComplexityError, parse_function, parse_many
+
+
+def test_parse_many_mismo_orden_y_tipo_de_error():
+    lote = parse_many(["x**2", "sin(", "x**(10**10**10)", "x**2"], procesos=1)
+    assert [r.is_valid for r in lote] == [True, False, False, True]
+    assert lote[2].tipo_error is ComplexityError
+    assert lote[0].tipo_error is None
+    assert lote.estadisticas["unicas"] == 3
+    assert lote.estadisticas["tiempos_agotados"] == 0
+
+
+def test_parse_many_usa_la_cache():
+    parse_many(["cos(x) + 1"], procesos=1)
+    lote = parse_many(["cos(x) + 1"], procesos=1)
+    assert lote.estadisticas["desde_cache"] == 1
+
+
+def test_complejidad_al_parsear():
+    resultado = parse_function("x**(100*100*100)")
+    assert not resultado.is_valid
+    assert resultado.tipo_error is ComplexityError
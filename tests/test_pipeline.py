@@ -0,0 +1,68 @@
+import pytest
+
+from graphics.pipeline import Etapa, Pipeline, pipeline_grafico
+
+
+def _entradas(**cambios):
+    entradas = dict(expr_str="(x^2 - 1)/(x - 1)", rango_x=(-5, 5), rango_y=None, x_punto=None,
+                    puntos=400, ancho_px=200, alto_px=150, dpi=50)
+    entradas.update(cambios)
+    return entradas
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    pipeline = pipeline_grafico()
+    pipeline.calcular(["png"], **_entradas())
+    return pipeline
+
+
+def test_primera_vez_corren_todas():
+    pipeline = pipeline_grafico()
+    valores = pipeline.calcular(["png"], **_entradas())
+    assert set(pipeline.ultimas_etapas) == {"parse", "funcion", "asintotas", "discontinuidades",
+                                            "muestras", "punto", "png"}
+    assert valores["png"].startswith(b"\x89PNG")
+
+
+def test_mismo_pedido_no_corre_nada(pipeline):
+    pipeline.calcular(["png"], **_entradas())
+    assert pipeline.ultimas_etapas == []
+
+
+def test_rango_y_solo_redibuja(pipeline):
+    pipeline.calcular(["png"], **_entradas(rango_y=(-2, 2)))
+    assert pipeline.ultimas_etapas == ["png"]
+
+
+def test_rango_x_no_vuelve_a_parsear(pipeline):
+    pipeline.calcular(["png"], **_entradas(rango_x=(-3, 3)))
+    assert pipeline.ultimas_etapas == ["discontinuidades", "muestras", "png"]
+
+
+def test_x_punto_solo_evalua_y_redibuja(pipeline):
+    valores = pipeline.calcular(["png"], **_entradas(x_punto=2.0))
+    assert pipeline.ultimas_etapas == ["punto", "png"]
+    assert valores["punto"] == (2.0, 3.0)
+
+
+def test_punto_fuera_del_dominio(pipeline):
+    # sin simplificar: (x^2 - 1)/(x - 1) no está definida en 1
+    valores = pipeline.calcular(["punto"], **_entradas(x_punto=1.0))
+    assert valores["punto"] is None
+
+
+def test_error_de_parseo():
+    pipeline = pipeline_grafico()
+    with pytest.raises(ValueError):
+        pipeline.calcular(["png"], **_entradas(expr_str="sin("))
+
+
+def test_memoria_por_etapa():
+    llamadas = []
+    etapas = {"doble": Etapa(lambda n: llamadas.append(n) or 2 * n, (), ("n",))}
+    pipeline = Pipeline(etapas, memoria=2)
+    for n in (1, 2, 1, 3, 2):
+        assert pipeline.calcular(["doble"], n=n)["doble"] == 2 * n
+    # 2 salió de la memoria al entrar 3 (1 se había usado después)
+    assert llamadas == [1, 2, 3, 2]
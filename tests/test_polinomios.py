@@ -0,0 +1,52 @@
+import numpy as np
+import sympy
+
+from domain.polinomios import detectar_racional, horner, x
+
+
+def test_horner_igual_que_polyval():
+    coeficientes = np.array([2.0, -3.0, 0.0, 5.0])
+    xs = np.linspace(-3, 3, 13)
+    assert np.allclose(horner(coeficientes, xs), np.polyval(coeficientes, xs))
+
+
+def test_evaluar_racional_nan_en_los_polos():
+    racional = detectar_racional(1 / (x ** 2 - 4))
+    valores = racional.evaluar([-2.0, 0.0, 2.0])
+    assert np.isnan(valores[0]) and np.isnan(valores[2])
+    assert valores[1] == -0.25
+
+
+def test_no_racional_o_coeficientes_irracionales():
+    assert detectar_racional(sympy.sin(x)) is None
+    assert detectar_racional(sympy.sqrt(2) * x) is None
+    assert detectar_racional(x * sympy.Symbol('y')) is None
+
+
+def test_expandida():
+    assert detectar_racional(x ** 2 - 2 * x + 1).expandida
+    factorizada = detectar_racional((x - 1) ** 10)
+    assert not factorizada.expandida
+    assert factorizada.ceros() == [1]
+
+
+def test_polos_ceros_y_huecos():
+    racional = detectar_racional((x ** 2 - 1) / (x - 1))
+    assert racional.polos() == [1]
+    assert racional.ceros() == [-1]
+    assert racional.asintotas_verticales() == []
+    assert racional.dominio() == sympy.Complement(sympy.S.Reals, sympy.FiniteSet(1))
+
+
+def test_polinomios_no_tienen_asintota_en_infinito():
+    for expr in (2 * x + 1, sympy.Integer(3) + 0 * x, x ** 3, (x ** 2 - 1) / (x - 1)):
+        racional = detectar_racional(sympy.sympify(expr))
+        if racional is not None:
+            assert racional.asintota_infinito() is None, expr
+
+
+def test_asintota_horizontal_y_oblicua():
+    assert detectar_racional(1 / x).asintota_infinito() == ("horizontal", 0)
+    assert detectar_racional((2 * x + 1) / (x - 3)).asintota_infinito() == ("horizontal", 2)
+    assert detectar_racional((x ** 2 + 1) / x).asintota_infinito() == ("oblicua", 1, 0)
+    assert detectar_racional(x ** 3 / (x + 1)).asintota_infinito() is None
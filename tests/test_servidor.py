@@ -0,0 +1,60 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from service.servidor import crear_servidor, ERROR_DEMASIADO_COMPLEJA, ERROR_METODO_NO_EXISTE, ERROR_SERVIDOR_OCUPADO
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    servidor = crear_servidor(puerto=0, procesos=1, timeout=5.0, cola=0)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    yield servidor
+    servidor.shutdown()
+    servidor.server_close()
+    servidor.servicio.cerrar()
+
+
+def _post(servidor, metodo, params):
+    cuerpo = json.dumps({"jsonrpc": "2.0", "id": 1, "method": metodo, "params": params}).encode()
+    pedido = urllib.request.Request(f"http://127.0.0.1:{servidor.server_address[1]}/", data=cuerpo,
+                                    headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(pedido, timeout=30) as respuesta:
+            return respuesta.status, json.loads(respuesta.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_parse(servidor):
+    estado, cuerpo = _post(servidor, "parse", {"expr": "x^2 + 1"})
+    assert estado == 200
+    assert cuerpo["result"]["expr"] == "x**2 + 1"
+
+
+def test_ocupado_responde_503(servidor):
+    cupos = servidor.servicio._cupos
+    # cola=0 y un proceso: un solo cupo
+    assert cupos.acquire(blocking=False)
+    try:
+        estado, cuerpo = _post(servidor, "parse", {"expr": "x"})
+    finally:
+        cupos.release()
+    assert estado == 503
+    assert cuerpo["error"]["code"] == ERROR_SERVIDOR_OCUPADO
+
+    estado, _ = _post(servidor, "parse", {"expr": "x"})
+    assert estado == 200
+
+
+def test_errores_jsonrpc(servidor):
+    estado, cuerpo = _post(servidor, "no_existe", {})
+    assert estado == 200
+    assert cuerpo["error"]["code"] == ERROR_METODO_NO_EXISTE
+
+    _, cuerpo = _post(servidor, "parse", {"expr": "x**(10**10**10)"})
+    assert cuerpo["error"]["code"] == ERROR_DEMASIADO_COMPLEJA
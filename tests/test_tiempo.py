@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from domain import tiempo
+from domain.tiempo import limite_de_tiempo, TiempoAgotado
+
+
+def _esperar(segundos):
+    fin = time.monotonic() + segundos
+    while time.monotonic() < fin:
+        pass
+
+
+def test_corta_el_bloque():
+    with pytest.raises(TiempoAgotado):
+        with limite_de_tiempo(0.05):
+            _esperar(1)
+
+
+def test_interno_no_alarga_al_externo():
+    inicio = time.monotonic()
+    with pytest.raises(TiempoAgotado):
+        with limite_de_tiempo(0.05):
+            with limite_de_tiempo(5):
+                _esperar(1)
+    assert time.monotonic() - inicio < 0.5
+
+
+def test_externo_tragado_igual_salta():
+    with pytest.raises(TiempoAgotado):
+        with limite_de_tiempo(0.05):
+            try:
+                _esperar(1)
+            except TiempoAgotado:
+                pass
+            # un límite que se abre después salta enseguida
+            with pytest.raises(TiempoAgotado):
+                with limite_de_tiempo(5):
+                    pass
+
+
+def test_sin_limite():
+    with limite_de_tiempo(None):
+        _esperar(0.01)
+
+
+def test_alarmas_al_armar_y_desarmar_no_dejan_plazos():
+    # la alarma de afuera puede llegar justo mientras el de adentro arma o desarma la suya
+    for _ in range(200):
+        try:
+            with limite_de_tiempo(1e-5):
+                while True:
+                    with limite_de_tiempo(5):
+                        pass
+        except TiempoAgotado:
+            pass
+    assert tiempo._plazos == []
+    with limite_de_tiempo(1):
+        pass